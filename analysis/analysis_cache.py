@@ -0,0 +1,96 @@
+"""
+Analysis Cache - Per-scene analysis results, reused until the scene changes
+
+Results are keyed by (scene id, content hash, analyzer, language, analyzer
+version). Analysing the manuscript again after editing one scene only
+re-analyses that scene; the other scenes' partial results are merged as
+they are.
+"""
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class AnalysisCache:
+    """
+    Cache of per-scene analysis results
+
+    Only the latest result of each (scene, analyzer, language, version) is
+    kept: storing the result of a new content replaces the old one, so the
+    cache never holds more than one entry per scene and analyzer.
+    Safe to use from the analysis thread.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache"""
+        # (scene id, analyzer, language, version) -> (content hash, result)
+        self._entries: Dict[Tuple[str, str, str, int], Tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scene_id: str, content_hash: str, analyzer: str, language: str,
+            version: int) -> Optional[Any]:
+        """
+        Get the result of a scene analysis
+
+        Args:
+            scene_id: Scene ID
+            content_hash: Hash of the analysed content
+            analyzer: Analyzer name ('style', 'repetitions', ...)
+            language: Analysis language
+            version: Analyzer version
+
+        Returns:
+            Result stored for this exact content, or None
+        """
+        with self._lock:
+            entry = self._entries.get((scene_id, analyzer, language, version))
+        if entry is None or entry[0] != content_hash:
+            return None
+        return entry[1]
+
+    def put(self, scene_id: str, content_hash: str, analyzer: str, language: str,
+            version: int, result: Any):
+        """Store the result of a scene analysis (replaces older contents)"""
+        with self._lock:
+            self._entries[(scene_id, analyzer, language, version)] = (content_hash, result)
+
+    def analyze_scenes(self, scenes: Iterable[Tuple[str, str, str]], analyzer: str, language: str,
+                       version: int, analyze: Callable[[str], Optional[Any]]) -> Tuple[List[Any], int]:
+        """
+        Get the result of every scene, analysing only the scenes not cached
+
+        Args:
+            scenes: (scene id, content hash, text) of each scene
+            analyzer: Analyzer name
+            language: Analysis language
+            version: Analyzer version
+            analyze: Callable analysing a text (None results are not cached)
+
+        Returns:
+            Tuple[List[Any], int]: (results in scene order, scenes analysed)
+        """
+        results = []
+        analysed = 0
+        for scene_id, content_hash, text in scenes:
+            result = self.get(scene_id, content_hash, analyzer, language, version)
+            if result is None:
+                result = analyze(text)
+                analysed += 1
+                if result is None:
+                    continue
+                self.put(scene_id, content_hash, analyzer, language, version, result)
+            results.append(result)
+        return results, analysed
+
+    def remove_scene(self, scene_id: str):
+        """Drop the results of a scene (e.g. deleted)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == scene_id]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all results (e.g. another project was opened)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
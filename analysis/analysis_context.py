@@ -0,0 +1,86 @@
+"""
+Analysis Context - Parse a text once, share the spaCy Doc between analyzers
+
+Style and repetition analysis (and any future spaCy-based analyzer) of
+the same text need the same parse. The analysis_context singleton keeps
+the last parsed Docs in a small LRU keyed by (language, content hash),
+so running several analyses on a scene parses it only once.
+"""
+import hashlib
+import threading
+from analysis.nlp_manager import nlp_manager
+from analysis.spelling_service import LRUCache
+from utils.logger import AppLogger
+
+
+class AnalysisContext:
+    """
+    Singleton cache of parsed spaCy Docs
+
+    Docs are large (every token with its lemma, tags and vectors), so only
+    DOC_CACHE_SIZE of them are kept; the least recently used is dropped.
+    Models come from nlp_manager, so each language is loaded once.
+    """
+
+    _instance = None
+
+    DOC_CACHE_SIZE = 4
+
+    def __new__(cls):
+        """Implement Singleton pattern"""
+        if cls._instance is None:
+            cls._instance = super(AnalysisContext, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the context (only once)"""
+        if self._initialized:
+            return
+
+        self._docs = LRUCache(self.DOC_CACHE_SIZE)
+        self._lock = threading.Lock()
+        self.parse_count = 0
+        self._initialized = True
+
+    @staticmethod
+    def get_content_hash(text: str) -> str:
+        """Get the hash identifying a text in the cache"""
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def get_doc(self, text: str, language: str):
+        """
+        Get the parsed Doc of a text (parsed on the first request)
+
+        Args:
+            text: Text to parse
+            language: Language code ('it', 'en', ...)
+
+        Returns:
+            spacy.tokens.Doc or None if no model is available for the language
+        """
+        key = (language, self.get_content_hash(text))
+        with self._lock:
+            doc = self._docs.get(key)
+        if doc is not None:
+            return doc
+
+        nlp = nlp_manager.get_spacy_model(language)
+        if nlp is None:
+            return None
+
+        doc = nlp(text)
+        with self._lock:
+            self._docs.put(key, doc)
+            self.parse_count += 1
+        AppLogger.debug(f"Parsed text of {len(text)} characters ({language})")
+        return doc
+
+    def clear(self):
+        """Drop all cached Docs"""
+        with self._lock:
+            self._docs.clear()
+
+
+# Global singleton instance
+analysis_context = AnalysisContext()
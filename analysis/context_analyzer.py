@@ -122,6 +122,21 @@ class ContextAnalyzer:
                 'success': False
             }
 
+    def analyze_word_count_summary(self, project: Project, summary: Dict,
+                                   character_count: int) -> Dict:
+        """
+        Analyze project health from a manuscript word count summary
+
+        Args:
+            project: Project instance
+            summary: Result of ManuscriptStructureManager.word_count_summary()
+            character_count: Number of characters defined
+
+        Returns:
+            dict: Analysis results with warnings and suggestions
+        """
+        return self.analyze_project_health(project, summary['total'], character_count, summary['scenes'])
+
     def _get_type_specific_checks(self, project_type: ProjectType, word_count: int,
                                   character_count: int, scene_count: int,
                                   labels: Dict) -> Dict:
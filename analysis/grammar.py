@@ -4,21 +4,18 @@ Module for grammatical text analysis - MULTI-LANGUAGE VERSION
 from analysis.grammar_rules import SimpleGrammarChecker
 from analysis.nlp_manager import nlp_manager
 from utils.logger import AppLogger
+from analysis.spelling_service import spelling_service
+from analysis.analysis_context import AnalysisContext
 from typing import Optional
 import re
 
-# Import spell checker
-try:
-    from spellchecker import SpellChecker
-    SPELL_CHECKER_AVAILABLE = True
-except ImportError:
-    SPELL_CHECKER_AVAILABLE = False
-    AppLogger.warning("PySpellChecker not available - spelling errors won't be detected in analysis")
-
 
 class GrammarAnalyzer:
     """Class to manage grammatical analysis with multi-language support"""
 
+    # Bump when results change meaning (invalidates cached results)
+    ANALYZER_VERSION = 1
+
     def __init__(self, language: str = 'it'):
         """
         Initialize the grammar analyzer
@@ -29,14 +26,8 @@ class GrammarAnalyzer:
         self.language = language
         self.checker = SimpleGrammarChecker()  # Fallback per italiano
 
-        # Initialize spell checker if available
-        self.spell_checker = None
-        if SPELL_CHECKER_AVAILABLE:
-            try:
-                self.spell_checker = SpellChecker(language=language)
-                AppLogger.info(f"Spell checker initialized for language: {language}")
-            except Exception as e:
-                AppLogger.warning(f"Could not initialize spell checker: {e}")
+        # Shared spelling dictionary (loaded on first use, once per process)
+        self.spelling = spelling_service.get_dictionary(language)
 
         # Word pattern for spell checking (same as spell_check_highlighter.py)
         self.word_pattern = re.compile(r'\b[a-zA-ZàèéìòùÀÈÉÌÒÙáéíóúÁÉÍÓÚäëïöüÄËÏÖÜâêîôûÂÊÎÔÛçÇñÑ]+\b')
@@ -58,14 +49,25 @@ class GrammarAnalyzer:
             self.language = language
             nlp_manager.set_language(language)
 
-            # Re-initialize spell checker for new language
-            if SPELL_CHECKER_AVAILABLE:
-                try:
-                    self.spell_checker = SpellChecker(language=language)
-                    AppLogger.info(f"Spell checker re-initialized for language: {language}")
-                except Exception as e:
-                    AppLogger.warning(f"Could not re-initialize spell checker: {e}")
-                    self.spell_checker = None
+            # Shared spelling dictionary of the new language
+            self.spelling = spelling_service.get_dictionary(language)
+
+    @staticmethod
+    def get_cache_hash(text: str) -> str:
+        """
+        Get the hash identifying a result of analyze() in the AnalysisCache
+
+        Spelling errors depend on the shared custom words as well as on the
+        text, so adding a word (or character and place names) gives a new
+        hash and cached results of unchanged scenes are not reused.
+
+        Args:
+            text: Analysed text
+
+        Returns:
+            str: Content hash and custom words generation
+        """
+        return f"{AnalysisContext.get_content_hash(text)}:{spelling_service.custom_words_generation}"
 
     def _check_spelling(self, text: str):
         """
@@ -77,7 +79,7 @@ class GrammarAnalyzer:
         Returns:
             list: List of spelling errors in same format as grammar errors
         """
-        if not self.spell_checker:
+        if not self.spelling.is_available():
             return []
 
         spelling_errors = []
@@ -85,16 +87,14 @@ class GrammarAnalyzer:
         # Get exclusion zones from grammar checker to skip HTML/URLs
         _, exclusions = self.checker._preprocess_text(text)
 
-        # Find all words in text
-        for match in self.word_pattern.finditer(text):
+        # Collect the words to check, then look them up in one call
+        # (words in exclusion zones - HTML, URL, etc. - are never produced)
+        candidates = []
+        for match in exclusions.iter_matches(self.word_pattern, text):
             word = match.group()
             start_pos = match.start()
             end_pos = match.end()
 
-            # Skip if word is in exclusion zone (HTML, URL, etc.)
-            if self.checker._match_overlaps_exclusion(start_pos, end_pos, exclusions):
-                continue
-
             # Skip numbers, single letters, all uppercase (likely acronyms)
             if len(word) <= 1 or word.isupper() or word.isdigit():
                 continue
@@ -105,11 +105,15 @@ class GrammarAnalyzer:
                 if not any(c * 3 in word.lower() for c in 'abcdefghilmnopqrstuvz'):
                     continue
 
-            # Check if word is misspelled
+            candidates.append((word, start_pos, end_pos))
+
+        unknown = self.spelling.unknown(word.lower() for word, _, _ in candidates)
+
+        for word, start_pos, end_pos in candidates:
             word_lower = word.lower()
-            if self.spell_checker.unknown([word_lower]):
-                # Get suggestion
-                suggestion = self.spell_checker.correction(word_lower)
+            if word_lower in unknown:
+                # Get suggestion (cached by the spelling service)
+                suggestion = self.spelling.correction(word_lower)
                 if suggestion and suggestion != word_lower:
                     # Get context
                     context = self.checker._get_context(text, start_pos, end_pos)
@@ -2,6 +2,260 @@
 Simple Italian grammar rules - NO external dependencies
 """
 import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Token of a literal rule matching any run of whitespace
+_WHITESPACE = '\\s+'
+
+# Literal rule pattern: \b, words separated by spaces or \s+, optional final \b
+_LITERAL_RULE = re.compile(r"\\b((?:[\w']|\\s\+| )+?)(\\b)?")
+
+
+class ExclusionZones:
+    """
+    Sorted, non-overlapping zones of a text that must not be checked
+
+    Produced by SimpleGrammarChecker._preprocess_text (HTML tags, URLs,
+    emails, ...). Lookups use bisect on the zone starts, so checking a
+    match costs O(log zones) instead of a scan of every zone.
+
+    Iterating yields (start, end) tuples, like the plain list used before.
+    """
+
+    __slots__ = ('_starts', '_ends')
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()):
+        """
+        Initialize the zones
+
+        Args:
+            ranges: (start, end) ranges, in any order, possibly overlapping
+        """
+        starts: List[int] = []
+        ends: List[int] = []
+        for start, end in sorted(ranges):
+            # Merge with the previous zone if they overlap or touch
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts = starts
+        self._ends = ends
+
+    def contains(self, position: int) -> bool:
+        """Check if a position falls in a zone"""
+        index = bisect_right(self._starts, position) - 1
+        return index >= 0 and position < self._ends[index]
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """
+        Check if a range overlaps a zone
+
+        Catches ranges that only touch a zone with one end, like '.<p>'
+        where '.' is real text but '<p>' is HTML.
+
+        Args:
+            start: Range start
+            end: Range end (excluded)
+        """
+        # Last zone starting before the range ends
+        index = bisect_left(self._starts, end) - 1
+        return index >= 0 and self._ends[index] > start
+
+    def iter_matches(self, pattern: re.Pattern, text: str) -> Iterator[re.Match]:
+        """
+        Stream the matches of a pattern that do not overlap any zone
+
+        Only the text between zones is scanned: each zone is skipped by
+        restarting the search where it ends. Word boundaries still see the
+        characters around a zone, so a word glued to a zone is dropped
+        rather than cut.
+
+        Args:
+            pattern: Compiled pattern (e.g. a word pattern)
+            text: Text the zones belong to
+
+        Yields:
+            re.Match: Matches in text order
+        """
+        position = 0
+        for zone_start, zone_end in zip(self._starts, self._ends):
+            if zone_start > position:
+                for match in pattern.finditer(text, position):
+                    if match.end() > zone_start or match.start() >= zone_start:
+                        # Reaches the zone: anything after it is found past the zone
+                        break
+                    yield match
+            position = max(position, zone_end)
+        yield from pattern.finditer(text, position)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __repr__(self) -> str:
+        return f"ExclusionZones({list(self)!r})"
+
+
+class CompiledRuleSet:
+    """
+    Grammar rules compiled once and run over a text in as few passes as possible
+
+    Most rules are literal words (\\bperche\\b, \\bdi il\\b, \\bacelera).
+    These are merged into one regex whose alternatives share their common
+    prefixes (a trie), so a single scan of the text finds all of them. Each
+    rule ends with an empty named group, which tells which rule matched.
+
+    Rules that are not literal (lookarounds, groups, character classes) and
+    literal rules whose matches could overlap another literal rule keep a
+    compiled pass of their own: one scan per rule returns every match, as
+    re.finditer on the rule alone would.
+
+    Matches are the same as running re.finditer(pattern, text, re.IGNORECASE)
+    for every rule.
+    """
+
+    def __init__(self, rules: List[dict]):
+        """
+        Compile the rules
+
+        Args:
+            rules: Rule dictionaries (see SimpleGrammarChecker._load_rules)
+        """
+        self.rule_count = len(rules)
+        literals: Dict[int, Tuple[tuple, bool]] = {}
+        for index, rule in enumerate(rules):
+            literal = self._parse_literal(rule['pattern'])
+            if literal is not None:
+                literals[index] = literal
+
+        # Literal rules whose matches could overlap get their own pass
+        merged = [index for index in literals
+                  if not any(other != index and (self._may_overlap(literals[index][0], literals[other][0]) or
+                                                 self._may_overlap(literals[other][0], literals[index][0]))
+                             for other in literals)]
+
+        self.merged_rules = merged
+        self.merged_pattern: Optional[re.Pattern] = None
+        if merged:
+            trie = {}
+            for index in merged:
+                node = trie
+                for token in literals[index][0]:
+                    node = node.setdefault(token, {})
+                node[None] = index
+            self.merged_pattern = re.compile(r'\b' + self._trie_to_regex(trie, literals), re.IGNORECASE)
+
+        self.separate_patterns: List[Tuple[int, re.Pattern]] = [
+            (index, re.compile(rule['pattern'], re.IGNORECASE))
+            for index, rule in enumerate(rules) if index not in merged
+        ]
+
+    @staticmethod
+    def _parse_literal(pattern: str) -> Optional[Tuple[tuple, bool]]:
+        """
+        Internal: Tokens of a literal rule
+
+        Returns:
+            Optional[Tuple[tuple, bool]]: (lowercase characters and whitespace
+                tokens, ends with \\b), or None if the rule is not literal
+        """
+        match = _LITERAL_RULE.fullmatch(pattern)
+        if match is None:
+            return None
+        body = match.group(1)
+        tokens = []
+        position = 0
+        while position < len(body):
+            if body.startswith(_WHITESPACE, position):
+                tokens.append(_WHITESPACE)
+                position += len(_WHITESPACE)
+            else:
+                tokens.append(body[position].lower())
+                position += 1
+        if not tokens or not CompiledRuleSet._is_word_char(tokens[0]):
+            return None
+        return tuple(tokens), match.group(2) is not None
+
+    @staticmethod
+    def _is_word_char(token: str) -> bool:
+        """Internal: Check if a token is a word character"""
+        return len(token) == 1 and (token.isalnum() or token == '_')
+
+    @staticmethod
+    def _tokens_agree(first: tuple, second: tuple) -> bool:
+        """Internal: Check if two token sequences could match the same text on their common length"""
+        for a, b in zip(first, second):
+            if a == b:
+                continue
+            # A literal space and \s+ can match the same text
+            if {a, b} == {' ', _WHITESPACE}:
+                continue
+            return False
+        return True
+
+    @classmethod
+    def _may_overlap(cls, tokens: tuple, other: tuple) -> bool:
+        """
+        Internal: Check if a match of other could start inside (or at) a match of tokens
+
+        Both rules start at a word boundary, so other can only start where
+        a word starts within tokens.
+        """
+        for position, token in enumerate(tokens):
+            if position > 0 and (not cls._is_word_char(token) or cls._is_word_char(tokens[position - 1])):
+                continue
+            if cls._tokens_agree(tokens[position:], other):
+                return True
+        return False
+
+    @staticmethod
+    def _trie_to_regex(node: dict, literals: Dict[int, Tuple[tuple, bool]]) -> str:
+        """Internal: Regex of a trie of literal rules (ends with a marker group per rule)"""
+        if None in node:
+            # Literal rules never prefix one another, so a rule ends in a leaf
+            index = node[None]
+            return ('\\b' if literals[index][1] else '') + f'(?P<r{index}>)'
+
+        branches = [
+            (token if token == _WHITESPACE else re.escape(token)) +
+            CompiledRuleSet._trie_to_regex(child, literals)
+            for token, child in node.items()
+        ]
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    def finditer(self, text: str, exclusions: Optional[ExclusionZones] = None) -> Iterator[Tuple[int, re.Match]]:
+        """
+        Find the matches of all rules
+
+        Args:
+            text: Text to check
+            exclusions: Zones to skip (matches overlapping them are dropped)
+
+        Yields:
+            Tuple[int, re.Match]: (rule index, match); merged rules first, in
+                text order, then the other rules one by one
+        """
+        if exclusions is None:
+            exclusions = ExclusionZones()
+
+        if self.merged_pattern is not None:
+            for match in exclusions.iter_matches(self.merged_pattern, text):
+                yield int(match.lastgroup[1:]), match
+
+        for index, pattern in self.separate_patterns:
+            for match in exclusions.iter_matches(pattern, text):
+                yield index, match
 
 
 class SimpleGrammarChecker:
@@ -10,6 +264,13 @@ class SimpleGrammarChecker:
     def __init__(self):
         """Initialize with common Italian grammar rules"""
         self.rules = self._load_rules()
+        self._rule_set: Optional[CompiledRuleSet] = None
+
+    def _get_rule_set(self) -> CompiledRuleSet:
+        """Get the compiled rules (compiled again when rules were added)"""
+        if self._rule_set is None or self._rule_set.rule_count != len(self.rules):
+            self._rule_set = CompiledRuleSet(self.rules)
+        return self._rule_set
 
     def _load_rules(self):
         """Load grammar rules"""
@@ -194,9 +455,9 @@ class SimpleGrammarChecker:
             text: Original text
 
         Returns:
-            tuple: (cleaned_text, exclusion_ranges)
+            tuple: (cleaned_text, exclusion_zones)
                 - cleaned_text: Text with placeholders
-                - exclusion_ranges: List of (start, end) tuples to skip
+                - exclusion_zones: ExclusionZones to skip (merged, sorted)
         """
         # Store original text for position tracking
         cleaned = text
@@ -237,36 +498,14 @@ class SimpleGrammarChecker:
         for match in re.finditer(script_pattern, text, re.IGNORECASE | re.DOTALL):
             exclusions.append((match.start(), match.end()))
 
-        # Merge overlapping exclusions
-        exclusions = self._merge_ranges(exclusions)
-
-        return cleaned, exclusions
-
-    def _merge_ranges(self, ranges):
-        """Merge overlapping ranges"""
-        if not ranges:
-            return []
-
-        # Sort by start position
-        sorted_ranges = sorted(ranges, key=lambda x: x[0])
-        merged = [sorted_ranges[0]]
-
-        for current in sorted_ranges[1:]:
-            last = merged[-1]
-            # If ranges overlap, merge them
-            if current[0] <= last[1]:
-                merged[-1] = (last[0], max(last[1], current[1]))
-            else:
-                merged.append(current)
-
-        return merged
+        # Merge overlapping exclusions, indexed for bisect lookups
+        return cleaned, ExclusionZones(exclusions)
 
     def _is_in_exclusion(self, pos, exclusions):
         """Check if position is in any exclusion range"""
-        for start, end in exclusions:
-            if start <= pos < end:
-                return True
-        return False
+        if not isinstance(exclusions, ExclusionZones):
+            exclusions = ExclusionZones(exclusions)
+        return exclusions.contains(pos)
 
     def _match_overlaps_exclusion(self, match_start, match_end, exclusions):
         """
@@ -275,11 +514,9 @@ class SimpleGrammarChecker:
         This is more robust than checking only the start position,
         as it catches cases like '.<p>' where '.' is real text but '<p>' is HTML.
         """
-        for excl_start, excl_end in exclusions:
-            # Check if match overlaps with exclusion zone
-            if (match_start < excl_end and match_end > excl_start):
-                return True
-        return False
+        if not isinstance(exclusions, ExclusionZones):
+            exclusions = ExclusionZones(exclusions)
+        return exclusions.overlaps(match_start, match_end)
 
     def check(self, text):
         """
@@ -294,28 +531,26 @@ class SimpleGrammarChecker:
         # Pre-process text to identify areas to exclude (HTML, URLs, etc.)
         _, exclusions = self._preprocess_text(text)
 
-        errors = []
+        # One scan for the literal rules, one per other rule; matches
+        # overlapping an exclusion zone (HTML, URL, CSS, etc.) are skipped
+        matches = [(index, match.start(), match)
+                   for index, match in self._get_rule_set().finditer(text, exclusions)]
 
-        for rule in self.rules:
-            pattern = rule['pattern']
-            replacement = rule['replacement']
-            message = rule['message']
-            category = rule['category']
-
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Skip if match overlaps with an exclusion zone (HTML, URL, CSS, etc.)
-                if self._match_overlaps_exclusion(match.start(), match.end(), exclusions):
-                    continue
-
-                errors.append({
-                    'start': match.start(),
-                    'end': match.end(),
-                    'message': message,
-                    'original': match.group(),
-                    'suggestion': replacement,
-                    'category': category,
-                    'context': self._get_context(text, match.start(), match.end())
-                })
+        # Errors listed rule by rule, each rule in text order
+        matches.sort(key=lambda item: (item[0], item[1]))
+
+        errors = []
+        for index, _, match in matches:
+            rule = self.rules[index]
+            errors.append({
+                'start': match.start(),
+                'end': match.end(),
+                'message': rule['message'],
+                'original': match.group(),
+                'suggestion': rule['replacement'],
+                'category': rule['category'],
+                'context': self._get_context(text, match.start(), match.end())
+            })
 
         return errors
 
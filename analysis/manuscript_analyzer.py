@@ -0,0 +1,320 @@
+"""
+Manuscript Analyzer - Repetition, style and POS statistics of the whole book
+
+The scenes of the manuscript are streamed in reading order through
+nlp.pipe in batches. With n_process > 1 the batches go to a pool of
+worker processes (one model per process, one core each), which parse
+them and send back only the small per-scene partial results; the pool
+is terminated as soon as the analysis is cancelled. The partial results
+of each scene are merged into per-chapter and whole-book statistics,
+and stored in the AnalysisCache so that the next run (or a
+repetitions/style analysis) parses only the scenes changed since.
+"""
+import math
+import multiprocessing
+import os
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from analysis.nlp_manager import nlp_manager
+from analysis.repetition import RepetitionAnalyzer
+from analysis.style import StyleAnalyzer
+from models.project_type import ProjectType
+from utils.logger import AppLogger
+
+
+@dataclass
+class ManuscriptScene:
+    """Snapshot of a scene to analyse (taken in the UI thread)"""
+    scene_id: str
+    title: str
+    chapter_id: str
+    chapter_title: str
+    content_hash: str
+    text: str
+
+
+# Model and analyzers of a worker process (set by _init_worker)
+_worker_state = None
+
+
+def _scene_partials(doc, text: str, repetitions: RepetitionAnalyzer, style: StyleAnalyzer) -> tuple:
+    """Internal: (repetition partial, style partial) of a parsed scene"""
+    return repetitions.partial_from_doc(doc), style.partial_from_doc(doc, text)
+
+
+def _init_worker(nlp, disable: List[str], repetitions: RepetitionAnalyzer, style: StyleAnalyzer):
+    """Internal: Keep the model and analyzers sent to a new worker process"""
+    global _worker_state
+    _worker_state = (nlp, disable, repetitions, style)
+
+
+def _analyze_batch(batch: List[Tuple[str, int]]) -> List[Tuple[int, tuple]]:
+    """Internal: Parse a batch of (text, scene index) in a worker process"""
+    nlp, disable, repetitions, style = _worker_state
+    docs = nlp.pipe(batch, as_tuples=True, batch_size=len(batch), disable=disable)
+    return [(index, _scene_partials(doc, text, repetitions, style))
+            for (text, _), (doc, index) in zip(batch, docs)]
+
+
+class ManuscriptAnalyzer:
+    """
+    Analyses every scene of the manuscript with nlp.pipe
+
+    batch_size is the number of scenes sent to nlp.pipe at a time and
+    n_process the number of parsing processes (None: one per CPU core).
+    The processes are a multiprocessing pool owned by the analyzer rather
+    than nlp.pipe's own: a cancelled analysis terminates them at once,
+    while nlp.pipe's workers would have to finish their queued batches.
+    Both are upper bounds: a few scenes are parsed in this process, since
+    starting a worker costs a model load, and batches are made smaller
+    when needed so that every worker gets one.
+    """
+
+    # Scenes are long texts: a few per batch are enough
+    DEFAULT_BATCH_SIZE = 8
+
+    # Worker processes are started only if each one gets this many scenes
+    MIN_SCENES_PER_PROCESS = 2
+
+    # Pipeline components whose annotations no statistic uses
+    UNUSED_PIPES = ('ner',)
+
+    def __init__(self, repetitions_analyzer: Optional[RepetitionAnalyzer] = None,
+                 style_analyzer: Optional[StyleAnalyzer] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, n_process: Optional[int] = None,
+                 language: str = 'it'):
+        """
+        Initialize the manuscript analyzer
+
+        Args:
+            repetitions_analyzer: Optional long-lived RepetitionAnalyzer to reuse
+            style_analyzer: Optional long-lived StyleAnalyzer to reuse
+            batch_size: Maximum number of scenes per nlp.pipe batch
+            n_process: Maximum number of parsing processes (None: CPU count)
+            language: Language of the analyzers created here
+        """
+        self.repetitions_analyzer = repetitions_analyzer or RepetitionAnalyzer(language)
+        self.style_analyzer = style_analyzer or StyleAnalyzer(language)
+        self.batch_size = max(1, batch_size)
+        self.n_process = n_process
+
+    @property
+    def language(self) -> str:
+        """Analysis language (the style analyzer's, kept in sync by the main window)"""
+        return self.style_analyzer.language
+
+    @staticmethod
+    def collect_scenes(manager) -> List[ManuscriptScene]:
+        """
+        Snapshot the non-empty scenes of the manuscript in reading order
+
+        Args:
+            manager: ManuscriptStructureManager
+
+        Returns:
+            List[ManuscriptScene]: Scenes to analyse
+        """
+        scenes = []
+        for chapter in manager.get_all_chapters():
+            for scene in manager.get_scenes_in_chapter(chapter.id):
+                if scene.word_count > 0:
+                    scenes.append(ManuscriptScene(scene.id, scene.title, chapter.id, chapter.title,
+                                                  scene.content_hash, scene.plain_text))
+        return scenes
+
+    def get_pipe_settings(self, scene_count: int):
+        """
+        Choose the nlp.pipe batch size and number of processes
+
+        Args:
+            scene_count: Number of scenes to parse
+
+        Returns:
+            Tuple[int, int]: (batch_size, n_process)
+        """
+        n_process = self.n_process or os.cpu_count() or 1
+        n_process = max(1, min(n_process, scene_count // self.MIN_SCENES_PER_PROCESS))
+        # Batches are dealt out to the workers: one at least for each of them
+        batch_size = max(1, min(self.batch_size, math.ceil(scene_count / n_process)))
+        return batch_size, n_process
+
+    def analyze(self, scenes: List[ManuscriptScene], project_type: Optional[ProjectType] = None,
+                analysis_cache=None, progress: Optional[Callable[[int, int], None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> dict:
+        """
+        Analyse the scenes and aggregate them per scene, chapter and book
+
+        Args:
+            scenes: Scenes in reading order (see collect_scenes)
+            project_type: Optional project type for context-aware analysis
+            analysis_cache: Optional AnalysisCache with per-scene partial results
+            progress: Optional callable (scenes done, total scenes)
+            is_cancelled: Optional callable, parsing stops when it returns True
+
+        Returns:
+            dict: 'book', 'chapters' and 'scenes' statistics (each with
+                'repetitions', 'style' and 'pos_counts'), or an error
+        """
+        repetitions = self.repetitions_analyzer
+        style = self.style_analyzer
+        keys = (('repetitions', repetitions.language, repetitions.ANALYZER_VERSION),
+                ('style', style.language, style.ANALYZER_VERSION))
+
+        # Scenes unchanged since their last analysis are not parsed again
+        partials: List[Optional[tuple]] = [None] * len(scenes)
+        pending = []
+        for index, scene in enumerate(scenes):
+            if analysis_cache is not None:
+                cached = tuple(analysis_cache.get(scene.scene_id, scene.content_hash, *key)
+                               for key in keys)
+                if None not in cached:
+                    partials[index] = cached
+                    continue
+            pending.append(index)
+
+        total = len(scenes)
+        done = total - len(pending)
+        if progress:
+            progress(done, total)
+
+        batch_size, n_process = self.get_pipe_settings(len(pending))
+        if pending:
+            nlp = nlp_manager.get_spacy_model(self.language)
+            if nlp is None:
+                return {
+                    'error': f'spaCy model not available for language: {self.language}',
+                    'success': False
+                }
+
+            AppLogger.info(f"Parsing {len(pending)} of {total} scenes "
+                           f"(batch size {batch_size}, {n_process} processes)")
+            texts = [(scenes[index].text, index) for index in pending]
+            results = self._iter_partials(nlp, texts, batch_size, n_process)
+            try:
+                for index, partial in results:
+                    scene = scenes[index]
+                    partials[index] = partial
+                    if analysis_cache is not None:
+                        for key, result in zip(keys, partial):
+                            analysis_cache.put(scene.scene_id, scene.content_hash, *key, result)
+
+                    done += 1
+                    if progress:
+                        progress(done, total)
+                    if is_cancelled and is_cancelled():
+                        return {'error': 'Analysis cancelled', 'cancelled': True, 'success': False}
+            finally:
+                # Terminates the worker processes if the analysis stopped early
+                results.close()
+
+        return self._aggregate(scenes, partials, project_type, len(pending), n_process)
+
+    def _iter_partials(self, nlp, texts: List[Tuple[str, int]], batch_size: int,
+                       n_process: int) -> Iterator[Tuple[int, tuple]]:
+        """
+        Parse the scenes and yield their partial results as they are ready
+
+        Args:
+            nlp: spaCy model
+            texts: (text, scene index) of the scenes to parse
+            batch_size: Scenes per nlp.pipe batch
+            n_process: Number of parsing processes (1: this process)
+
+        Yields:
+            Tuple[int, tuple]: (scene index, (repetition partial, style partial)),
+                in completion order
+        """
+        repetitions = self.repetitions_analyzer
+        style = self.style_analyzer
+        disable = [name for name in self.UNUSED_PIPES if name in nlp.pipe_names]
+
+        if n_process == 1:
+            docs = nlp.pipe(texts, as_tuples=True, batch_size=batch_size, disable=disable)
+            for (text, _), (doc, index) in zip(texts, docs):
+                yield index, _scene_partials(doc, text, repetitions, style)
+            return
+
+        batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+        # Leaving the with block (done, cancelled or failed) terminates the pool
+        with multiprocessing.get_context().Pool(
+                n_process, initializer=_init_worker,
+                initargs=(nlp, disable, repetitions, style)) as pool:
+            for results in pool.imap_unordered(_analyze_batch, batches):
+                yield from results
+
+    def _aggregate(self, scenes: List[ManuscriptScene], partials: List[tuple],
+                   project_type: Optional[ProjectType], analysed: int, n_process: int) -> dict:
+        """Internal: Merge the partial results per scene, chapter and book"""
+        scene_stats = []
+        chapter_stats = []
+        chapter_partials: Dict[str, List[tuple]] = {}
+        for scene, partial in zip(scenes, partials):
+            if scene.chapter_id not in chapter_partials:
+                chapter_partials[scene.chapter_id] = []
+                chapter_stats.append({'id': scene.chapter_id, 'title': scene.chapter_title})
+            chapter_partials[scene.chapter_id].append(partial)
+            scene_stats.append({'id': scene.scene_id, 'title': scene.title,
+                                'chapter_id': scene.chapter_id,
+                                **self._merge([partial], project_type)})
+
+        for chapter in chapter_stats:
+            chapter_scenes = chapter_partials[chapter['id']]
+            chapter['scene_count'] = len(chapter_scenes)
+            chapter.update(self._merge(chapter_scenes, project_type))
+
+        return {
+            'book': self._merge(partials, project_type),
+            'chapters': chapter_stats,
+            'scenes': scene_stats,
+            'scene_count': len(scenes),
+            'analysed_scenes': analysed,
+            'n_process': n_process,
+            'language': self.language,
+            'success': True
+        }
+
+    def _merge(self, partials: List[tuple], project_type: Optional[ProjectType]) -> dict:
+        """Internal: Repetition, style and full POS statistics of some scenes"""
+        pos_counts = Counter()
+        for _, style_partial in partials:
+            pos_counts.update(style_partial['pos_counts'])
+
+        return {
+            'repetitions': self.repetitions_analyzer.merge_partials([partial[0] for partial in partials]),
+            'style': self.style_analyzer.merge_partials([partial[1] for partial in partials], project_type),
+            # Style keeps the five most common parts of speech; these are all of them
+            'pos_counts': dict(pos_counts.most_common())
+        }
+
+    def format_results(self, result: dict) -> str:
+        """
+        Format results for display: book style and per-chapter statistics
+        (book repetitions are formatted by the RepetitionAnalyzer)
+
+        Args:
+            result: Analysis result
+
+        Returns:
+            str: Formatted text for UI
+        """
+        if not result.get('success'):
+            return f"❌ Error: {result.get('error', 'Unknown error')}"
+
+        book = result['book']
+        output = self.style_analyzer.format_results(book['style'])
+
+        output += "\n\n" + "═" * 50 + "\n"
+        output += "CHAPTERS\n"
+        output += "═" * 50 + "\n\n"
+        for chapter in result['chapters']:
+            chapter_style = chapter['style']
+            top_words = ", ".join(word for word, _ in chapter['repetitions']['repetitions'][:3])
+            output += f"{chapter['title']}\n"
+            output += (f"  • {chapter_style['num_words']} words, {chapter['scene_count']} scenes, "
+                       f"readability {chapter_style['readability']}, "
+                       f"lexical diversity {chapter_style['lexical_diversity']}%\n")
+            if top_words:
+                output += f"  • Most used: {top_words}\n"
+
+        return output
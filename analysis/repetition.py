@@ -1,28 +1,40 @@
 """
 Module for text repetition analysis
 """
-import spacy
 from collections import Counter
+from typing import List
+from analysis.analysis_context import analysis_context
 
 
 class RepetitionAnalyzer:
-    """Class to analyze word repetitions"""
+    """
+    Class to analyze word repetitions
 
-    def __init__(self, model='it_core_news_sm'):
+    A text can be analysed in parts (e.g. one scene at a time): each part
+    gives a partial result (lemma counts) and merge_partials combines them
+    into the result of the whole text.
+    """
+
+    # Bump when partial results change meaning (invalidates cached partials)
+    ANALYZER_VERSION = 1
+
+    def __init__(self, language: str = 'it'):
         """
         Initialize the repetition analyzer
 
         Args:
-            model: spaCy model name to use
+            language: Language code ('it', 'en', 'es', 'fr', 'de')
         """
-        self.model = model
-        self._nlp = None
+        self.language = language
 
-    def _get_nlp(self):
-        """Lazy loading of spaCy model"""
-        if self._nlp is None:
-            self._nlp = spacy.load(self.model)
-        return self._nlp
+    def set_language(self, language: str):
+        """
+        Change the analysis language
+
+        Args:
+            language: New language code
+        """
+        self.language = language
 
     def analyze(self, text, top_n=20, min_length=3):
         """
@@ -37,35 +49,81 @@ class RepetitionAnalyzer:
             dict: Dictionary with 'repetitions' and other info
         """
         try:
-            nlp = self._get_nlp()
-            doc = nlp(text)
-
-            # Filter significant words
-            words = [
-                token.lemma_.lower()
-                for token in doc
-                if not token.is_stop
-                   and not token.is_punct
-                   and len(token.text) > min_length
-                   and token.is_alpha  # Only alphabetic characters
-            ]
-
-            # Count occurrences
-            count = Counter(words)
-            repetitions = count.most_common(top_n)
-
-            return {
-                'repetitions': repetitions,
-                'total_words_analyzed': len(words),
-                'unique_words': len(set(words)),
-                'success': True
-            }
+            partial = self.analyze_partial(text, min_length)
+            if partial is None:
+                return {
+                    'error': f'spaCy model not available for language: {self.language}',
+                    'success': False
+                }
+            return self.merge_partials([partial], top_n)
         except Exception as e:
             return {
                 'error': str(e),
                 'success': False
             }
 
+    def analyze_partial(self, text, min_length=3):
+        """
+        Count the significant lemmas of a part of the text
+
+        Args:
+            text: Text to analyze
+            min_length: Minimum word length to consider
+
+        Returns:
+            dict: Partial result ('counts': Counter of lemmas), or None if
+                no spaCy model is available
+        """
+        # Shared parse (model loaded once by nlp_manager)
+        doc = analysis_context.get_doc(text, self.language)
+        if doc is None:
+            return None
+        return self.partial_from_doc(doc, min_length)
+
+    def partial_from_doc(self, doc, min_length=3):
+        """
+        Count the significant lemmas of a parsed text
+
+        Args:
+            doc: spaCy Doc
+            min_length: Minimum word length to consider
+
+        Returns:
+            dict: Partial result ('counts': Counter of lemmas)
+        """
+        # Filter significant words
+        words = [
+            token.lemma_.lower()
+            for token in doc
+            if not token.is_stop
+               and not token.is_punct
+               and len(token.text) > min_length
+               and token.is_alpha  # Only alphabetic characters
+        ]
+        return {'counts': Counter(words)}
+
+    def merge_partials(self, partials: List[dict], top_n=20):
+        """
+        Combine partial results into the result of the whole text
+
+        Args:
+            partials: Results of analyze_partial / partial_from_doc
+            top_n: Number of most frequent words to return
+
+        Returns:
+            dict: Same result as analyze() on the concatenated text
+        """
+        count = Counter()
+        for partial in partials:
+            count.update(partial['counts'])
+
+        return {
+            'repetitions': count.most_common(top_n),
+            'total_words_analyzed': sum(count.values()),
+            'unique_words': len(count),
+            'success': True
+        }
+
     def format_results(self, result):
         """
         Format results for display
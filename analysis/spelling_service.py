@@ -0,0 +1,334 @@
+"""
+Spelling Service - Process-wide spell checking dictionaries
+
+A frequency dictionary costs several MB and a noticeable load time, so
+every editor, highlighter and analyzer shares one SpellChecker per
+language through the spelling_service singleton.
+
+Supported Languages:
+    - it, en, es, fr, de (and any other language known to pyspellchecker)
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from utils.logger import AppLogger
+
+# Import spell checker
+try:
+    from spellchecker import SpellChecker
+    SPELL_CHECKER_AVAILABLE = True
+except ImportError:
+    SPELL_CHECKER_AVAILABLE = False
+    AppLogger.warning("PySpellChecker not available - spell checking disabled")
+
+
+# Words checked by the editors (letters, digits, apostrophes)
+WORD_PATTERN = re.compile(r"\b[\w']+\b")
+
+
+class LRUCache:
+    """Small thread-unsafe LRU mapping (callers hold their own lock)"""
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Number of entries kept
+        """
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key, default=None):
+        """Get a value and mark it as recently used"""
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if full"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        self._data.clear()
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SpellingDictionary:
+    """
+    Spell checker of one language, shared across the application
+
+    The underlying SpellChecker is loaded on the first lookup. Verdicts
+    (word known or not) are kept in an LRU cache, so repeated words cost
+    a dict hit; suggestions are computed only when asked for, and cached
+    as well. Custom words come from the owning SpellingService and are
+    checked before the dictionary. Safe to use from worker threads.
+
+    Words are expected in lowercase.
+
+    Attributes:
+        language: Language code
+    """
+
+    VERDICT_CACHE_SIZE = 50000
+    SUGGESTION_CACHE_SIZE = 2000
+
+    def __init__(self, language: str, custom_words: Set[str]):
+        """
+        Initialize the dictionary (nothing is loaded yet)
+
+        Args:
+            language: Language code ('it', 'en', ...)
+            custom_words: Shared set of custom words (owned by the service)
+        """
+        self.language = language
+        self._custom_words = custom_words
+        self._checker = None
+        self._load_failed = False
+        self._lock = threading.RLock()
+        self._verdicts = LRUCache(self.VERDICT_CACHE_SIZE)
+        self._suggestions = LRUCache(self.SUGGESTION_CACHE_SIZE)
+
+    def _get_checker(self):
+        """Internal: Load the SpellChecker on first use (None if unavailable)"""
+        if self._checker is None and not self._load_failed:
+            if not SPELL_CHECKER_AVAILABLE:
+                self._load_failed = True
+                return None
+            try:
+                self._checker = SpellChecker(language=self.language)
+                AppLogger.info(f"Spell checker dictionary loaded for language: {self.language}")
+            except Exception as e:
+                AppLogger.warning(f"Could not load spell checker for language {self.language}: {e}")
+                self._load_failed = True
+        return self._checker
+
+    def is_available(self) -> bool:
+        """Check if a dictionary exists for the language (loads it)"""
+        with self._lock:
+            return self._get_checker() is not None
+
+    def unknown(self, words: Iterable[str]) -> Set[str]:
+        """
+        Get the words that are neither in the dictionary nor custom words
+
+        Args:
+            words: Lowercase words
+
+        Returns:
+            Set[str]: Misspelled words (empty if no dictionary is available)
+        """
+        result = set()
+        with self._lock:
+            checker = self._get_checker()
+            if checker is None:
+                return result
+
+            missing = []
+            for word in set(words):
+                if word in self._custom_words:
+                    continue
+                known = self._verdicts.get(word)
+                if known is None:
+                    missing.append(word)
+                elif not known:
+                    result.add(word)
+
+            if missing:
+                misspelled = checker.unknown(missing)
+                for word in missing:
+                    known = word not in misspelled
+                    self._verdicts.put(word, known)
+                    if not known:
+                        result.add(word)
+
+        return result
+
+    def is_misspelled(self, word: str) -> bool:
+        """Check a single lowercase word"""
+        return bool(self.unknown([word]))
+
+    def candidates(self, word: str) -> List[str]:
+        """
+        Get correction candidates for a word (computed on first request)
+
+        Args:
+            word: Lowercase misspelled word
+
+        Returns:
+            List[str]: Candidates, most likely first
+        """
+        with self._lock:
+            cached = self._suggestions.get(word)
+            if cached is not None:
+                return list(cached)
+
+            checker = self._get_checker()
+            if checker is None:
+                return []
+
+            candidates = checker.candidates(word) or set()
+            # Most frequent first (candidates() returns an unordered set)
+            frequencies = checker.word_frequency.dictionary
+            ranked = sorted(candidates, key=lambda c: (-frequencies.get(c, 0), c))
+            self._suggestions.put(word, tuple(ranked))
+            return ranked
+
+    def correction(self, word: str) -> Optional[str]:
+        """
+        Get the most likely correction of a word
+
+        Args:
+            word: Lowercase misspelled word
+
+        Returns:
+            Optional[str]: Best candidate, or None
+        """
+        candidates = self.candidates(word)
+        return candidates[0] if candidates else None
+
+    def clear_cache(self):
+        """Forget cached verdicts and suggestions"""
+        with self._lock:
+            self._verdicts.clear()
+            self._suggestions.clear()
+
+
+class SpellingService:
+    """
+    Singleton handing out one SpellingDictionary per language
+
+    Custom words (character and place names, added words) are shared by
+    every language and every user of the service. Each change bumps
+    custom_words_generation, so editors can tell that their cached
+    results are stale.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Implement Singleton pattern"""
+        if cls._instance is None:
+            cls._instance = super(SpellingService, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the service (only once)"""
+        if self._initialized:
+            return
+
+        self._dictionaries: Dict[str, SpellingDictionary] = {}
+        self._custom_words: Set[str] = set()
+        self._lock = threading.Lock()
+        self.custom_words_generation = 0
+        self._initialized = True
+
+    def get_dictionary(self, language: str) -> SpellingDictionary:
+        """
+        Get the shared dictionary of a language (created on first request)
+
+        Args:
+            language: Language code
+
+        Returns:
+            SpellingDictionary: Dictionary (loads its data on first lookup)
+        """
+        with self._lock:
+            dictionary = self._dictionaries.get(language)
+            if dictionary is None:
+                dictionary = SpellingDictionary(language, self._custom_words)
+                self._dictionaries[language] = dictionary
+            return dictionary
+
+    def add_custom_words(self, words: Iterable[str]) -> bool:
+        """
+        Add words every dictionary must accept
+
+        Args:
+            words: Words to add (case-insensitive)
+
+        Returns:
+            bool: True if at least one word was new
+        """
+        new_words = {word.lower() for word in words if word} - self._custom_words
+        if not new_words:
+            return False
+        self._custom_words.update(new_words)
+        self.custom_words_generation += 1
+        return True
+
+    def remove_custom_word(self, word: str):
+        """Remove a custom word"""
+        if word.lower() in self._custom_words:
+            self._custom_words.discard(word.lower())
+            self.custom_words_generation += 1
+
+    def clear_custom_words(self):
+        """Remove all custom words"""
+        if self._custom_words:
+            self._custom_words.clear()
+            self.custom_words_generation += 1
+
+    def is_custom_word(self, word: str) -> bool:
+        """Check if a word is in the custom dictionary"""
+        return word.lower() in self._custom_words
+
+    def get_custom_words(self) -> Set[str]:
+        """Get a copy of the custom words"""
+        return set(self._custom_words)
+
+
+def find_misspelled_spans(text: str, dictionary: 'SpellingDictionary') -> List[Tuple[int, int]]:
+    """
+    Find the misspelled words of a text, as the editors flag them
+
+    Numbers, single letters, acronyms and capitalized words (likely proper
+    nouns) are skipped. Pure Python, so it can run on a worker thread.
+
+    Args:
+        text: Text to check (usually one paragraph)
+        dictionary: Dictionary to check against
+
+    Returns:
+        List[Tuple[int, int]]: (start, length) of each misspelled word
+    """
+    candidates = []
+    for match in WORD_PATTERN.finditer(text):
+        word = match.group(0)
+
+        # Skip if word is a number or too short
+        if word.isdigit() or len(word) < 2:
+            continue
+
+        # Skip if word is all uppercase (acronyms)
+        if word.isupper():
+            continue
+
+        # Skip if word starts with uppercase (proper noun)
+        if word[0].isupper():
+            continue
+
+        candidates.append((match.start(), len(word), word.lower()))
+
+    if not candidates:
+        return []
+
+    # One dictionary lookup for the whole text (custom words are accepted)
+    unknown = dictionary.unknown(word for _, _, word in candidates)
+    return [(start, length) for start, length, word in candidates if word in unknown]
+
+
+# Global singleton instance
+spelling_service = SpellingService()
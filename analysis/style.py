@@ -5,12 +5,22 @@ import textstat
 from collections import Counter
 from typing import Optional, Dict, List
 from analysis.nlp_manager import nlp_manager
+from analysis.analysis_context import analysis_context
 from models.project_type import ProjectType
 from utils.logger import AppLogger
 
 
 class StyleAnalyzer:
-    """Class to analyze writing style with multi-language support"""
+    """
+    Class to analyze writing style with multi-language support
+
+    A text can be analysed in parts (e.g. one scene at a time): each part
+    gives a partial result (counts, lemmas, readability) and
+    merge_partials combines them into the result of the whole text.
+    """
+
+    # Bump when partial results change meaning (invalidates cached partials)
+    ANALYZER_VERSION = 1
 
     # Part of speech mapping (localized for multiple languages)
     POS_MAPPING = {
@@ -62,57 +72,111 @@ class StyleAnalyzer:
             dict: Dictionary with style metrics
         """
         try:
-            # Ottieni modello spaCy dal manager
-            nlp = nlp_manager.get_spacy_model(self.language)
+            partial = self.analyze_partial(text)
 
-            if nlp is None:
+            if partial is None:
                 return {
                     'error': f'spaCy model not available for language: {self.language}',
                     'success': False
                 }
 
-            doc = nlp(text)
+            return self.merge_partials([partial], project_type)
+        except Exception as e:
+            AppLogger.error(f"Error in StyleAnalyzer.analyze: {e}")
+            return {
+                'error': str(e),
+                'success': False
+            }
+
+    def analyze_partial(self, text):
+        """
+        Collect the style counts of a part of the text
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            dict: Partial result, or None if no spaCy model is available
+        """
+        # Parse condiviso con gli altri analizzatori (modello dal manager)
+        doc = analysis_context.get_doc(text, self.language)
+        if doc is None:
+            return None
+        return self.partial_from_doc(doc, text)
 
-            # Basic statistics
-            sentences = list(doc.sents)
-            words = [token for token in doc if not token.is_punct]
-            unique_words = set([token.lemma_.lower() for token in words])
+    def partial_from_doc(self, doc, text):
+        """
+        Collect the style counts of a parsed text
 
-            # Calculations
-            num_sentences = len(sentences)
-            num_words = len(words)
-            num_unique_words = len(unique_words)
+        Args:
+            doc: spaCy Doc of text
+            text: Parsed text (for the readability index)
 
-            avg_sentence_length = num_words / num_sentences if num_sentences > 0 else 0
-            diversity = num_unique_words / num_words if num_words > 0 else 0
+        Returns:
+            dict: Partial result (sentence and word counts, lemmas, part of
+                speech counts, readability)
+        """
+        # Basic statistics
+        words = [token for token in doc if not token.is_punct]
 
-            # Readability index (usa metodo appropriato per la lingua)
+        # Readability index (usa metodo appropriato per la lingua)
+        readability = 0.0
+        if words:
             if self.language == 'it':
                 readability = textstat.gulpease_index(text)
             else:
                 readability = textstat.flesch_reading_ease(text)
 
+        return {
+            'num_sentences': sum(1 for _ in doc.sents),
+            'num_words': len(words),
+            'lemmas': frozenset(token.lemma_.lower() for token in words),
             # Part of speech analysis
-            pos_counts = Counter([token.pos_ for token in doc if not token.is_punct])
+            'pos_counts': Counter(token.pos_ for token in words),
+            'readability': readability
+        }
 
-            return {
-                'num_sentences': num_sentences,
-                'num_words': num_words,
-                'unique_words': num_unique_words,
-                'avg_sentence_length': round(avg_sentence_length, 1),
-                'lexical_diversity': round(diversity * 100, 1),
-                'readability': round(readability, 1),
-                'pos_counts': dict(pos_counts.most_common(5)),
-                'language': self.language,
-                'project_type': project_type,
-                'success': True
-            }
-        except Exception as e:
-            AppLogger.error(f"Error in StyleAnalyzer.analyze: {e}")
-            return {
-                'error': str(e),
-                'success': False
-            }
+    def merge_partials(self, partials: List[Dict], project_type: Optional[ProjectType] = None):
+        """
+        Combine partial results into the result of the whole text
+
+        Counts are summed and lemmas united. The readability of the whole
+        is the average of the parts weighted by their words (the indexes
+        are computed by textstat on each part's text).
+
+        Args:
+            partials: Results of analyze_partial / partial_from_doc
+            project_type: Optional project type for context-aware analysis
+
+        Returns:
+            dict: Dictionary with style metrics
+        """
+        num_sentences = sum(partial['num_sentences'] for partial in partials)
+        num_words = sum(partial['num_words'] for partial in partials)
+        unique_words = set().union(*(partial['lemmas'] for partial in partials))
+        pos_counts = Counter()
+        for partial in partials:
+            pos_counts.update(partial['pos_counts'])
+
+        # Calculations
+        num_unique_words = len(unique_words)
+        avg_sentence_length = num_words / num_sentences if num_sentences > 0 else 0
+        diversity = num_unique_words / num_words if num_words > 0 else 0
+        readability = (sum(partial['readability'] * partial['num_words'] for partial in partials) / num_words
+                       if num_words > 0 else 0)
+
+        return {
+            'num_sentences': num_sentences,
+            'num_words': num_words,
+            'unique_words': num_unique_words,
+            'avg_sentence_length': round(avg_sentence_length, 1),
+            'lexical_diversity': round(diversity * 100, 1),
+            'readability': round(readability, 1),
+            'pos_counts': dict(pos_counts.most_common(5)),
+            'language': self.language,
+            'project_type': project_type,
+            'success': True
+        }
 
     def format_results(self, result):
         """
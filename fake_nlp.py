@@ -0,0 +1,49 @@
+"""
+Fake spaCy model for the analysis tests (no model download needed)
+
+Tokens are split on whitespace (periods are tokens of their own) and
+sentences on periods. Stop words are a few Italian articles: they are
+tagged DET, punctuation PUNCT and every other word NOUN.
+"""
+
+STOP_WORDS = ("il", "la", "e")
+
+
+class FakeToken:
+    """Minimal stand-in for a spaCy token"""
+
+    def __init__(self, text):
+        self.text = text
+        self.lemma_ = text.lower()
+        self.is_punct = not text.isalnum()
+        self.is_alpha = text.isalpha()
+        self.is_stop = text.lower() in STOP_WORDS
+        self.pos_ = "PUNCT" if self.is_punct else ("DET" if self.is_stop else "NOUN")
+
+
+class FakeDoc(list):
+    """Minimal stand-in for a spaCy Doc"""
+
+    def __init__(self, text):
+        super().__init__(FakeToken(word) for word in text.replace(".", " .").split())
+        self.text = text
+        self.sents = [sentence for sentence in text.split(".") if sentence.strip()]
+
+
+class FakeModel:
+    """Stands in for a spaCy model: records the texts it parses and the nlp.pipe calls"""
+
+    pipe_names = ['tok2vec', 'tagger', 'parser', 'ner']
+
+    def __init__(self):
+        self.parsed = []
+        self.pipe_calls = []
+
+    def __call__(self, text):
+        self.parsed.append(text)
+        return FakeDoc(text)
+
+    def pipe(self, texts, as_tuples=False, batch_size=1000, n_process=1, disable=()):
+        self.pipe_calls.append({'batch_size': batch_size, 'n_process': n_process, 'disable': list(disable)})
+        for text, context in texts:
+            yield self(text), context
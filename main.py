@@ -2,6 +2,7 @@
 TheNovelist - Writing Assistant
 Main file (main.py)
 """
+import multiprocessing
 import os
 import sys
 import traceback
@@ -237,4 +238,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Manuscript analysis parses in worker processes: in the bundled app
+    # they are started from this executable, which must not run main() again
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
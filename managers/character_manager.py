@@ -12,15 +12,18 @@ class CharacterManager:
     Manages CRUD operations for characters in a project
     """
 
-    def __init__(self, images_dir: str = None):
+    def __init__(self, images_dir: str = None, store=None):
         """
         Initialize the character manager
 
         Args:
             images_dir: Directory where character images are stored
+            store: Optional ProjectStore to extract images from on first access
         """
         self.characters: List[Character] = []
         self.images_dir = images_dir
+        self.store = store
+        self._dirty = False
 
     def set_images_directory(self, images_dir: str):
         """
@@ -41,6 +44,24 @@ class CharacterManager:
             characters_data: List of character dictionaries
         """
         self.characters = [Character.from_dict(data) for data in characters_data]
+        self._dirty = False
+
+    def is_dirty(self) -> bool:
+        """
+        Check if characters changed since they were loaded or last saved
+
+        Returns:
+            bool: True if characters.json needs to be rewritten
+        """
+        return self._dirty
+
+    def mark_dirty(self):
+        """Flag characters as modified (for in-place edits of Character objects)"""
+        self._dirty = True
+
+    def mark_clean(self):
+        """Flag characters as persisted"""
+        self._dirty = False
 
     def get_characters_data(self) -> List[dict]:
         """
@@ -68,6 +89,7 @@ class CharacterManager:
             images=[]
         )
         self.characters.append(character)
+        self._dirty = True
         return character
 
     def get_character(self, character_id: str) -> Optional[Character]:
@@ -116,6 +138,7 @@ class CharacterManager:
         if description is not None:
             character.description = description
 
+        self._dirty = True
         return character
 
     def delete_character(self, character_id: str) -> bool:
@@ -135,7 +158,7 @@ class CharacterManager:
         # Delete associated images
         if self.images_dir:
             for image_filename in character.images:
-                image_path = os.path.join(self.images_dir, image_filename)
+                image_path = self.get_image_path(image_filename)
                 if os.path.exists(image_path):
                     try:
                         os.remove(image_path)
@@ -144,6 +167,7 @@ class CharacterManager:
 
         # Remove from list
         self.characters = [c for c in self.characters if c.id != character_id]
+        self._dirty = True
         return True
 
     def add_image_to_character(self, character_id: str,
@@ -182,6 +206,7 @@ class CharacterManager:
 
             # Add to character's image list
             character.images.append(image_filename)
+            self._dirty = True
 
             return image_filename
         except Exception as e:
@@ -209,10 +234,11 @@ class CharacterManager:
 
         # Remove from character's list
         character.images.remove(image_filename)
+        self._dirty = True
 
         # Delete physical file
         if self.images_dir:
-            image_path = os.path.join(self.images_dir, image_filename)
+            image_path = self.get_image_path(image_filename)
             if os.path.exists(image_path):
                 try:
                     os.remove(image_path)
@@ -237,8 +263,27 @@ class CharacterManager:
 
         paths = []
         for image_filename in character.images:
-            image_path = os.path.join(self.images_dir, image_filename)
+            image_path = self.get_image_path(image_filename)
             if os.path.exists(image_path):
                 paths.append(image_path)
 
         return paths
+
+    def get_image_path(self, image_filename: str) -> Optional[str]:
+        """
+        Get the full path to an image, extracting it from the project archive if needed
+
+        Args:
+            image_filename: The image filename
+
+        Returns:
+            str or None: Full image path (None if images directory not set)
+        """
+        if not self.images_dir:
+            return None
+
+        image_path = os.path.join(self.images_dir, image_filename)
+        if self.store and not os.path.exists(image_path):
+            self.store.extract(f'images/{image_filename}')
+
+        return image_path
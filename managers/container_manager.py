@@ -3,7 +3,7 @@ Container Manager - Generic manager for all container types
 """
 import json
 import os
-from typing import List, Any, Type, Dict, Optional
+from typing import List, Any, Type, Dict, Optional, Iterable, Set
 from pathlib import Path
 from models.container_type import ContainerType
 from models.location import Location
@@ -27,8 +27,14 @@ class ContainerManager:
 
     Attributes:
         project_dir: Directory where project files are stored
+        store: Optional ProjectStore used to read containers not yet written to project_dir
         _containers: Dictionary mapping container types to their items
+        _index: Dictionary mapping container types to {item ID: position in _containers}
+        _deleted: Dictionary mapping container types to the number of deleted
+            items still held as None in _containers (see delete_item)
         _loaded: Set of container types that have been loaded
+        _generation: Dictionary mapping container types to a counter bumped on every change
+        _saved_generation: Dictionary mapping container types to the generation last persisted
     """
 
     # Mapping of container types to their model classes
@@ -42,16 +48,25 @@ class ContainerManager:
         ContainerType.NOTES: Note
     }
 
-    def __init__(self, project_dir: str):
+    # Containers with at least this many items are written without indentation
+    COMPACT_THRESHOLD = 500
+
+    def __init__(self, project_dir: str, store=None):
         """
         Initialize the container manager.
 
         Args:
             project_dir: Directory where project files are stored
+            store: Optional ProjectStore to read containers directly from the archive
         """
         self.project_dir = project_dir
+        self.store = store
         self._containers: Dict[ContainerType, List[Any]] = {}
+        self._index: Dict[ContainerType, Dict[str, int]] = {}
+        self._deleted: Dict[ContainerType, int] = {}
         self._loaded: set = set()
+        self._generation: Dict[ContainerType, int] = {}
+        self._saved_generation: Dict[ContainerType, int] = {}
 
     def load_container(self, container_type: ContainerType) -> List[Any]:
         """
@@ -65,52 +80,56 @@ class ContainerManager:
         """
         # Check if already loaded
         if container_type in self._loaded:
-            return self._containers.get(container_type, [])
+            return self._get_item_list(container_type)
 
         file_path = self._get_container_file_path(container_type)
+        filename = ContainerType.get_filename(container_type)
+        in_store = self.store is not None and self.store.has(filename)
 
         # If file doesn't exist, return empty list
-        if not os.path.exists(file_path):
+        if not os.path.exists(file_path) and not in_store:
             logger.info(f"Container {container_type.value} not found, initializing empty")
-            self._containers[container_type] = []
-            self._loaded.add(container_type)
+            self._set_items(container_type, [])
             return []
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if os.path.exists(file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                # Read straight from the project archive
+                data = self.store.read_json(filename)
 
             # Get the model class for this container type
             model_class = self.MODEL_CLASSES.get(container_type)
             if not model_class:
                 logger.error(f"No model class found for container type {container_type.value}")
-                self._containers[container_type] = []
-                self._loaded.add(container_type)
+                self._set_items(container_type, [])
                 return []
 
             # Deserialize each item
             items = [model_class.from_dict(item_data) for item_data in data]
-            self._containers[container_type] = items
-            self._loaded.add(container_type)
+            self._set_items(container_type, items)
 
             logger.info(f"Loaded {len(items)} items from {container_type.value}")
             return items
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error loading {container_type.value}: {e}")
-            self._containers[container_type] = []
-            self._loaded.add(container_type)
+            self._set_items(container_type, [])
             return []
         except Exception as e:
             logger.error(f"Error loading container {container_type.value}: {e}")
-            self._containers[container_type] = []
-            self._loaded.add(container_type)
+            self._set_items(container_type, [])
             return []
 
     def save_container(self, container_type: ContainerType) -> bool:
         """
         Save items from a specific container to disk.
 
+        Large containers (see COMPACT_THRESHOLD) are written without
+        indentation.
+
         Args:
             container_type: Type of container to save
 
@@ -128,11 +147,17 @@ class ContainerManager:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
             # Serialize all items
-            items_data = [item.to_dict() for item in self._containers[container_type]]
+            generation = self.get_generation(container_type)
+            items_data = self.get_container_data(container_type)
 
             # Write to file
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(items_data, f, ensure_ascii=False, indent=2)
+                if self.use_compact_format(container_type):
+                    json.dump(items_data, f, ensure_ascii=False, separators=(',', ':'))
+                else:
+                    json.dump(items_data, f, ensure_ascii=False, indent=2)
+
+            self.mark_clean(container_type, generation)
 
             logger.info(f"Saved {len(items_data)} items to {container_type.value}")
             return True
@@ -157,7 +182,7 @@ class ContainerManager:
             self.load_container(container_type)
 
         if container_type not in self._containers:
-            self._containers[container_type] = []
+            self._set_items(container_type, [])
 
         # Update timestamps
         if hasattr(item, 'created_date') and not item.created_date:
@@ -167,6 +192,8 @@ class ContainerManager:
 
         # Add item
         self._containers[container_type].append(item)
+        self._index[container_type][item.id] = len(self._containers[container_type]) - 1
+        self._touch(container_type)
         logger.info(f"Added item {item.id} to {container_type.value}")
 
         return item.id
@@ -189,11 +216,32 @@ class ContainerManager:
         if container_type not in self._containers:
             return None
 
-        for item in self._containers[container_type]:
-            if item.id == item_id:
-                return item
+        position = self._index[container_type].get(item_id)
+        if position is None:
+            return None
+        return self._containers[container_type][position]
+
+    def get_items(self, container_type: ContainerType, item_ids: Iterable[str]) -> List[Any]:
+        """
+        Get several items from a container in one call.
+
+        Args:
+            container_type: Type of container
+            item_ids: IDs of the items to retrieve (e.g. linked IDs)
+
+        Returns:
+            List[Any]: Items found, in the order of item_ids (unknown IDs are skipped)
+        """
+        # Ensure container is loaded
+        if container_type not in self._loaded:
+            self.load_container(container_type)
+
+        if container_type not in self._containers:
+            return []
 
-        return None
+        items = self._containers[container_type]
+        index = self._index[container_type]
+        return [items[index[item_id]] for item_id in item_ids if item_id in index]
 
     def get_all_items(self, container_type: ContainerType) -> List[Any]:
         """
@@ -209,7 +257,7 @@ class ContainerManager:
         if container_type not in self._loaded:
             self.load_container(container_type)
 
-        return self._containers.get(container_type, [])
+        return self._get_item_list(container_type)
 
     def update_item(self, container_type: ContainerType, item_id: str, updated_item: Any) -> bool:
         """
@@ -230,23 +278,53 @@ class ContainerManager:
         if container_type not in self._containers:
             return False
 
-        for i, item in enumerate(self._containers[container_type]):
-            if item.id == item_id:
-                # Update modified timestamp
-                if hasattr(updated_item, 'modified_date'):
-                    updated_item.modified_date = datetime.now().isoformat()
-
-                self._containers[container_type][i] = updated_item
-                logger.info(f"Updated item {item_id} in {container_type.value}")
-                return True
+        if self._replace_item(container_type, item_id, updated_item):
+            self._touch(container_type)
+            logger.info(f"Updated item {item_id} in {container_type.value}")
+            return True
 
         logger.warning(f"Item {item_id} not found in {container_type.value}")
         return False
 
+    def update_items(self, container_type: ContainerType, updated_items: Iterable[Any]) -> int:
+        """
+        Update several existing items of a container in one call.
+
+        Each item replaces the stored item with the same ID.
+
+        Args:
+            container_type: Type of container
+            updated_items: Updated items
+
+        Returns:
+            int: Number of items updated (unknown IDs are skipped)
+        """
+        # Ensure container is loaded
+        if container_type not in self._loaded:
+            self.load_container(container_type)
+
+        if container_type not in self._containers:
+            return 0
+
+        updated = 0
+        for item in updated_items:
+            if self._replace_item(container_type, item.id, item):
+                updated += 1
+
+        if updated:
+            self._touch(container_type)
+            logger.info(f"Updated {updated} items in {container_type.value}")
+        return updated
+
     def delete_item(self, container_type: ContainerType, item_id: str) -> bool:
         """
         Delete an item from a container.
 
+        The item's slot is left empty (None) rather than removed, so the
+        other items keep their positions and deleting is O(1) whatever
+        the container size. Empty slots are dropped in one pass the next
+        time the whole list is read (see _get_item_list).
+
         Args:
             container_type: Type of container
             item_id: ID of the item to delete
@@ -261,11 +339,15 @@ class ContainerManager:
         if container_type not in self._containers:
             return False
 
-        for i, item in enumerate(self._containers[container_type]):
-            if item.id == item_id:
-                del self._containers[container_type][i]
-                logger.info(f"Deleted item {item_id} from {container_type.value}")
-                return True
+        index = self._index[container_type]
+        position = index.pop(item_id, None)
+        if position is not None:
+            self._containers[container_type][position] = None
+            self._deleted[container_type] = self._deleted.get(container_type, 0) + 1
+
+            self._touch(container_type)
+            logger.info(f"Deleted item {item_id} from {container_type.value}")
+            return True
 
         logger.warning(f"Item {item_id} not found in {container_type.value}")
         return False
@@ -284,7 +366,7 @@ class ContainerManager:
         if container_type not in self._loaded:
             self.load_container(container_type)
 
-        return len(self._containers.get(container_type, []))
+        return len(self._index.get(container_type, {}))
 
     def clear_container(self, container_type: ContainerType):
         """
@@ -294,24 +376,221 @@ class ContainerManager:
             container_type: Type of container to clear
         """
         if container_type in self._containers:
-            self._containers[container_type] = []
+            self._set_items(container_type, [])
+            self._touch(container_type)
             logger.info(f"Cleared container {container_type.value}")
 
-    def save_all(self) -> bool:
+    def is_loaded(self, container_type: ContainerType) -> bool:
+        """
+        Check if a container has been loaded into memory.
+
+        Args:
+            container_type: Type of container
+
+        Returns:
+            bool: True if the container items are in memory
+        """
+        return container_type in self._loaded
+
+    def is_dirty(self, container_type: ContainerType) -> bool:
+        """
+        Check if a container changed since it was loaded or last saved.
+
+        Args:
+            container_type: Type of container
+
+        Returns:
+            bool: True if the container file needs to be rewritten
+        """
+        return self._generation.get(container_type, 0) != self._saved_generation.get(container_type, 0)
+
+    def get_generation(self, container_type: ContainerType) -> int:
         """
-        Save all loaded containers to disk.
+        Get the change generation of a container.
+
+        The generation grows on every change, so comparing two values
+        tells whether a container changed in between (e.g. while a
+        snapshot of it was being written).
+
+        Args:
+            container_type: Type of container
+
+        Returns:
+            int: Current generation
+        """
+        return self._generation.get(container_type, 0)
+
+    def mark_dirty(self, container_type: ContainerType):
+        """
+        Flag a container as modified (for in-place edits of its items).
+
+        Args:
+            container_type: Type of container
+        """
+        if container_type in self._loaded:
+            self._touch(container_type)
+
+    def mark_clean(self, container_type: ContainerType, generation: Optional[int] = None):
+        """
+        Flag a container as persisted.
+
+        Args:
+            container_type: Type of container
+            generation: Generation that was persisted (default: current); changes
+                        made after it keep the container dirty
+        """
+        if generation is None:
+            generation = self.get_generation(container_type)
+        self._saved_generation[container_type] = generation
+
+    def use_compact_format(self, container_type: ContainerType) -> bool:
+        """
+        Check if a container is large enough to be serialized without indentation.
+
+        Args:
+            container_type: Type of container
+
+        Returns:
+            bool: True for compact JSON
+        """
+        return len(self._index.get(container_type, {})) >= self.COMPACT_THRESHOLD
+
+    def get_container_data(self, container_type: ContainerType) -> List[dict]:
+        """
+        Serialize the items of a loaded container.
+
+        Args:
+            container_type: Type of container
+
+        Returns:
+            List[dict]: Item dictionaries, as written to the container file
+        """
+        return [item.to_dict() for item in self._get_item_list(container_type)]
+
+    def set_container_data(self, container_type: ContainerType, items_data: List[dict]) -> bool:
+        """
+        Replace the items of a container with serialized data (e.g. journal replay).
+
+        Args:
+            container_type: Type of container
+            items_data: Item dictionaries, as returned by get_container_data
+
+        Returns:
+            bool: True if the container was replaced
+        """
+        model_class = self.MODEL_CLASSES.get(container_type)
+        if not model_class:
+            logger.error(f"No model class found for container type {container_type.value}")
+            return False
+
+        self._set_items(container_type, [model_class.from_dict(item_data) for item_data in items_data])
+        self._touch(container_type)
+        return True
+
+    def get_dirty_containers(self) -> List[ContainerType]:
+        """
+        Get the container types that have unsaved changes.
+
+        Returns:
+            List[ContainerType]: Modified container types
+        """
+        return [ct for ct in self._loaded if self.is_dirty(ct)]
+
+    def get_changed_members(self) -> List[str]:
+        """
+        Get the archive member names of containers with unsaved changes.
+
+        Returns:
+            List[str]: Container file names (e.g. 'locations.json')
+        """
+        return [ContainerType.get_filename(ct) for ct in self.get_dirty_containers()]
+
+    def save_all(self, changed_members: Optional[Set[str]] = None) -> bool:
+        """
+        Save loaded containers that changed since they were loaded or last saved.
+
+        Args:
+            changed_members: Optional set receiving the file names written
 
         Returns:
             bool: True if all saves were successful, False otherwise
         """
         success = True
-        for container_type in self._loaded:
-            if container_type in self._containers:
-                if not self.save_container(container_type):
-                    success = False
+        for container_type in self.get_dirty_containers():
+            if self.save_container(container_type):
+                if changed_members is not None:
+                    changed_members.add(ContainerType.get_filename(container_type))
+            else:
+                success = False
 
         return success
 
+    def _set_items(self, container_type: ContainerType, items: List[Any]):
+        """
+        Install the item list of a container and build its ID index.
+
+        Args:
+            container_type: Type of container
+            items: Items of the container
+        """
+        self._containers[container_type] = items
+        self._index[container_type] = {item.id: i for i, item in enumerate(items)}
+        self._deleted.pop(container_type, None)
+        self._loaded.add(container_type)
+        self.mark_clean(container_type)
+
+    def _get_item_list(self, container_type: ContainerType) -> List[Any]:
+        """
+        Get the item list of a container, without the slots of deleted items.
+
+        Args:
+            container_type: Type of container
+
+        Returns:
+            List[Any]: Items of the container, in order
+        """
+        if self._deleted.pop(container_type, 0):
+            items = [item for item in self._containers[container_type] if item is not None]
+            self._containers[container_type] = items
+            self._index[container_type] = {item.id: i for i, item in enumerate(items)}
+        return self._containers.get(container_type, [])
+
+    def _touch(self, container_type: ContainerType):
+        """
+        Record a change to a container (bumps its generation).
+
+        Args:
+            container_type: Type of container
+        """
+        self._generation[container_type] = self._generation.get(container_type, 0) + 1
+
+    def _replace_item(self, container_type: ContainerType, item_id: str, updated_item: Any) -> bool:
+        """
+        Replace a stored item, keeping its position and the ID index in sync.
+
+        Args:
+            container_type: Type of container
+            item_id: ID of the item to replace
+            updated_item: New item
+
+        Returns:
+            bool: True if an item with item_id was found
+        """
+        index = self._index[container_type]
+        position = index.get(item_id)
+        if position is None:
+            return False
+
+        # Update modified timestamp
+        if hasattr(updated_item, 'modified_date'):
+            updated_item.modified_date = datetime.now().isoformat()
+
+        self._containers[container_type][position] = updated_item
+        if updated_item.id != item_id:
+            del index[item_id]
+            index[updated_item.id] = position
+        return True
+
     def _get_container_file_path(self, container_type: ContainerType) -> str:
         """
         Get the file path for a container type.
@@ -0,0 +1,165 @@
+"""
+Edit Journal - Append-only write-ahead log of unsaved project changes
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional
+from utils.logger import AppLogger
+
+
+class EditJournal:
+    """
+    Append-only journal stored beside a .tnp file (<name>.tnp.journal)
+
+    Each line is a JSON record holding the full new state of one piece of
+    the project (a scene's content, the manuscript index, a container).
+    Records are buffered and written in batches, each batch followed by a
+    single fsync, so journaling costs milliseconds instead of rewriting
+    the whole archive.
+
+    Replaying records in order is idempotent: the last record for a piece
+    wins. After a successful archive save the records it covers are
+    dropped; a clean close removes the journal altogether, so a journal
+    found when opening a project means the application did not shut down
+    properly.
+
+    Attributes:
+        path: Path of the journal file
+        last_sequence: Sequence number of the last appended record
+    """
+
+    SUFFIX = '.journal'
+
+    def __init__(self, project_path: str):
+        """
+        Initialize the journal for a project file
+
+        Args:
+            project_path: Path to the .tnp file
+        """
+        self.path = self.get_journal_path(project_path)
+        self.last_sequence = 0
+        self._pending: List[str] = []
+
+        for record in self.read_records():
+            self.last_sequence = max(self.last_sequence, record.get('seq', 0))
+
+    @classmethod
+    def get_journal_path(cls, project_path: str) -> str:
+        """Get the journal path for a project file"""
+        return project_path + cls.SUFFIX
+
+    def exists(self) -> bool:
+        """Check if the journal file exists"""
+        return os.path.exists(self.path)
+
+    def get_size(self) -> int:
+        """
+        Get the journal size on disk
+
+        Returns:
+            int: Size in bytes (0 if there is no journal)
+        """
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def append(self, record_type: str, key: Optional[str], data: Any) -> int:
+        """
+        Queue a record (written on next flush)
+
+        Args:
+            record_type: Kind of change (e.g. 'scene', 'container')
+            key: Identifier within the kind (scene ID, container type)
+            data: New full state (JSON-serializable)
+
+        Returns:
+            int: Sequence number of the record
+        """
+        self.last_sequence += 1
+        record = {'seq': self.last_sequence, 'type': record_type, 'key': key, 'data': data}
+        self._pending.append(json.dumps(record, ensure_ascii=False))
+        return self.last_sequence
+
+    def flush(self) -> int:
+        """
+        Write queued records and sync them to disk
+
+        Returns:
+            int: Number of records written
+
+        Raises:
+            OSError: If the journal cannot be written
+        """
+        if not self._pending:
+            return 0
+
+        count = len(self._pending)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(self._pending) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._pending = []
+        return count
+
+    def read_records(self) -> List[Dict[str, Any]]:
+        """
+        Read the records of the journal file
+
+        Reading stops at the first incomplete or invalid line, which is
+        what a crash in the middle of a write leaves behind.
+
+        Returns:
+            List[Dict[str, Any]]: Records in write order
+        """
+        records = []
+        if not self.exists():
+            return records
+
+        with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.endswith('\n'):
+                    AppLogger.warning(f"Journal {self.path}: ignoring truncated line {line_number}")
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    AppLogger.warning(f"Journal {self.path}: ignoring corrupted line {line_number}")
+                    break
+                if not isinstance(record, dict) or 'type' not in record:
+                    break
+                records.append(record)
+
+        return records
+
+    def truncate(self, up_to_sequence: int):
+        """
+        Drop the records already persisted in the archive
+
+        Args:
+            up_to_sequence: Last sequence number covered by the saved archive
+        """
+        self.flush()
+        remaining = [r for r in self.read_records() if r.get('seq', 0) > up_to_sequence]
+        if not remaining:
+            self.discard()
+            return
+
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in remaining:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def discard(self):
+        """Delete the journal and any queued record"""
+        self._pending = []
+        if self.exists():
+            try:
+                os.remove(self.path)
+            except OSError as e:
+                AppLogger.warning(f"Could not remove journal {self.path}: {e}")
@@ -24,16 +24,18 @@ class LocationManager:
         container_type: Always LOCATIONS
     """
 
-    def __init__(self, container_manager: ContainerManager, images_dir: str):
+    def __init__(self, container_manager: ContainerManager, images_dir: str, store=None):
         """
         Initialize the location manager.
 
         Args:
             container_manager: The container manager instance
             images_dir: Directory for storing images
+            store: Optional ProjectStore to extract images from on first access
         """
         self.container_manager = container_manager
         self.images_dir = images_dir
+        self.store = store
         self.container_type = ContainerType.LOCATIONS
 
         # Ensure images directory exists
@@ -131,7 +133,7 @@ class LocationManager:
 
         # Delete all associated images
         for image_filename in location.images:
-            image_path = os.path.join(self.images_dir, image_filename)
+            image_path = self.get_image_path(image_filename)
             try:
                 if os.path.exists(image_path):
                     os.remove(image_path)
@@ -213,7 +215,7 @@ class LocationManager:
             return False
 
         # Delete physical file
-        image_path = os.path.join(self.images_dir, image_filename)
+        image_path = self.get_image_path(image_filename)
         try:
             if os.path.exists(image_path):
                 os.remove(image_path)
@@ -234,13 +236,18 @@ class LocationManager:
         """
         Get the full path to an image file.
 
+        Images still inside the project archive are extracted on first access.
+
         Args:
             image_filename: Name of the image file
 
         Returns:
             str: Full path to the image
         """
-        return os.path.join(self.images_dir, image_filename)
+        image_path = os.path.join(self.images_dir, image_filename)
+        if self.store and not os.path.exists(image_path):
+            self.store.extract(f'images/{image_filename}')
+        return image_path
 
     def get_locations_by_type(self, location_type: str) -> List[Location]:
         """
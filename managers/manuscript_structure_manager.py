@@ -1,8 +1,8 @@
 """
 Manuscript Structure Manager - Manages the hierarchical structure of the manuscript
 """
-from typing import Optional, List, Tuple
-from models.manuscript_structure import ManuscriptStructure, Part, Chapter, Scene
+from typing import Optional, List, Tuple, Callable, Set, Dict, Any
+from models.manuscript_structure import ManuscriptStructure, ManuscriptText, Part, Chapter, Scene
 from utils.logger import AppLogger
 
 
@@ -11,16 +11,47 @@ class ManuscriptStructureManager:
     Manages manuscript structure with chapters and scenes
 
     Provides CRUD operations for chapters and scenes, maintaining order and consistency
+
+    Parts, chapters and scenes are resolved by ID through an index kept
+    up to date by the mutation methods below, so lookups do not walk the
+    structure. The reading order (sorted chapters and scenes, with the
+    position of each scene for previous/next navigation) is cached too and
+    rebuilt after the next add, delete or reorder. The structure must
+    therefore only be changed through this manager (or replaced with
+    set_structure/from_dict).
     """
 
-    def __init__(self, structure: ManuscriptStructure = None):
+    def __init__(self, structure: ManuscriptStructure = None,
+                 scene_loader: Callable[[str], Optional[str]] = None):
         """
         Initialize the manager
 
         Args:
             structure: Existing structure or None to create default
+            scene_loader: Optional callable (scene ID -> content) for structures
+                          loaded from a per-scene index; content is read lazily
         """
         self.structure = structure if structure else ManuscriptStructure.create_default()
+        self._dirty = False
+        # Scenes whose content member must be rewritten on next save
+        self._dirty_scenes: Set[str] = set()
+        # ID index: part ID -> part, chapter ID -> (part, chapter),
+        # scene ID -> (part, chapter, scene); part is None in legacy mode
+        self._part_index: Dict[str, Part] = {}
+        self._chapter_index: Dict[str, Tuple[Optional[Part], Chapter]] = {}
+        self._scene_index: Dict[str, Tuple[Optional[Part], Chapter, Scene]] = {}
+        # Reading order cache, None until built (see _get_reading_order)
+        self._ordered_tree = None
+        self._ordered_chapters: List[Chapter] = []
+        self._ordered_scenes: List[Scene] = []
+        self._part_chapters: Dict[str, List[Chapter]] = {}
+        self._chapter_scenes: Dict[str, List[Scene]] = {}
+        self._scene_positions: Dict[str, int] = {}
+        self._rebuild_index()
+
+        if scene_loader:
+            for scene in self._iter_all_scenes():
+                scene.set_content_loader(scene_loader)
 
     def get_structure(self) -> ManuscriptStructure:
         """Get the manuscript structure"""
@@ -29,6 +60,199 @@ class ManuscriptStructureManager:
     def set_structure(self, structure: ManuscriptStructure):
         """Set a new manuscript structure"""
         self.structure = structure
+        self._rebuild_index()
+        self._dirty = True
+        self.mark_all_scenes_dirty()
+
+    # ==================== Change Tracking ====================
+
+    def is_dirty(self) -> bool:
+        """
+        Check if the structure changed since it was loaded or last saved
+
+        Returns:
+            bool: True if the manuscript needs to be rewritten
+        """
+        return self._dirty
+
+    def mark_dirty(self):
+        """Flag the structure as modified (for in-place edits of synopsis/notes)"""
+        self._dirty = True
+
+    def mark_clean(self):
+        """Flag the structure and all scene contents as persisted"""
+        self._dirty = False
+        self._dirty_scenes.clear()
+
+    def get_dirty_scene_ids(self) -> Set[str]:
+        """
+        Get IDs of scenes whose content changed since load or last save
+
+        Returns:
+            Set[str]: Scene IDs
+        """
+        return set(self._dirty_scenes)
+
+    def mark_scenes_dirty(self, scene_ids: Set[str]):
+        """
+        Flag the content of some scenes as modified (e.g. after a failed save)
+
+        Args:
+            scene_ids: Scene IDs
+        """
+        self._dirty = True
+        self._dirty_scenes.update(scene_ids)
+
+    def mark_all_scenes_dirty(self):
+        """Flag every scene's content as modified (e.g. when migrating the archive layout)"""
+        self._dirty = True
+        self._dirty_scenes = {scene.id for scene in self._iter_all_scenes()}
+
+    def _iter_all_scenes(self):
+        """Internal: Iterate over scenes of the active structure (unsorted)"""
+        chapters = self.structure.chapters
+        if self.structure.use_parts_structure:
+            chapters = [chapter for part in self.structure.parts for chapter in part.chapters]
+        for chapter in chapters:
+            yield from chapter.scenes
+
+    # ==================== ID Index ====================
+
+    def _rebuild_index(self):
+        """Internal: Rebuild the ID index from the active structure"""
+        self._invalidate_reading_order()
+        self._part_index = {}
+        self._chapter_index = {}
+        self._scene_index = {}
+
+        if self.structure.use_parts_structure:
+            for part in self.structure.parts:
+                self._index_part(part)
+        else:
+            for chapter in self.structure.chapters:
+                self._index_chapter(None, chapter)
+
+    def _index_part(self, part: Part):
+        """Internal: Add a part, its chapters and scenes to the index"""
+        self._part_index[part.id] = part
+        for chapter in part.chapters:
+            self._index_chapter(part, chapter)
+
+    def _unindex_part(self, part: Part):
+        """Internal: Remove a part, its chapters and scenes from the index"""
+        self._part_index.pop(part.id, None)
+        for chapter in part.chapters:
+            self._unindex_chapter(chapter)
+
+    def _index_chapter(self, part: Optional[Part], chapter: Chapter):
+        """Internal: Add a chapter and its scenes to the index"""
+        self._chapter_index[chapter.id] = (part, chapter)
+        for scene in chapter.scenes:
+            self._scene_index[scene.id] = (part, chapter, scene)
+
+    def _unindex_chapter(self, chapter: Chapter):
+        """Internal: Remove a chapter and its scenes from the index"""
+        self._chapter_index.pop(chapter.id, None)
+        for scene in chapter.scenes:
+            self._scene_index.pop(scene.id, None)
+
+    def _invalidate_reading_order(self):
+        """Internal: Drop the cached reading order (structure changed)"""
+        self._ordered_tree = None
+
+    def _get_reading_order(self) -> List[Scene]:
+        """Internal: Build the reading order cache if needed and return the scenes"""
+        if self._ordered_tree is None:
+            self._ordered_tree = self.structure.get_ordered_tree()
+            self._ordered_chapters = []
+            self._ordered_scenes = []
+            self._part_chapters = {}
+            self._chapter_scenes = {}
+
+            for part, chapters in self._ordered_tree:
+                if part is not None:
+                    self._part_chapters[part.id] = [chapter for chapter, _ in chapters]
+                for chapter, scenes in chapters:
+                    self._ordered_chapters.append(chapter)
+                    self._chapter_scenes[chapter.id] = scenes
+                    self._ordered_scenes.extend(scenes)
+
+            self._scene_positions = {scene.id: i for i, scene in enumerate(self._ordered_scenes)}
+
+        return self._ordered_scenes
+
+    def locate(self, item_id: str) -> Optional[Tuple[Optional[Part], Optional[Chapter], Optional[Scene]]]:
+        """
+        Resolve the ID of a part, chapter or scene to its position
+
+        Args:
+            item_id: Part, chapter or scene ID
+
+        Returns:
+            Optional[Tuple]: (part, chapter, scene) with the levels below the
+                             item set to None (part is None in legacy mode),
+                             or None if the ID is unknown
+        """
+        if item_id in self._scene_index:
+            return self._scene_index[item_id]
+        if item_id in self._chapter_index:
+            part, chapter = self._chapter_index[item_id]
+            return part, chapter, None
+        if item_id in self._part_index:
+            return self._part_index[item_id], None, None
+        return None
+
+    def check_index(self) -> List[str]:
+        """
+        Compare the ID index and reading order with the structure (consistency check for tests)
+
+        Returns:
+            List[str]: Inconsistencies found (empty if the index is correct)
+        """
+        problems = []
+        expected_parts = {}
+        expected_chapters = {}
+        expected_scenes = {}
+
+        if self.structure.use_parts_structure:
+            owned_chapters = [(part, chapter) for part in self.structure.parts for chapter in part.chapters]
+            for part in self.structure.parts:
+                if part.id in expected_parts:
+                    problems.append(f"Duplicate part ID: {part.id}")
+                expected_parts[part.id] = part
+        else:
+            owned_chapters = [(None, chapter) for chapter in self.structure.chapters]
+
+        for part, chapter in owned_chapters:
+            if chapter.id in expected_chapters:
+                problems.append(f"Duplicate chapter ID: {chapter.id}")
+            expected_chapters[chapter.id] = (part, chapter)
+            for scene in chapter.scenes:
+                if scene.id in expected_scenes:
+                    problems.append(f"Duplicate scene ID: {scene.id}")
+                expected_scenes[scene.id] = (part, chapter, scene)
+
+        for kind, expected, actual in (('part', expected_parts, self._part_index),
+                                       ('chapter', expected_chapters, self._chapter_index),
+                                       ('scene', expected_scenes, self._scene_index)):
+            for item_id in expected.keys() - actual.keys():
+                problems.append(f"{kind.capitalize()} missing from index: {item_id}")
+            for item_id in actual.keys() - expected.keys():
+                problems.append(f"Stale {kind} in index: {item_id}")
+            for item_id in expected.keys() & actual.keys():
+                expected_entry = expected[item_id]
+                actual_entry = actual[item_id]
+                if not isinstance(expected_entry, tuple):
+                    expected_entry, actual_entry = (expected_entry,), (actual_entry,)
+                if any(a is not b for a, b in zip(expected_entry, actual_entry)):
+                    problems.append(f"Wrong position for {kind} in index: {item_id}")
+
+        if self._ordered_tree is not None:
+            expected_order = [scene.id for scene in self.structure.get_all_scenes()]
+            if expected_order != [scene.id for scene in self._ordered_scenes]:
+                problems.append("Stale reading order")
+
+        return problems
 
     # ==================== Part Operations ====================
 
@@ -58,11 +282,15 @@ class ManuscriptStructureManager:
         part.add_chapter(chapter)
 
         self.structure.add_part(part)
+        self._index_part(part)
+        self._invalidate_reading_order()
+        self._dirty_scenes.add(scene.id)
 
         # Reorder if needed
         if order < len(self.structure.parts) - 1:
             self._reorder_parts()
 
+        self._dirty = True
         AppLogger.debug(f"Added part: {title} (ID: {part.id})")
         return part
 
@@ -77,10 +305,11 @@ class ManuscriptStructureManager:
         Returns:
             bool: True if successful
         """
-        part = self.structure.get_part(part_id)
+        part = self._part_index.get(part_id)
         if part:
             old_title = part.title
             part.title = new_title
+            self._dirty = True
             AppLogger.debug(f"Renamed part: {old_title} -> {new_title}")
             return True
 
@@ -97,7 +326,7 @@ class ManuscriptStructureManager:
         Returns:
             bool: True if successful
         """
-        part = self.structure.get_part(part_id)
+        part = self._part_index.get(part_id)
         if not part:
             AppLogger.warning(f"Part not found for delete: {part_id}")
             return False
@@ -108,16 +337,16 @@ class ManuscriptStructureManager:
             return False
 
         # Clear current scene if it's in this part
-        if self.structure.current_scene_id:
-            for chapter in part.chapters:
-                for scene in chapter.scenes:
-                    if scene.id == self.structure.current_scene_id:
-                        self.structure.current_scene_id = None
-                        break
+        current = self._scene_index.get(self.structure.current_scene_id)
+        if current and current[0] is part:
+            self.structure.current_scene_id = None
 
         success = self.structure.remove_part(part_id)
         if success:
+            self._unindex_part(part)
+            self._invalidate_reading_order()
             self._reorder_parts()
+            self._dirty = True
             total_scenes = sum(len(c.scenes) for c in part.chapters)
             AppLogger.info(f"Deleted part: {part.title} ({len(part.chapters)} chapters, {total_scenes} scenes)")
 
@@ -140,7 +369,7 @@ class ManuscriptStructureManager:
         # Create new ordered list
         new_parts = []
         for part_id in part_ids_order:
-            part = self.structure.get_part(part_id)
+            part = self._part_index.get(part_id)
             if not part:
                 AppLogger.error(f"Part reorder failed: Invalid ID {part_id}")
                 return False
@@ -149,6 +378,8 @@ class ManuscriptStructureManager:
         # Update structure
         self.structure.parts = new_parts
         self._reorder_parts()
+        self._invalidate_reading_order()
+        self._dirty = True
 
         AppLogger.debug("Parts reordered successfully")
         return True
@@ -160,11 +391,25 @@ class ManuscriptStructureManager:
 
     def get_all_parts(self) -> List[Part]:
         """Get all parts in order"""
-        return sorted(self.structure.parts, key=lambda p: p.order)
+        self._get_reading_order()
+        return [part for part, _ in self._ordered_tree if part is not None]
 
     def get_part(self, part_id: str) -> Optional[Part]:
         """Get a part by ID"""
-        return self.structure.get_part(part_id)
+        return self._part_index.get(part_id)
+
+    def get_part_for_chapter(self, chapter_id: str) -> Optional[Part]:
+        """
+        Get the part that contains a chapter
+
+        Args:
+            chapter_id: Chapter ID
+
+        Returns:
+            Optional[Part]: Part containing the chapter (None in legacy mode)
+        """
+        entry = self._chapter_index.get(chapter_id)
+        return entry[0] if entry else None
 
     def get_chapters_in_part(self, part_id: str) -> List[Chapter]:
         """
@@ -176,10 +421,8 @@ class ManuscriptStructureManager:
         Returns:
             List[Chapter]: Chapters in order
         """
-        part = self.structure.get_part(part_id)
-        if part:
-            return sorted(part.chapters, key=lambda c: c.order)
-        return []
+        self._get_reading_order()
+        return list(self._part_chapters.get(part_id, []))
 
     def get_part_word_count(self, part_id: str) -> int:
         """
@@ -191,7 +434,7 @@ class ManuscriptStructureManager:
         Returns:
             int: Word count
         """
-        part = self.structure.get_part(part_id)
+        part = self._part_index.get(part_id)
         return part.get_total_word_count() if part else 0
 
     # ==================== Chapter Operations ====================
@@ -213,7 +456,7 @@ class ManuscriptStructureManager:
             if not part_id:
                 raise ValueError("part_id required when using parts structure")
 
-            part = self.structure.get_part(part_id)
+            part = self._part_index.get(part_id)
             if not part:
                 raise ValueError(f"Part not found: {part_id}")
 
@@ -223,12 +466,16 @@ class ManuscriptStructureManager:
             chapter = Chapter.create_new(title, order)
             scene = Scene.create_new("Scene 1", order=0)
             chapter.add_scene(scene)
+            self._dirty_scenes.add(scene.id)
 
             part.add_chapter(chapter)
+            self._index_chapter(part, chapter)
+            self._invalidate_reading_order()
 
             if order < len(part.chapters) - 1:
                 self._reorder_chapters_in_part(part_id)
 
+            self._dirty = True
             AppLogger.debug(f"Added chapter: {title} to part {part.title}")
             return chapter
         else:
@@ -239,12 +486,16 @@ class ManuscriptStructureManager:
             chapter = Chapter.create_new(title, order)
             scene = Scene.create_new("Scene 1", order=0)
             chapter.add_scene(scene)
+            self._dirty_scenes.add(scene.id)
 
             self.structure.add_chapter(chapter)
+            self._index_chapter(None, chapter)
+            self._invalidate_reading_order()
 
             if order < len(self.structure.chapters) - 1:
                 self._reorder_chapters()
 
+            self._dirty = True
             AppLogger.debug(f"Added chapter: {title} (ID: {chapter.id})")
             return chapter
 
@@ -259,10 +510,11 @@ class ManuscriptStructureManager:
         Returns:
             bool: True if successful
         """
-        chapter = self.structure.get_chapter(chapter_id)
+        chapter = self.get_chapter(chapter_id)
         if chapter:
             old_title = chapter.title
             chapter.title = new_title
+            self._dirty = True
             AppLogger.debug(f"Renamed chapter: {old_title} -> {new_title}")
             return True
 
@@ -279,21 +531,29 @@ class ManuscriptStructureManager:
         Returns:
             bool: True if successful
         """
-        chapter = self.structure.get_chapter(chapter_id)
-        if not chapter:
+        entry = self._chapter_index.get(chapter_id)
+        if not entry:
             AppLogger.warning(f"Chapter not found for delete: {chapter_id}")
             return False
+        part, chapter = entry
 
         # If this was the current scene's chapter, clear current scene
-        if self.structure.current_scene_id:
-            for scene in chapter.scenes:
-                if scene.id == self.structure.current_scene_id:
-                    self.structure.current_scene_id = None
-                    break
+        current = self._scene_index.get(self.structure.current_scene_id)
+        if current and current[1] is chapter:
+            self.structure.current_scene_id = None
 
-        success = self.structure.remove_chapter(chapter_id)
+        if part:
+            success = part.remove_chapter(chapter_id)
+        else:
+            success = self.structure.remove_chapter(chapter_id)
         if success:
-            self._reorder_chapters()
+            self._unindex_chapter(chapter)
+            self._invalidate_reading_order()
+            if part:
+                self._reorder_chapters_in_part(part.id)
+            else:
+                self._reorder_chapters()
+            self._dirty = True
             AppLogger.info(f"Deleted chapter: {chapter.title} ({len(chapter.scenes)} scenes)")
 
         return success
@@ -315,7 +575,7 @@ class ManuscriptStructureManager:
         # Create new ordered list
         new_chapters = []
         for chapter_id in chapter_ids_order:
-            chapter = self.structure.get_chapter(chapter_id)
+            chapter = self.get_chapter(chapter_id)
             if not chapter:
                 AppLogger.error(f"Chapter reorder failed: Invalid ID {chapter_id}")
                 return False
@@ -324,6 +584,8 @@ class ManuscriptStructureManager:
         # Update structure
         self.structure.chapters = new_chapters
         self._reorder_chapters()
+        self._invalidate_reading_order()
+        self._dirty = True
 
         AppLogger.debug("Chapters reordered successfully")
         return True
@@ -335,18 +597,33 @@ class ManuscriptStructureManager:
 
     def _reorder_chapters_in_part(self, part_id: str):
         """Internal: Fix chapter order numbers in a part"""
-        part = self.structure.get_part(part_id)
+        part = self._part_index.get(part_id)
         if part:
             for i, chapter in enumerate(part.chapters):
                 chapter.order = i
 
     def get_all_chapters(self) -> List[Chapter]:
         """Get all chapters in order (from all parts or direct)"""
-        return self.structure.get_all_chapters()
+        self._get_reading_order()
+        return list(self._ordered_chapters)
 
     def get_chapter(self, chapter_id: str) -> Optional[Chapter]:
         """Get a chapter by ID"""
-        return self.structure.get_chapter(chapter_id)
+        entry = self._chapter_index.get(chapter_id)
+        return entry[1] if entry else None
+
+    def get_chapter_for_scene(self, scene_id: str) -> Optional[Chapter]:
+        """
+        Get the chapter that contains a scene
+
+        Args:
+            scene_id: Scene ID
+
+        Returns:
+            Optional[Chapter]: Chapter containing the scene, or None
+        """
+        entry = self._scene_index.get(scene_id)
+        return entry[1] if entry else None
 
     # ==================== Scene Operations ====================
 
@@ -362,21 +639,28 @@ class ManuscriptStructureManager:
         Returns:
             Optional[Scene]: The created scene or None if chapter not found
         """
-        chapter = self.structure.get_chapter(chapter_id)
-        if not chapter:
+        entry = self._chapter_index.get(chapter_id)
+        if not entry:
             AppLogger.warning(f"Chapter not found for add scene: {chapter_id}")
             return None
+        part, chapter = entry
 
         if order is None:
             order = len(chapter.scenes)
 
         scene = Scene.create_new(title, order)
         chapter.add_scene(scene)
+        if part:
+            part.mark_word_count_changed(chapter)
+        self._scene_index[scene.id] = (part, chapter, scene)
+        self._invalidate_reading_order()
+        self._dirty_scenes.add(scene.id)
 
         # Reorder if needed
         if order < len(chapter.scenes) - 1:
             self._reorder_scenes(chapter_id)
 
+        self._dirty = True
         AppLogger.debug(f"Added scene: {title} to chapter {chapter.title}")
         return scene
 
@@ -391,10 +675,11 @@ class ManuscriptStructureManager:
         Returns:
             bool: True if successful
         """
-        scene = self.structure.get_scene(scene_id)
+        scene = self.get_scene(scene_id)
         if scene:
             old_title = scene.title
             scene.title = new_title
+            self._dirty = True
             AppLogger.debug(f"Renamed scene: {old_title} -> {new_title}")
             return True
 
@@ -412,10 +697,11 @@ class ManuscriptStructureManager:
             bool: True if successful
         """
         # Find the chapter containing this scene
-        chapter = self.structure.get_chapter_for_scene(scene_id)
-        if not chapter:
+        entry = self._scene_index.get(scene_id)
+        if not entry:
             AppLogger.warning(f"Scene not found for delete: {scene_id}")
             return False
+        part, chapter, scene = entry
 
         # Don't allow deleting the last scene in a chapter
         if len(chapter.scenes) <= 1:
@@ -426,11 +712,15 @@ class ManuscriptStructureManager:
         if self.structure.current_scene_id == scene_id:
             self.structure.current_scene_id = None
 
-        scene = self.structure.get_scene(scene_id)
         success = chapter.remove_scene(scene_id)
 
         if success:
+            if part:
+                part.mark_word_count_changed(chapter)
+            del self._scene_index[scene_id]
+            self._invalidate_reading_order()
             self._reorder_scenes(chapter.id)
+            self._dirty = True
             AppLogger.info(f"Deleted scene: {scene.title}")
 
         return success
@@ -446,7 +736,7 @@ class ManuscriptStructureManager:
         Returns:
             bool: True if successful
         """
-        chapter = self.structure.get_chapter(chapter_id)
+        chapter = self.get_chapter(chapter_id)
         if not chapter:
             AppLogger.error(f"Chapter not found for reorder: {chapter_id}")
             return False
@@ -467,13 +757,15 @@ class ManuscriptStructureManager:
         # Update chapter
         chapter.scenes = new_scenes
         self._reorder_scenes(chapter_id)
+        self._invalidate_reading_order()
+        self._dirty = True
 
         AppLogger.debug(f"Scenes reordered in chapter: {chapter.title}")
         return True
 
     def _reorder_scenes(self, chapter_id: str):
         """Internal: Fix scene order numbers in a chapter"""
-        chapter = self.structure.get_chapter(chapter_id)
+        chapter = self.get_chapter(chapter_id)
         if chapter:
             for i, scene in enumerate(chapter.scenes):
                 scene.order = i
@@ -488,14 +780,22 @@ class ManuscriptStructureManager:
         Returns:
             List[Scene]: Scenes in order
         """
-        chapter = self.structure.get_chapter(chapter_id)
-        if chapter:
-            return sorted(chapter.scenes, key=lambda s: s.order)
-        return []
+        self._get_reading_order()
+        return list(self._chapter_scenes.get(chapter_id, []))
+
+    def get_all_scenes(self) -> List[Scene]:
+        """
+        Get all scenes in reading order
+
+        Returns:
+            List[Scene]: Scenes of all chapters (and parts) in order
+        """
+        return list(self._get_reading_order())
 
     def get_scene(self, scene_id: str) -> Optional[Scene]:
         """Get a scene by ID"""
-        return self.structure.get_scene(scene_id)
+        entry = self._scene_index.get(scene_id)
+        return entry[2] if entry else None
 
     def update_scene_content(self, scene_id: str, content: str) -> bool:
         """
@@ -508,10 +808,20 @@ class ManuscriptStructureManager:
         Returns:
             bool: True if successful
         """
-        scene = self.structure.get_scene(scene_id)
-        if scene:
+        entry = self._scene_index.get(scene_id)
+        if entry:
+            part, chapter, scene = entry
+            if scene.content == content:
+                return True
+
             scene.update_content(content)
-            AppLogger.debug(f"Updated scene content: {scene.title} ({scene.word_count} words)")
+            # Running totals recount this scene on their next read
+            chapter.mark_word_count_changed(scene)
+            if part:
+                part.mark_word_count_changed(chapter)
+            self._dirty = True
+            self._dirty_scenes.add(scene_id)
+            AppLogger.debug(f"Updated scene content: {scene.title} ({len(content)} chars)")
             return True
 
         AppLogger.warning(f"Scene not found for content update: {scene_id}")
@@ -529,14 +839,10 @@ class ManuscriptStructureManager:
         Returns:
             Optional[Scene]: Next scene or None if at end
         """
-        all_scenes = self.structure.get_all_scenes()
-
-        for i, scene in enumerate(all_scenes):
-            if scene.id == current_scene_id:
-                if i < len(all_scenes) - 1:
-                    return all_scenes[i + 1]
-                break
-
+        all_scenes = self._get_reading_order()
+        position = self._scene_positions.get(current_scene_id)
+        if position is not None and position < len(all_scenes) - 1:
+            return all_scenes[position + 1]
         return None
 
     def get_previous_scene(self, current_scene_id: str) -> Optional[Scene]:
@@ -549,14 +855,10 @@ class ManuscriptStructureManager:
         Returns:
             Optional[Scene]: Previous scene or None if at beginning
         """
-        all_scenes = self.structure.get_all_scenes()
-
-        for i, scene in enumerate(all_scenes):
-            if scene.id == current_scene_id:
-                if i > 0:
-                    return all_scenes[i - 1]
-                break
-
+        all_scenes = self._get_reading_order()
+        position = self._scene_positions.get(current_scene_id)
+        if position is not None and position > 0:
+            return all_scenes[position - 1]
         return None
 
     def get_first_scene_in_chapter(self, chapter_id: str) -> Optional[Scene]:
@@ -569,7 +871,8 @@ class ManuscriptStructureManager:
         Returns:
             Optional[Scene]: First scene or None
         """
-        scenes = self.get_scenes_in_chapter(chapter_id)
+        self._get_reading_order()
+        scenes = self._chapter_scenes.get(chapter_id)
         return scenes[0] if scenes else None
 
     def set_current_scene(self, scene_id: str):
@@ -579,14 +882,16 @@ class ManuscriptStructureManager:
         Args:
             scene_id: Scene ID
         """
-        if self.structure.get_scene(scene_id):
-            self.structure.current_scene_id = scene_id
+        if scene_id in self._scene_index:
+            if self.structure.current_scene_id != scene_id:
+                self.structure.current_scene_id = scene_id
+                self._dirty = True
             AppLogger.debug(f"Current scene set to: {scene_id}")
 
     def get_current_scene(self) -> Optional[Scene]:
         """Get the current scene being edited"""
         if self.structure.current_scene_id:
-            return self.structure.get_scene(self.structure.current_scene_id)
+            return self.get_scene(self.structure.current_scene_id)
         return None
 
     # ==================== Statistics ====================
@@ -605,7 +910,7 @@ class ManuscriptStructureManager:
         Returns:
             int: Word count
         """
-        chapter = self.structure.get_chapter(chapter_id)
+        chapter = self.get_chapter(chapter_id)
         return chapter.get_total_word_count() if chapter else 0
 
     def get_scene_word_count(self, scene_id: str) -> int:
@@ -618,9 +923,29 @@ class ManuscriptStructureManager:
         Returns:
             int: Word count
         """
-        scene = self.structure.get_scene(scene_id)
+        scene = self.get_scene(scene_id)
         return scene.word_count if scene else 0
 
+    def word_count_summary(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the manuscript word counts
+
+        Built from the running totals of chapters and parts, so it is cheap
+        enough for the status bar, the statistics dashboard and analyzers.
+
+        Returns:
+            Dict[str, Any]: 'total' (words), 'scenes' (number of scenes),
+                            'chapters' and 'parts' (ID -> words, reading order)
+        """
+        chapters = {chapter.id: chapter.get_total_word_count() for chapter in self.get_all_chapters()}
+        parts = {part.id: part.get_total_word_count() for part in self.get_all_parts()}
+        return {
+            'total': sum(parts.values()) if self.structure.use_parts_structure else sum(chapters.values()),
+            'scenes': len(self._scene_index),
+            'chapters': chapters,
+            'parts': parts,
+        }
+
     # ==================== Serialization ====================
 
     def to_dict(self) -> dict:
@@ -630,9 +955,29 @@ class ManuscriptStructureManager:
     def from_dict(self, data: dict):
         """Load structure from dictionary"""
         self.structure = ManuscriptStructure.from_dict(data)
+        self._rebuild_index()
+        self._dirty = False
+        self._dirty_scenes.clear()
 
     # ==================== Utility ====================
 
+    def get_manuscript_text(self) -> ManuscriptText:
+        """
+        Get a lazy view of the manuscript text
+
+        The view always reflects the current structure and streams scenes
+        in reading order; nothing is concatenated until its text is used.
+
+        Returns:
+            ManuscriptText: Streaming manuscript view
+        """
+        return ManuscriptText(self._get_ordered_tree)
+
+    def _get_ordered_tree(self) -> list:
+        """Internal: Cached ordered tree (tree provider for ManuscriptText)"""
+        self._get_reading_order()
+        return self._ordered_tree
+
     def get_full_manuscript_text(self) -> str:
         """
         Get the complete manuscript as a single text string
@@ -640,4 +985,5 @@ class ManuscriptStructureManager:
         Returns:
             str: Complete manuscript text
         """
-        return self.structure.get_full_text()
+        self._get_reading_order()
+        return self.structure.get_full_text(self._ordered_tree)
@@ -1,17 +1,19 @@
 """
 Project management system - handles ZIP-based project files
 """
+import hashlib
 import json
 import os
 import shutil
 import tempfile
+import time
 import uuid
 import zipfile
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Set, Dict, Any, Callable
 from models.project import Project
 from models.project_type import ProjectType
 from models.character import Character
-from models.manuscript_structure import ManuscriptStructure, Chapter, Scene
+from models.manuscript_structure import ManuscriptStructure, ManuscriptText, Chapter, Scene
 from models.container_type import ContainerType
 from managers.character_manager import CharacterManager
 from managers.statistics_manager import StatisticsManager
@@ -24,6 +26,10 @@ from managers.source_manager import SourceManager
 from managers.note_manager import NoteManager
 from managers.worldbuilding_manager import WorldbuildingManager
 from managers.template_manager import TemplateManager
+from managers.project_store import ProjectStore
+from managers.project_saver import SaveSnapshot, write_snapshot
+from managers.edit_journal import EditJournal
+from managers.scene_revisions import SceneRevisionHistory
 from managers.rag.knowledge_base import KnowledgeBase
 from shared.license import feature_manager
 from shared.exceptions import FeatureLockedError
@@ -38,11 +44,26 @@ class ProjectManager:
 
     Project structure inside ZIP:
         manifest.json - Project metadata
-        manuscript.txt - Main text content
+        manuscript_structure.json - Parts/chapters/scenes index (no content)
+        scenes/<id>.html - Content of each scene
         characters.json - Character data
         images/ - Character images directory
+        manuscript.txt - Main text content (old projects, migrated on open)
+
+    Open projects are read through a ProjectStore: members are read from the
+    archive on demand and only modified files live in the temp directory.
+
+    Unsaved changes are written to an EditJournal beside the .tnp file
+    (journal_changes); the archive itself is only rewritten on explicit
+    saves and occasional compactions, and the journal is replayed when a
+    project is opened after a crash.
     """
 
+    # Rewrite the archive once the journal grows past this size...
+    JOURNAL_COMPACT_BYTES = 4 * 1024 * 1024
+    # ...or when the last archive save is older than this (seconds)
+    JOURNAL_COMPACT_INTERVAL = 30 * 60
+
     def __init__(self):
         """Initialize the project manager"""
         self.current_project: Optional[Project] = None
@@ -52,6 +73,19 @@ class ProjectManager:
         self.manuscript_structure_manager = ManuscriptStructureManager()
         self._temp_dir: Optional[str] = None
 
+        # Read-through view of the open archive; the temp dir only holds
+        # modified members and images extracted on demand
+        self._store: Optional[ProjectStore] = None
+        # Save whose snapshot is being written (see begin_save/finish_save)
+        self._pending_snapshot: Optional[SaveSnapshot] = None
+
+        # Write-ahead journal of unsaved changes
+        self._journal: Optional[EditJournal] = None
+        # Record key -> digest of the state last journaled, to skip repeats
+        self._journal_digests: Dict[str, str] = {}
+        self._recovered_changes = False
+        self._last_archive_save = 0.0
+
         # New container managers (Milestone 2)
         self.container_manager: Optional[ContainerManager] = None
         self.location_manager: Optional[LocationManager] = None
@@ -143,7 +177,6 @@ class ProjectManager:
 
             # Create project structure
             manifest_path = os.path.join(temp_dir, 'manifest.json')
-            manuscript_structure_path = os.path.join(temp_dir, 'manuscript_structure.json')
             characters_path = os.path.join(temp_dir, 'characters.json')
             images_dir = os.path.join(temp_dir, 'images')
 
@@ -186,14 +219,13 @@ class ProjectManager:
                         scene_data = next((s for s in template_data.get('scenes', []) if s['id'] == scene_id), None)
                         if scene_data:
                             # Scene requires id, title, content, order as minimum
-                            # word_count, created_date, modified_date are auto-calculated or defaulted
+                            # word_count is computed from the content, dates are defaulted
                             scene = Scene(
                                 id=scene_data['id'],
                                 title=scene_data['title'],
                                 synopsis=scene_data.get('description', ''),  # Use synopsis instead of description
                                 content=scene_data.get('content', ''),
-                                order=scene_data['order'],
-                                word_count=len(scene_data.get('content', '').split()) if scene_data.get('content') else 0
+                                order=scene_data['order']
                             )
                             chapter.scenes.append(scene)
 
@@ -223,16 +255,14 @@ class ProjectManager:
                             title=scene_data['title'],
                             synopsis=scene_data.get('description', ''),
                             content=scene_data.get('content', ''),
-                            order=scene_data['order'],
-                            word_count=len(scene_data.get('content', '').split()) if scene_data.get('content') else 0
+                            order=scene_data['order']
                         )
                         container_chapter.scenes.append(scene)
 
                     manuscript_structure.chapters.append(container_chapter)
 
-                # Write manuscript structure
-                with open(manuscript_structure_path, 'w', encoding='utf-8') as f:
-                    json.dump(manuscript_structure.to_dict(), f, indent=2)
+                # Write manuscript structure (index + one member per scene)
+                manuscript_members = self._write_manuscript_files(manuscript_structure, temp_dir)
 
                 # Write characters from template
                 characters_list = []
@@ -275,8 +305,7 @@ class ProjectManager:
                 AppLogger.debug(f"Creating project: type={project_type}, type.value={project_type.value if hasattr(project_type, 'value') else 'N/A'}, use_parts={use_parts}")
                 default_structure = ManuscriptStructure.create_default(use_parts=use_parts)
                 AppLogger.debug(f"Created structure: use_parts_structure={default_structure.use_parts_structure}, parts count={len(default_structure.parts)}, chapters count={len(default_structure.chapters)}")
-                with open(manuscript_structure_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_structure.to_dict(), f, indent=2)
+                manuscript_members = self._write_manuscript_files(default_structure, temp_dir)
 
                 # Write empty characters.json
                 with open(characters_path, 'w', encoding='utf-8') as f:
@@ -305,7 +334,8 @@ class ProjectManager:
             # Create ZIP file
             with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_DEFLATED) as zipf:
                 zipf.write(manifest_path, 'manifest.json')
-                zipf.write(manuscript_structure_path, 'manuscript_structure.json')
+                for member in manuscript_members:
+                    zipf.write(os.path.join(temp_dir, member), member)
                 zipf.write(characters_path, 'characters.json')
 
                 # Add all container files
@@ -334,7 +364,7 @@ class ProjectManager:
                 shutil.rmtree(temp_dir)
             return False
 
-    def open_project(self, filepath: str) -> Tuple[Optional[Project], Optional[str], Optional[List[Character]]]:
+    def open_project(self, filepath: str) -> Tuple[Optional[Project], Optional[ManuscriptText], Optional[List[Character]]]:
         """
         Open an existing project from a .tnp file
 
@@ -342,10 +372,12 @@ class ProjectManager:
             filepath: Path to the .tnp file
 
         Returns:
-            Tuple: (Project, manuscript_text, characters) or (None, None, None) on error
+            Tuple: (Project, manuscript_text, characters) or (None, None, None) on error;
+                   manuscript_text is a lazy view (str() builds the full text)
         """
         try:
             AppLogger.info(f"Opening project: {filepath}")
+            self._complete_pending_save()
 
             # Check if file exists
             if not os.path.exists(filepath):
@@ -358,15 +390,9 @@ class ProjectManager:
                 AppLogger.error(f"Project file too large: {file_size / (1024 * 1024):.2f}MB")
                 raise ValueError("Project file is too large (max 100MB)")
 
-            # Test ZIP integrity before extracting
+            # Check the archive directory (member data is verified by CRC as it is read)
             try:
                 with zipfile.ZipFile(filepath, 'r') as zipf:
-                    # Test all files in archive for corruption
-                    corrupt_file = zipf.testzip()
-                    if corrupt_file:
-                        AppLogger.error(f"Corrupted file in archive: {corrupt_file}")
-                        raise zipfile.BadZipFile(f"Archive contains corrupted file: {corrupt_file}")
-
                     # Check required files exist (manuscript files are optional for migration)
                     required_files = ['manifest.json', 'characters.json']
                     file_list = zipf.namelist()
@@ -376,23 +402,22 @@ class ProjectManager:
                             AppLogger.error(f"Missing required file: {required}")
                             raise ValueError(f"Project file is missing required file: {required}")
 
-                    AppLogger.debug("ZIP integrity check passed")
+                    AppLogger.debug("ZIP directory check passed")
 
             except zipfile.BadZipFile as e:
                 AppLogger.error(f"Bad ZIP file: {e}")
                 raise zipfile.BadZipFile("Project file is corrupted or not a valid archive")
 
-            # Extract to temporary directory
+            # Working directory only receives modified members and images on demand
             self._temp_dir = tempfile.mkdtemp()
-
-            with zipfile.ZipFile(filepath, 'r') as zipf:
-                zipf.extractall(self._temp_dir)
+            os.makedirs(os.path.join(self._temp_dir, 'images'), exist_ok=True)
+            self._close_store()
+            self._store = ProjectStore(filepath, self._temp_dir)
 
             # Read and validate manifest.json
             manifest_path = os.path.join(self._temp_dir, 'manifest.json')
             try:
-                with open(manifest_path, 'r', encoding='utf-8') as f:
-                    manifest_data = json.load(f)
+                manifest_data = self._store.read_json('manifest.json')
 
                 # Validate required fields in manifest
                 required_fields = ['title', 'author', 'created_date']
@@ -406,57 +431,63 @@ class ProjectManager:
                 # Migrate old project format if needed
                 manifest_data, migrations_applied = self._migrate_old_project(manifest_data)
                 if migrations_applied:
-                    # Save migrated manifest back to temp directory
+                    # Save migrated manifest to the working directory
                     with open(manifest_path, 'w', encoding='utf-8') as f:
                         json.dump(manifest_data, f, indent=2)
                     AppLogger.info(f"Applied {len(migrations_applied)} migrations to project")
 
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 AppLogger.error(f"Invalid JSON in manifest.json: {e}")
                 raise ValueError(f"Project manifest is corrupted (invalid JSON)")
 
             # Load or migrate manuscript structure
-            manuscript_structure_path = os.path.join(self._temp_dir, 'manuscript_structure.json')
             manuscript_structure = None
+            scene_loader = None
+            layout_migrations = []
 
-            if os.path.exists(manuscript_structure_path):
+            if self._store.has('manuscript_structure.json'):
                 # New format: load manuscript_structure.json
                 AppLogger.debug("Loading manuscript structure from JSON")
                 try:
-                    with open(manuscript_structure_path, 'r', encoding='utf-8') as f:
-                        structure_data = json.load(f)
+                    structure_data = self._store.read_json('manuscript_structure.json')
                     AppLogger.debug(f"Loaded structure_data: use_parts={structure_data.get('use_parts_structure')}, parts_count={len(structure_data.get('parts', []))}, chapters_count={len(structure_data.get('chapters', []))}")
                     manuscript_structure = ManuscriptStructure.from_dict(structure_data)
+                    if ManuscriptStructure.is_scene_layout(structure_data):
+                        # Scene content is read from scenes/<id>.html on first access
+                        scene_loader = self._load_scene_content
+                    else:
+                        layout_migrations = self._migrate_manuscript_layout(manuscript_structure)
                     AppLogger.debug(f"Parsed structure: use_parts_structure={manuscript_structure.use_parts_structure}, parts={len(manuscript_structure.parts)}, chapters={len(manuscript_structure.chapters)}")
                     AppLogger.info("Manuscript structure loaded successfully")
-                except json.JSONDecodeError as e:
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
                     AppLogger.error(f"Invalid JSON in manuscript_structure.json: {e}")
                     raise ValueError(f"Manuscript structure is corrupted (invalid JSON)")
             else:
                 # Old format: migrate from manuscript.txt
                 AppLogger.info("Old project format detected - migrating to new structure")
-                manuscript_path = os.path.join(self._temp_dir, 'manuscript.txt')
-                manuscript_text = ""
-
-                if os.path.exists(manuscript_path):
-                    with open(manuscript_path, 'r', encoding='utf-8') as f:
-                        manuscript_text = f.read()
+                manuscript_text = self._store.read_text('manuscript.txt') or ""
 
                 # Create structure with migrated content
                 manuscript_structure = self._migrate_old_manuscript(manuscript_text)
+                layout_migrations = self._migrate_manuscript_layout(manuscript_structure)
                 AppLogger.info("Migration completed successfully")
 
-            # Get full manuscript text for Project model (for backward compatibility)
-            manuscript_text = manuscript_structure.get_full_text()
+            # Setup manuscript structure manager
+            self.manuscript_structure_manager = ManuscriptStructureManager(manuscript_structure, scene_loader)
+            if layout_migrations:
+                # Every scene must be written to its own member on next save
+                self.manuscript_structure_manager.mark_all_scenes_dirty()
+
+            # Lazy manuscript view for the Project model (backward compatibility);
+            # scene contents stay deferred until someone reads the text
+            manuscript_text = self.manuscript_structure_manager.get_manuscript_text()
 
             # Create Project instance
             project = Project.from_dict(manifest_data, manuscript_text)
 
             # Read and validate characters.json
-            characters_path = os.path.join(self._temp_dir, 'characters.json')
             try:
-                with open(characters_path, 'r', encoding='utf-8') as f:
-                    characters_data = json.load(f)
+                characters_data = self._store.read_json('characters.json')
 
                 # Validate structure
                 if not isinstance(characters_data, dict) or 'characters' not in characters_data:
@@ -465,20 +496,22 @@ class ProjectManager:
 
                 AppLogger.debug("Characters validation passed")
 
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 AppLogger.error(f"Invalid JSON in characters.json: {e}")
                 raise ValueError(f"Character data is corrupted (invalid JSON)")
 
-            # Setup character manager
+            # Setup character manager (images are extracted when first requested)
             images_dir = os.path.join(self._temp_dir, 'images')
-            self.character_manager = CharacterManager(images_dir)
+            self.character_manager = CharacterManager(images_dir, store=self._store)
             self.character_manager.load_characters(characters_data.get('characters', []))
 
             # Load statistics
-            self.statistics_manager.load_statistics(self._temp_dir)
+            try:
+                self.statistics_manager.load_statistics_data(self._store.read_json('statistics.json'))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # If file is corrupted, start fresh
+                self.statistics_manager.load_statistics_data(None)
 
-            # Setup manuscript structure manager
-            self.manuscript_structure_manager = ManuscriptStructureManager(manuscript_structure)
 
             # Migrate containers for old projects (Milestone 2 - Step 4.3)
             container_migrations = self._migrate_containers(project.project_type)
@@ -486,25 +519,23 @@ class ProjectManager:
                 AppLogger.info(f"Container migrations applied: {', '.join(container_migrations)}")
 
             # Initialize container managers (Milestone 2)
-            self.container_manager = ContainerManager(self._temp_dir)
-            self.location_manager = LocationManager(self.container_manager, images_dir)
+            self.container_manager = ContainerManager(self._temp_dir, store=self._store)
+            self.location_manager = LocationManager(self.container_manager, images_dir, store=self._store)
             self.research_manager = ResearchManager(self.container_manager)
             self.timeline_manager = TimelineManager(self.container_manager)
             self.worldbuilding_manager = WorldbuildingManager(self.container_manager)
             self.source_manager = SourceManager(self.container_manager)
             self.note_manager = NoteManager(self.container_manager)
 
-            # Load available containers based on project type
-            available_containers = ContainerType.get_available_for_project_type(project.project_type)
-            for container_type in available_containers:
-                if container_type in [ContainerType.MANUSCRIPT, ContainerType.CHARACTERS]:
-                    continue  # Already loaded
+            # Containers are loaded on first use (or by prefetch_next_container
+            # once the UI is up), so opening is bound by the manuscript alone
 
-                try:
-                    items = self.container_manager.load_container(container_type)
-                    AppLogger.debug(f"Loaded {len(items)} items from {container_type.value}")
-                except Exception as e:
-                    AppLogger.warning(f"Could not load container {container_type.value}: {e}")
+            # Recover changes journaled before a crash
+            self._journal = EditJournal(filepath)
+            self._journal_digests = {}
+            self._last_archive_save = time.monotonic()
+            # (the manuscript view already reflects replayed scenes)
+            self._recovered_changes = self._replay_journal()
 
             # Update last opened date
             project.update_last_opened_date()
@@ -535,6 +566,7 @@ class ProjectManager:
         except FileNotFoundError as e:
             AppLogger.error(f"File not found: {e}")
             # Clean up
+            self._close_store()
             if self._temp_dir and os.path.exists(self._temp_dir):
                 shutil.rmtree(self._temp_dir)
                 self._temp_dir = None
@@ -545,6 +577,7 @@ class ProjectManager:
             AppLogger.error(f"File corruption detected: {e}")
 
             # Clean up temp directory
+            self._close_store()
             if self._temp_dir and os.path.exists(self._temp_dir):
                 shutil.rmtree(self._temp_dir)
                 self._temp_dir = None
@@ -569,6 +602,7 @@ class ProjectManager:
         except PermissionError as e:
             AppLogger.error(f"Permission denied: {e}")
             # Clean up
+            self._close_store()
             if self._temp_dir and os.path.exists(self._temp_dir):
                 shutil.rmtree(self._temp_dir)
                 self._temp_dir = None
@@ -577,6 +611,7 @@ class ProjectManager:
         except Exception as e:
             AppLogger.critical(f"Unexpected error opening project: {e}", exc_info=True)
             # Clean up
+            self._close_store()
             if self._temp_dir and os.path.exists(self._temp_dir):
                 shutil.rmtree(self._temp_dir)
                 self._temp_dir = None
@@ -607,6 +642,131 @@ class ProjectManager:
         AppLogger.info(f"Migrated manuscript: {scene.word_count} words in Chapter 1 > Scene 1")
         return structure
 
+    def _migrate_manuscript_layout(self, structure: ManuscriptStructure) -> List[str]:
+        """
+        Migrate a single-file manuscript (content inside manuscript_structure.json)
+        to the per-scene archive layout
+
+        Content is already in memory, so nothing is converted here: the caller
+        flags all scenes dirty and the next save writes the index plus one
+        scenes/<id>.html member per scene.
+
+        Args:
+            structure: Structure loaded from the old layout
+
+        Returns:
+            List[str]: List of migration messages
+        """
+        scene_count = len(structure.get_all_scenes())
+        AppLogger.info(f"Migration scheduled: {scene_count} scenes to per-scene archive layout")
+        return [f"Scheduled per-scene layout for {scene_count} scenes"]
+
+    def _load_scene_content(self, scene_id: str) -> str:
+        """
+        Read a scene's content from its own archive member (per-scene layout)
+
+        Args:
+            scene_id: Scene ID
+
+        Returns:
+            str: Scene content ('' if the member is missing)
+        """
+        content = self._store.read_text(ManuscriptStructure.get_scene_member_name(scene_id))
+        if content is None:
+            AppLogger.warning(f"Scene content missing from archive: {scene_id}")
+            return ""
+        return content
+
+    def _read_scene_history(self, scene_id: str, store: Optional[ProjectStore] = None) -> SceneRevisionHistory:
+        """Internal: Load a scene's revision history (from the project store by default)"""
+        store = store or self._store
+        member = SceneRevisionHistory.get_member_name(scene_id)
+        try:
+            data = store.read_bytes(member) if store else None
+        except (OSError, zipfile.BadZipFile) as e:
+            AppLogger.warning(f"Could not read revision history of scene {scene_id}: {e}")
+            data = None
+        return SceneRevisionHistory.from_json(scene_id, data)
+
+    def _make_revision_producer(self, scene_id: str, content: str, word_count: int,
+                                date: str) -> Callable[[], str]:
+        """
+        Internal: Build the deferred writer of a scene's revision history
+
+        The history is read and the delta computed on the saving thread;
+        only the scene content captured now is used.
+
+        Returns:
+            Callable[[], str]: Producer for SaveSnapshot.add_deferred()
+        """
+        store = self._store
+
+        def produce() -> str:
+            history = self._read_scene_history(scene_id, store)
+            history.add_revision(content, word_count, date)
+            return history.to_json()
+        return produce
+
+    def get_scene_revisions(self, scene_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the saved revisions of a scene
+
+        A revision is recorded each time a modified scene is saved, so the
+        list reflects the last completed save.
+
+        Args:
+            scene_id: Scene ID
+
+        Returns:
+            List[Dict]: {'number', 'date', 'word_count', 'kind'}, oldest first
+        """
+        if not self._store:
+            return []
+        return self._read_scene_history(scene_id).list_revisions()
+
+    def get_scene_revision_text(self, scene_id: str, number: int) -> Optional[str]:
+        """
+        Rebuild the content of a scene at a saved revision
+
+        Args:
+            scene_id: Scene ID
+            number: Revision number (see get_scene_revisions)
+
+        Returns:
+            Optional[str]: Scene content, or None if the revision is not stored
+        """
+        if not self._store:
+            return None
+        return self._read_scene_history(scene_id).materialise(number)
+
+    def _write_manuscript_files(self, structure: ManuscriptStructure, target_dir: str,
+                                scene_ids: Optional[Set[str]] = None) -> List[str]:
+        """
+        Write the manuscript index and scene content files (per-scene layout)
+
+        Args:
+            structure: Structure to write
+            target_dir: Directory mirroring the archive root
+            scene_ids: Scenes whose content must be written (None = all scenes)
+
+        Returns:
+            List[str]: Archive member names written
+        """
+        members = ['manuscript_structure.json']
+        with open(os.path.join(target_dir, 'manuscript_structure.json'), 'w', encoding='utf-8') as f:
+            json.dump(structure.to_index_dict(), f, indent=2)
+
+        os.makedirs(os.path.join(target_dir, 'scenes'), exist_ok=True)
+        for scene in structure.get_all_scenes():
+            if scene_ids is not None and scene.id not in scene_ids:
+                continue
+            member = ManuscriptStructure.get_scene_member_name(scene.id)
+            with open(os.path.join(target_dir, *member.split('/')), 'w', encoding='utf-8') as f:
+                f.write(scene.content or "")
+            members.append(member)
+
+        return members
+
     def _migrate_old_project(self, manifest_data: dict) -> Tuple[dict, List[str]]:
         """
         Migrate old project format to support new features (language, project_type, etc.)
@@ -682,7 +842,7 @@ class ProjectManager:
             container_path = os.path.join(self._temp_dir, filename)
 
             # If file doesn't exist, create it with an empty array
-            if not os.path.exists(container_path):
+            if not self._store.has(filename):
                 try:
                     with open(container_path, 'w', encoding='utf-8') as f:
                         json.dump([], f, indent=2)
@@ -699,6 +859,182 @@ class ProjectManager:
 
         return migrations_applied
 
+    # ==================== Edit Journal ====================
+
+    def journal_changes(self) -> int:
+        """
+        Append unsaved changes to the edit journal and sync it to disk
+
+        Only pieces whose state differs from what was last journaled are
+        written: the manuscript index, modified scenes, characters and
+        containers changed since the archive was written. This is the cheap auto-save; the archive is
+        rewritten by save_project/begin_save.
+
+        Returns:
+            int: Number of records written
+        """
+        if not self._journal or not self.current_project:
+            return 0
+
+        records = []
+        structure_manager = self.manuscript_structure_manager
+        if structure_manager.is_dirty():
+            self._stage_journal_record(records, 'structure', None,
+                                       structure_manager.get_structure().to_index_dict())
+
+        for scene_id in sorted(structure_manager.get_dirty_scene_ids()):
+            scene = structure_manager.get_scene(scene_id)
+            if scene:
+                self._stage_journal_record(records, 'scene', scene_id, scene.content or "")
+
+        if self.character_manager.is_dirty():
+            self._stage_journal_record(records, 'characters', None,
+                                       self.character_manager.get_characters_data())
+
+        if self.container_manager:
+            for container_type in self._get_unarchived_containers():
+                # The change generation tells if the container changed since
+                # it was last journaled, without serializing it
+                digest = f"generation:{self.container_manager.get_generation(container_type)}"
+                if self._journal_digests.get(f"container:{container_type.value}") != digest:
+                    records.append(('container', container_type.value,
+                                    self.container_manager.get_container_data(container_type), digest))
+
+        if not records:
+            return 0
+
+        try:
+            for record_type, key, data, _ in records:
+                self._journal.append(record_type, key, data)
+            written = self._journal.flush()
+        except OSError as e:
+            AppLogger.error(f"Failed to write edit journal: {e}")
+            return 0
+
+        for record_type, key, _, digest in records:
+            self._journal_digests[f"{record_type}:{key}"] = digest
+
+        AppLogger.debug(f"Journaled {written} changes")
+        return written
+
+    def _get_unarchived_containers(self) -> List[ContainerType]:
+        """
+        Internal: Loaded containers whose content is not in the archive yet
+
+        Besides dirty containers, these are the ones a view wrote to the
+        working directory with save(): the container manager then counts
+        them as clean, but only the next archive save picks the file up.
+
+        Returns:
+            List[ContainerType]: Containers to journal
+        """
+        unarchived = []
+        for container_type in ContainerType:
+            if not self.container_manager.is_loaded(container_type):
+                continue
+
+            filename = ContainerType.get_filename(container_type)
+            if self.container_manager.is_dirty(container_type) or (
+                    self._store and os.path.isfile(self._store.local_path(filename))
+                    and not self._store.is_unchanged(filename)):
+                unarchived.append(container_type)
+        return unarchived
+
+    def journal_needs_compaction(self) -> bool:
+        """
+        Check if the journaled changes should be folded into the archive
+
+        Returns:
+            bool: True if the journal is large or the archive save is old
+        """
+        if not self._journal:
+            return False
+
+        size = self._journal.get_size()
+        if size == 0:
+            return False
+
+        age = time.monotonic() - self._last_archive_save
+        return size > self.JOURNAL_COMPACT_BYTES or age > self.JOURNAL_COMPACT_INTERVAL
+
+    def has_recovered_changes(self) -> bool:
+        """
+        Check if the open project contains changes recovered from the journal
+
+        Returns:
+            bool: True until the recovered changes are saved
+        """
+        return self._recovered_changes
+
+    def _stage_journal_record(self, records: list, record_type: str, key: Optional[str], data: Any):
+        """Internal: Queue a journal record unless the same state was already journaled"""
+        if isinstance(data, str):
+            payload = data.encode('utf-8')
+        else:
+            payload = json.dumps(data, sort_keys=True).encode('utf-8')
+
+        digest = hashlib.sha1(payload).hexdigest()
+        if self._journal_digests.get(f"{record_type}:{key}") != digest:
+            records.append((record_type, key, data, digest))
+
+    def _replay_journal(self) -> bool:
+        """
+        Apply the records of a journal left behind by a crash
+
+        Returns:
+            bool: True if any change was recovered
+        """
+        records = self._journal.read_records()
+        if not records:
+            return False
+
+        AppLogger.warning(f"Recovering {len(records)} journaled changes for {self._journal.path}")
+        for record in records:
+            try:
+                self._apply_journal_record(record)
+            except Exception as e:
+                AppLogger.error(f"Could not replay journal record {record.get('seq')}: {e}", exc_info=True)
+
+        return True
+
+    def _apply_journal_record(self, record: Dict[str, Any]):
+        """
+        Apply one journal record to the managers (marking them dirty)
+
+        Args:
+            record: Record read from the journal
+        """
+        record_type = record['type']
+        key = record.get('key')
+        data = record.get('data')
+
+        if record_type == 'structure':
+            old_manager = self.manuscript_structure_manager
+            new_manager = ManuscriptStructureManager(ManuscriptStructure.from_dict(data), self._load_scene_content)
+            new_manager.mark_dirty()
+
+            # Keep content recovered by earlier records
+            for scene_id in old_manager.get_dirty_scene_ids():
+                old_scene = old_manager.get_scene(scene_id)
+                if old_scene and new_manager.get_scene(scene_id):
+                    new_manager.update_scene_content(scene_id, old_scene.content)
+                    new_manager.mark_scenes_dirty({scene_id})
+
+            self.manuscript_structure_manager = new_manager
+
+        elif record_type == 'scene':
+            self.manuscript_structure_manager.update_scene_content(key, data)
+
+        elif record_type == 'characters':
+            self.character_manager.load_characters(data)
+            self.character_manager.mark_dirty()
+
+        elif record_type == 'container':
+            self.container_manager.set_container_data(ContainerType(key), data)
+
+        else:
+            AppLogger.warning(f"Unknown journal record type: {record_type}")
+
     def _set_nlp_language(self, language: str):
         """
         Set the NLP language in the nlp_manager
@@ -714,31 +1050,58 @@ class ProjectManager:
             AppLogger.warning(f"Failed to set NLP language: {e}")
             # Non-fatal error, continue anyway
 
-    def save_project(self) -> bool:
+    def save_project(self, filepath: Optional[str] = None) -> bool:
         """
         Save the current project to its file (with error handling and backup)
 
+        Takes a snapshot and writes it on the calling thread. The UI uses
+        begin_save() + SaveThread + finish_save() to write in the background.
+
+        Args:
+            filepath: Optional new path for the project (save as)
+
         Returns:
             bool: True if successful, False otherwise
         """
+        snapshot = self.begin_save(filepath)
+        if snapshot is None:
+            return False
+
+        write_snapshot(snapshot)
+        return self.finish_save(snapshot)
+
+    def begin_save(self, filepath: Optional[str] = None,
+                   backup_operation: str = "save") -> Optional[SaveSnapshot]:
+        """
+        Capture a consistent snapshot of the project for saving
+
+        Must run on the thread that owns the managers. Only cheap copies are
+        made here (dicts and strings); serialization, compression, backup and
+        the file replacement happen in write_snapshot(). Managers are flagged
+        clean right away, so edits made while the snapshot is being written
+        are picked up by the next save; finish_save() restores the flags if
+        writing fails.
+
+        Args:
+            filepath: Optional new path for the project (save as)
+            backup_operation: Operation the backup of the old file is labelled with
+
+        Returns:
+            Optional[SaveSnapshot]: Snapshot to write, or None if no project is open
+        """
         if not self.current_project or not self.current_filepath:
             AppLogger.warning("Attempted to save project but no project is open")
-            return False
+            return None
+
+        # Archives are written one at a time, each based on the previous one
+        self._complete_pending_save()
 
         try:
             AppLogger.info(f"Saving project: {self.current_project.title}")
 
-            # Create backup before saving
-            if os.path.exists(self.current_filepath):
-                backup_path = BackupManager().create_backup(
-                    self.current_filepath,
-                    "auto_save"
-                )
-                if backup_path:
-                    AppLogger.debug(f"Created backup: {backup_path}")
-
-            # Update manuscript text in Project model for backward compatibility
-            self.current_project.manuscript_text = self.manuscript_structure_manager.get_full_manuscript_text()
+            # Manuscript text in Project model for backward compatibility (lazy view,
+            # the scenes are written one by one below)
+            self.current_project.manuscript_text = self.manuscript_structure_manager.get_manuscript_text()
 
             # Update modified date
             self.current_project.update_modified_date()
@@ -749,112 +1112,206 @@ class ProjectManager:
                 images_dir = os.path.join(self._temp_dir, 'images')
                 os.makedirs(images_dir, exist_ok=True)
                 self.character_manager.set_images_directory(images_dir)
+                self._close_store()
 
-            # Update files in temp directory
-            manifest_path = os.path.join(self._temp_dir, 'manifest.json')
-            manuscript_structure_path = os.path.join(self._temp_dir, 'manuscript_structure.json')
-            characters_path = os.path.join(self._temp_dir, 'characters.json')
+            if self._store is None:
+                self._store = ProjectStore(None, self._temp_dir)
 
-            # Write manifest.json
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(self.current_project.to_dict(), f, indent=2)
+            snapshot = SaveSnapshot(filepath or self.current_filepath, self._store.archive_path, self._store,
+                                    backup_operation=backup_operation)
+
+            # manifest.json changes on every save (modified date)
+            snapshot.add_json('manifest.json', self.current_project.to_dict())
+
+            # Manuscript index and the content of modified scenes
+            structure_manager = self.manuscript_structure_manager
+            structure = structure_manager.get_structure()
+            dirty_scene_ids = structure_manager.get_dirty_scene_ids()
+            if structure_manager.is_dirty() or not self._store.has('manuscript_structure.json'):
+                snapshot.add_json('manuscript_structure.json', structure.to_index_dict())
+            else:
+                self._add_stored_member(snapshot, 'manuscript_structure.json')
+
+            # Modified scenes also get a revision, appended to their history
+            # by the writer; other histories are copied unchanged
+            revision_date = self.current_project.modified_date
+            for scene in structure_manager.get_all_scenes():
+                member = ManuscriptStructure.get_scene_member_name(scene.id)
+                revisions_member = SceneRevisionHistory.get_member_name(scene.id)
+                if scene.id in dirty_scene_ids or not self._store.has(member):
+                    snapshot.add_text(member, scene.content or "")
+                    snapshot.add_deferred(revisions_member, self._make_revision_producer(
+                        scene.id, scene.content or "", scene.word_count, revision_date
+                    ))
+                else:
+                    self._add_stored_member(snapshot, member)
+                    self._add_stored_member(snapshot, revisions_member)
 
-            # Write manuscript_structure.json
-            with open(manuscript_structure_path, 'w', encoding='utf-8') as f:
-                json.dump(self.manuscript_structure_manager.to_dict(), f, indent=2)
+            if self.character_manager.is_dirty() or not self._store.has('characters.json'):
+                snapshot.add_json('characters.json', {
+                    'characters': self.character_manager.get_characters_data()
+                })
+            else:
+                self._add_stored_member(snapshot, 'characters.json')
 
-            # Write characters.json
-            characters_data = {
-                'characters': self.character_manager.get_characters_data()
+            if self.statistics_manager.is_dirty() or not self._store.has('statistics.json'):
+                snapshot.add_json('statistics.json', self.statistics_manager.stats.to_dict())
+            else:
+                self._add_stored_member(snapshot, 'statistics.json')
+
+            # Container files (Milestone 2): only changed containers are serialized
+            changed_containers = set(self.container_manager.get_changed_members()) if self.container_manager else set()
+            container_generations = {}
+            available_containers = ContainerType.get_available_for_project_type(self.current_project.project_type)
+            for container_type in available_containers:
+                if container_type in [ContainerType.MANUSCRIPT, ContainerType.CHARACTERS]:
+                    continue  # Already handled
+
+                filename = ContainerType.get_filename(container_type)
+                if filename in changed_containers:
+                    container_generations[container_type] = self.container_manager.get_generation(container_type)
+                    snapshot.add_json(filename, self.container_manager.get_container_data(container_type),
+                                      compact=self.container_manager.use_compact_format(container_type))
+                else:
+                    self._add_stored_member(snapshot, filename)
+
+            # Images, whether extracted, newly added or still in the archive
+            image_names = {name for name in self._store.archive_members() if name.startswith('images/')}
+            images_dir = os.path.join(self._temp_dir, 'images')
+            if os.path.exists(images_dir):
+                for image_file in os.listdir(images_dir):
+                    if os.path.isfile(os.path.join(images_dir, image_file)):
+                        image_names.add(f'images/{image_file}')
+
+            for name in sorted(image_names):
+                self._add_stored_member(snapshot, name)
+
+            # The snapshot owns these changes now (containers are flagged
+            # clean at the captured generation once the write succeeds)
+            snapshot.restore_state = {
+                'structure': structure_manager.is_dirty(),
+                'scenes': dirty_scene_ids,
+                'characters': self.character_manager.is_dirty(),
+                'statistics': self.statistics_manager.is_dirty(),
+                'container_generations': container_generations,
             }
-            with open(characters_path, 'w', encoding='utf-8') as f:
-                json.dump(characters_data, f, indent=2)
+            structure_manager.mark_clean()
+            self.character_manager.mark_clean()
+            self.statistics_manager.mark_clean()
 
-            # Write statistics.json
-            self.statistics_manager.save_statistics(self._temp_dir)
+            if self._journal:
+                snapshot.journal_sequence = self._journal.last_sequence
 
-            # Save all container managers (Milestone 2)
-            if self.container_manager:
-                self.container_manager.save_all()
-                AppLogger.debug("Saved all container managers")
+            self._pending_snapshot = snapshot
+            return snapshot
 
-            # Create new ZIP file
-            temp_zip = self.current_filepath + '.tmp'
-            with zipfile.ZipFile(temp_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add manifest, manuscript structure, characters, and statistics
-                zipf.write(manifest_path, 'manifest.json')
-                zipf.write(manuscript_structure_path, 'manuscript_structure.json')
-                zipf.write(characters_path, 'characters.json')
+        except Exception as e:
+            AppLogger.critical(f"Unexpected error preparing project save: {e}", exc_info=True)
+            return None
+
+    def finish_save(self, snapshot: SaveSnapshot) -> bool:
+        """
+        Complete a save once its snapshot has been written
+
+        On success the store switches to the new archive; on failure the
+        dirty flags captured by the snapshot are restored. Calling it again
+        for the same snapshot just returns the outcome.
+
+        Args:
+            snapshot: Snapshot returned by begin_save()
 
-                # Add statistics if exists
-                statistics_path = os.path.join(self._temp_dir, 'statistics.json')
-                if os.path.exists(statistics_path):
-                    zipf.write(statistics_path, 'statistics.json')
+        Returns:
+            bool: True if the project was saved
+        """
+        if snapshot is not self._pending_snapshot:
+            return snapshot.succeeded
+
+        snapshot.wait()
+        self._pending_snapshot = None
+
+        if not snapshot.succeeded:
+            AppLogger.error(f"Failed to save project: {snapshot.error}")
+            state = snapshot.restore_state
+            if state.get('structure'):
+                self.manuscript_structure_manager.mark_dirty()
+            if state.get('scenes'):
+                self.manuscript_structure_manager.mark_scenes_dirty(state['scenes'])
+            if state.get('characters'):
+                self.character_manager.mark_dirty()
+            if state.get('statistics'):
+                self.statistics_manager.mark_dirty()
+            return False
 
-                # Add all container JSON files (Milestone 2)
-                available_containers = ContainerType.get_available_for_project_type(self.current_project.project_type)
-                for container_type in available_containers:
-                    if container_type in [ContainerType.MANUSCRIPT, ContainerType.CHARACTERS]:
-                        continue  # Already handled
+        if self.container_manager:
+            for container_type, generation in snapshot.restore_state.get('container_generations', {}).items():
+                self.container_manager.mark_clean(container_type, generation)
 
-                    filename = ContainerType.get_filename(container_type)
-                    container_path = os.path.join(self._temp_dir, filename)
+        # Members written from memory are now in the archive; working
+        # copies of them would shadow the new content
+        for name in snapshot.get_memory_members():
+            path = self._store.local_path(name)
+            if os.path.isfile(path):
+                os.remove(path)
 
-                    if os.path.exists(container_path):
-                        zipf.write(container_path, filename)
-                        AppLogger.debug(f"Added container to ZIP: {filename}")
+        # The store now reads from the new archive
+        self._store.rebase(snapshot.target_path)
+        self._last_archive_save = time.monotonic()
+        self._recovered_changes = False
 
-                # Add images directory and its contents
-                images_dir = os.path.join(self._temp_dir, 'images')
-                if os.path.exists(images_dir):
-                    for filename in os.listdir(images_dir):
-                        file_path = os.path.join(images_dir, filename)
-                        if os.path.isfile(file_path):
-                            zipf.write(file_path, f'images/{filename}')
+        # Journaled changes covered by the archive are no longer needed
+        if self._journal:
+            try:
+                if snapshot.target_path != self.current_filepath:
+                    # Saved under a new name: start over beside the new file
+                    self._journal.discard()
+                    self._journal = EditJournal(snapshot.target_path)
+                    self._journal_digests = {}
                 else:
-                    # Add empty images directory
-                    zipf.writestr('images/', '')
+                    self._journal.truncate(snapshot.journal_sequence)
+            except OSError as e:
+                AppLogger.warning(f"Could not truncate edit journal: {e}")
 
-            # Replace old file with new one
-            if os.path.exists(self.current_filepath):
-                os.remove(self.current_filepath)
-            os.rename(temp_zip, self.current_filepath)
+        self.current_filepath = snapshot.target_path
 
-            AppLogger.info(f"Project saved successfully: {self.current_filepath}")
-            return True
+        AppLogger.info(f"Project saved successfully: {self.current_filepath}")
+        return True
 
-        except PermissionError as e:
-            AppLogger.error(f"Permission denied while saving project: {e}")
-            # Clean up temp zip if it exists
-            temp_zip = self.current_filepath + '.tmp'
-            if os.path.exists(temp_zip):
-                try:
-                    os.remove(temp_zip)
-                except:
-                    pass
-            return False
+    def is_saving(self) -> bool:
+        """
+        Check if a snapshot is waiting to be written or finished
 
-        except IOError as e:
-            AppLogger.error(f"IO error while saving project: {e}")
-            # Clean up temp zip if it exists
-            temp_zip = self.current_filepath + '.tmp'
-            if os.path.exists(temp_zip):
-                try:
-                    os.remove(temp_zip)
-                except:
-                    pass
-            return False
+        Returns:
+            bool: True while a save is in progress
+        """
+        return self._pending_snapshot is not None
 
-        except Exception as e:
-            AppLogger.critical(f"Unexpected error saving project: {e}", exc_info=True)
-            # Clean up temp zip if it exists
-            temp_zip = self.current_filepath + '.tmp'
-            if os.path.exists(temp_zip):
-                try:
-                    os.remove(temp_zip)
-                except:
-                    pass
-            return False
+    def _complete_pending_save(self):
+        """Internal: Wait for an in-flight save and apply its outcome"""
+        if self._pending_snapshot is not None:
+            self.finish_save(self._pending_snapshot)
+
+    def _add_stored_member(self, snapshot: SaveSnapshot, name: str):
+        """
+        Add a member that is not held in memory by any manager
+
+        The member is copied verbatim (no recompression) when the working
+        file is absent or identical to what was extracted; otherwise the
+        working file is compressed. Deleted or missing members are skipped.
+
+        Args:
+            snapshot: Snapshot being built
+            name: Archive member name
+        """
+        if self._store.is_unchanged(name):
+            snapshot.add_copy(name)
+        elif os.path.isfile(self._store.local_path(name)):
+            snapshot.add_file(name, self._store.local_path(name))
+
+    def _close_store(self):
+        """Release the archive handle held by the project store"""
+        if self._store:
+            self._store.close()
+            self._store = None
 
     def save_project_as(self, filepath: str) -> bool:
         """
@@ -874,20 +1331,23 @@ class ProjectManager:
         if not filepath.endswith('.tnp'):
             filepath += '.tnp'
 
-        old_filepath = self.current_filepath
-        self.current_filepath = filepath
-
-        success = self.save_project()
-
-        if not success:
-            self.current_filepath = old_filepath
-
-        return success
+        return self.save_project(filepath)
 
     def close_project(self):
         """
         Close the current project and clean up temporary files
         """
+        # A background save may still be reading the temp directory
+        self._complete_pending_save()
+
+        # The journal only survives crashes: closing keeps or discards
+        # changes explicitly
+        if self._journal:
+            self._journal.discard()
+            self._journal = None
+        self._journal_digests = {}
+        self._recovered_changes = False
+
         # End any active writing session
         if self.statistics_manager.is_session_active():
             self.statistics_manager.reset_session()
@@ -899,6 +1359,7 @@ class ProjectManager:
             except Exception as e:
                 print(f"Error cleaning up temp directory: {e}")
 
+        self._close_store()
         self._temp_dir = None
         self.current_project = None
         self.current_filepath = None
@@ -933,6 +1394,36 @@ class ProjectManager:
         """
         return self.current_project is not None
 
+    def prefetch_next_container(self) -> Optional[ContainerType]:
+        """
+        Load one container that has not been used yet
+
+        Containers are loaded on demand; calling this repeatedly while the
+        application is idle warms them up one at a time after the
+        manuscript is on screen.
+
+        Returns:
+            ContainerType or None: Container loaded, None if all are loaded
+        """
+        if not self.current_project or not self.container_manager:
+            return None
+
+        available_containers = ContainerType.get_available_for_project_type(self.current_project.project_type)
+        for container_type in available_containers:
+            if container_type in [ContainerType.MANUSCRIPT, ContainerType.CHARACTERS]:
+                continue  # Handled by their own managers
+            if self.container_manager.is_loaded(container_type):
+                continue
+
+            try:
+                items = self.container_manager.load_container(container_type)
+                AppLogger.debug(f"Prefetched {len(items)} items from {container_type.value}")
+            except Exception as e:
+                AppLogger.warning(f"Could not load container {container_type.value}: {e}")
+            return container_type
+
+        return None
+
     def get_temp_images_directory(self) -> Optional[str]:
         """
         Get the temporary images directory path
@@ -0,0 +1,260 @@
+"""
+Project Saver - Writes consistent project snapshots to .tnp archives
+"""
+import json
+import os
+import threading
+import zipfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from utils.logger import AppLogger
+from utils.backup_manager import BackupManager
+from utils.zip_utils import copy_raw_member
+
+
+def copy_json_data(data: Any) -> Any:
+    """
+    Copy the dicts and lists of JSON-like data, sharing immutable leaves
+
+    Cheaper than copy.deepcopy and enough to make a snapshot independent
+    of later in-place edits (strings and numbers cannot change).
+
+    Args:
+        data: Data made of dicts, lists and scalars
+
+    Returns:
+        Any: Structural copy of data
+    """
+    if isinstance(data, dict):
+        return {key: copy_json_data(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [copy_json_data(value) for value in data]
+    return data
+
+
+class SaveSnapshot:
+    """
+    Everything needed to write a project archive, captured at one instant
+
+    A snapshot is built on the UI thread from the managers (cheap: plain
+    dicts and strings) and written by write_snapshot(), usually on a
+    worker thread, while the user keeps editing.
+
+    Each entry is (member name, kind, payload):
+        MEMBER_JSON - payload is JSON data, serialized when written
+        MEMBER_COMPACT_JSON - same, serialized without indentation
+        MEMBER_TEXT - payload is text (scene content)
+        MEMBER_DEFERRED - payload is a callable returning the text, called
+                          by the writer (work kept off the UI thread)
+        MEMBER_FILE - payload is the path of a working file
+        MEMBER_COPY - member is copied verbatim from the source archive
+
+    Attributes:
+        target_path: Path of the .tnp file to write
+        source_path: Archive unchanged members are copied from (or None)
+        store: ProjectStore to release before replacing the target
+        backup_operation: Operation recorded with the backup of the target
+        entries: Archive members in write order
+        restore_state: Dirty flags cleared when the snapshot was taken
+        journal_sequence: Last edit journal record covered by the snapshot
+        error: Error message if writing failed
+    """
+
+    MEMBER_JSON = "json"
+    MEMBER_COMPACT_JSON = "compact_json"
+    MEMBER_TEXT = "text"
+    MEMBER_DEFERRED = "deferred"
+    MEMBER_FILE = "file"
+    MEMBER_COPY = "copy"
+
+    def __init__(self, target_path: str, source_path: Optional[str], store=None,
+                 create_backup: bool = True, backup_operation: str = "save"):
+        """
+        Initialize an empty snapshot
+
+        Args:
+            target_path: Path of the .tnp file to write
+            source_path: Current archive (source of copied members)
+            store: Optional ProjectStore reading from source_path
+            create_backup: Whether to back up the target before replacing it
+            backup_operation: Operation the backup is labelled with (save, auto_save...)
+        """
+        self.target_path = target_path
+        self.source_path = source_path
+        self.store = store
+        self.create_backup = create_backup
+        self.backup_operation = backup_operation
+        self.entries: List[Tuple[str, str, Any]] = []
+        self.restore_state: Dict[str, Any] = {}
+        self.journal_sequence = 0
+        self.error: Optional[str] = None
+        self.written = 0
+        self.copied = 0
+        self._done = threading.Event()
+
+    def add_json(self, name: str, data: Any, compact: bool = False):
+        """
+        Add a JSON member (data is copied now, serialized when written)
+
+        Args:
+            name: Archive member name
+            data: JSON-serializable data
+            compact: Serialize without indentation (large containers)
+        """
+        kind = self.MEMBER_COMPACT_JSON if compact else self.MEMBER_JSON
+        self.entries.append((name, kind, copy_json_data(data)))
+
+    def add_text(self, name: str, text: str):
+        """Add a text member"""
+        self.entries.append((name, self.MEMBER_TEXT, text))
+
+    def add_deferred(self, name: str, producer: Callable[[], str]):
+        """
+        Add a text member produced when the snapshot is written
+
+        The producer runs on the writing thread, so it must only use data
+        captured when the snapshot was taken (or thread-safe readers).
+
+        Args:
+            name: Archive member name
+            producer: Callable returning the member text
+        """
+        self.entries.append((name, self.MEMBER_DEFERRED, producer))
+
+    def add_file(self, name: str, path: str):
+        """Add a member read from a working file"""
+        self.entries.append((name, self.MEMBER_FILE, path))
+
+    def add_copy(self, name: str):
+        """Add a member copied unchanged from the source archive"""
+        self.entries.append((name, self.MEMBER_COPY, None))
+
+    def get_member_names(self) -> List[str]:
+        """Get the names of all members, in write order"""
+        return [name for name, _, _ in self.entries]
+
+    def get_memory_members(self) -> List[str]:
+        """Get the names of members written from in-memory data"""
+        return [name for name, kind, _ in self.entries
+                if kind in (self.MEMBER_JSON, self.MEMBER_COMPACT_JSON, self.MEMBER_TEXT,
+                            self.MEMBER_DEFERRED)]
+
+    def is_done(self) -> bool:
+        """Check if writing finished (successfully or not)"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the snapshot has been written
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            bool: True if writing finished
+        """
+        return self._done.wait(timeout)
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the snapshot was written and the target replaced"""
+        return self._done.is_set() and self.error is None
+
+
+def write_snapshot(snapshot: SaveSnapshot,
+                   progress_callback: Optional[Callable[[int, str], None]] = None) -> bool:
+    """
+    Write a snapshot to its target archive
+
+    Backs up the current file, serializes and compresses the members into
+    a temporary file next to the target, flushes it to disk and atomically
+    replaces the target. Safe to call from a worker thread: only the
+    snapshot and the filesystem are touched.
+
+    Args:
+        snapshot: Snapshot to write
+        progress_callback: Optional callable(percent, message)
+
+    Returns:
+        bool: True if the target was replaced
+    """
+    def report(percent: int, message: str):
+        if progress_callback:
+            progress_callback(percent, message)
+
+    temp_path = snapshot.target_path + '.tmp'
+    source = None
+
+    try:
+        if snapshot.create_backup and os.path.exists(snapshot.target_path):
+            report(0, "Creating backup...")
+            backup_path = BackupManager().create_backup(snapshot.target_path, snapshot.backup_operation)
+            if backup_path:
+                AppLogger.debug(f"Created backup: {backup_path}")
+
+        if snapshot.source_path and os.path.exists(snapshot.source_path):
+            source = zipfile.ZipFile(snapshot.source_path, 'r')
+        source_infos = {info.filename: info for info in source.infolist()} if source else {}
+
+        total = max(len(snapshot.entries), 1)
+        has_images = False
+
+        with open(temp_path, 'wb') as raw:
+            with zipfile.ZipFile(raw, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                for index, (name, kind, payload) in enumerate(snapshot.entries):
+                    report(5 + 90 * index // total, f"Saving {name}...")
+                    has_images = has_images or name.startswith('images/')
+
+                    if kind == SaveSnapshot.MEMBER_COPY:
+                        copy_raw_member(source, zipf, source_infos[name])
+                        snapshot.copied += 1
+                        continue
+
+                    if kind == SaveSnapshot.MEMBER_JSON:
+                        zipf.writestr(name, json.dumps(payload, indent=2, ensure_ascii=False))
+                    elif kind == SaveSnapshot.MEMBER_COMPACT_JSON:
+                        zipf.writestr(name, json.dumps(payload, ensure_ascii=False, separators=(',', ':')))
+                    elif kind == SaveSnapshot.MEMBER_TEXT:
+                        zipf.writestr(name, payload)
+                    elif kind == SaveSnapshot.MEMBER_DEFERRED:
+                        zipf.writestr(name, payload())
+                    else:
+                        zipf.write(payload, name)
+                    snapshot.written += 1
+
+                if not has_images:
+                    # Add empty images directory
+                    zipf.writestr('images/', '')
+
+            # Make sure the data is on disk before the old file goes away
+            raw.flush()
+            os.fsync(raw.fileno())
+
+        if source:
+            source.close()
+            source = None
+
+        # Some platforms refuse to replace a file that is still open
+        if snapshot.store:
+            snapshot.store.close()
+        os.replace(temp_path, snapshot.target_path)
+
+        report(100, "Project saved")
+        AppLogger.debug(
+            f"Archive members: {snapshot.written} written, {snapshot.copied} copied unchanged"
+        )
+        return True
+
+    except Exception as e:
+        AppLogger.error(f"Error writing project archive {snapshot.target_path}: {e}", exc_info=True)
+        snapshot.error = str(e) or e.__class__.__name__
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return False
+
+    finally:
+        if source:
+            source.close()
+        snapshot._done.set()
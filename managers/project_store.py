@@ -0,0 +1,253 @@
+"""
+Project Store - Read-through access to the members of a .tnp archive
+"""
+import json
+import os
+import shutil
+import threading
+import zipfile
+from typing import Optional, Dict, List, Tuple, Any
+from utils.logger import AppLogger
+
+
+class ProjectStore:
+    """
+    Read-through view over a project archive and its working directory
+
+    Members are read straight from the ZIP file, without extracting the
+    archive. Files written to the working directory shadow the archive
+    member with the same name, so managers can keep writing plain files
+    while unchanged members stay compressed inside the archive.
+
+    Binary members (images) are only extracted to the working directory
+    the first time somebody asks for a path to them.
+
+    Access to the archive handle is serialized, so a background save can
+    release it (close) while the UI thread keeps reading members.
+
+    Attributes:
+        archive_path: Path to the .tnp file backing the store
+        work_dir: Directory holding extracted and modified members
+    """
+
+    def __init__(self, archive_path: Optional[str], work_dir: str):
+        """
+        Initialize the store
+
+        Args:
+            archive_path: Path to the .tnp archive (None for a project never saved)
+            work_dir: Working directory for extracted/modified members
+        """
+        self.archive_path = archive_path
+        self.work_dir = work_dir
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._lock = threading.RLock()
+        self._infos: Dict[str, zipfile.ZipInfo] = {}
+        # (size, mtime_ns) of working files known to match the archive copy
+        self._synced: Dict[str, Tuple[int, int]] = {}
+        # Members extracted to the working directory on demand
+        self._extracted: set = set()
+
+        self._load_directory()
+
+    def _load_directory(self):
+        """Internal: Read the archive central directory (no member data)"""
+        self._infos = {}
+        if not self.archive_path or not os.path.exists(self.archive_path):
+            return
+
+        with zipfile.ZipFile(self.archive_path, 'r') as zipf:
+            for info in zipf.infolist():
+                if not info.is_dir():
+                    self._infos[info.filename] = info
+
+    def _get_zip(self) -> zipfile.ZipFile:
+        """Internal: Get (and lazily open) the archive handle"""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.archive_path, 'r')
+        return self._zip
+
+    def close(self):
+        """Release the archive file handle (required before replacing the file)"""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+    # ==================== Lookup ====================
+
+    def local_path(self, name: str) -> str:
+        """
+        Get the working directory path for a member
+
+        Args:
+            name: Archive member name (e.g. 'images/char_x_0.png')
+
+        Returns:
+            str: Absolute path in the working directory
+        """
+        return os.path.join(self.work_dir, *name.split('/'))
+
+    def in_archive(self, name: str) -> bool:
+        """Check if a member is stored in the backing archive"""
+        return name in self._infos
+
+    def has(self, name: str) -> bool:
+        """
+        Check if a member exists, either as a working file or in the archive
+
+        Args:
+            name: Archive member name
+
+        Returns:
+            bool: True if the member can be read
+        """
+        if os.path.isfile(self.local_path(name)):
+            return True
+        return name in self._infos and not self.is_deleted(name)
+
+    def archive_members(self) -> List[str]:
+        """
+        Get the names of all file members of the backing archive
+
+        Returns:
+            List[str]: Member names in archive order
+        """
+        return list(self._infos.keys())
+
+    def get_info(self, name: str) -> Optional[zipfile.ZipInfo]:
+        """Get the ZipInfo of an archive member, or None"""
+        return self._infos.get(name)
+
+    # ==================== Reading ====================
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        """
+        Read a member, preferring the working copy over the archive
+
+        Args:
+            name: Archive member name
+
+        Returns:
+            Optional[bytes]: Member content, or None if it does not exist
+        """
+        path = self.local_path(name)
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                return f.read()
+
+        if name not in self._infos or self.is_deleted(name):
+            return None
+
+        # ZipFile.read verifies the CRC, so corruption surfaces here
+        with self._lock:
+            return self._get_zip().read(name)
+
+    def read_text(self, name: str) -> Optional[str]:
+        """Read a member as UTF-8 text (None if missing)"""
+        data = self.read_bytes(name)
+        return data.decode('utf-8') if data is not None else None
+
+    def read_json(self, name: str) -> Optional[Any]:
+        """
+        Read and parse a JSON member
+
+        Args:
+            name: Archive member name
+
+        Returns:
+            Optional[Any]: Parsed JSON, or None if the member does not exist
+
+        Raises:
+            json.JSONDecodeError: If the member is not valid JSON
+        """
+        data = self.read_bytes(name)
+        if data is None:
+            return None
+        return json.loads(data.decode('utf-8'))
+
+    def extract(self, name: str) -> Optional[str]:
+        """
+        Make sure a member exists as a file in the working directory
+
+        Args:
+            name: Archive member name
+
+        Returns:
+            Optional[str]: Path of the working file, or None if the member does not exist
+        """
+        path = self.local_path(name)
+        if os.path.isfile(path):
+            return path
+
+        if name not in self._infos or name in self._extracted:
+            # Unknown, or extracted earlier and deleted since
+            return None
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            with self._get_zip().open(name) as source, open(path, 'wb') as target:
+                shutil.copyfileobj(source, target)
+
+        self._extracted.add(name)
+        self.mark_synced(name)
+        AppLogger.debug(f"Extracted on demand: {name}")
+        return path
+
+    # ==================== Change Tracking ====================
+
+    def mark_synced(self, name: str):
+        """
+        Record that the working file of a member matches the archive copy
+
+        Args:
+            name: Archive member name
+        """
+        path = self.local_path(name)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            self._synced[name] = (stat.st_size, stat.st_mtime_ns)
+
+    def is_unchanged(self, name: str) -> bool:
+        """
+        Check if an archive member can be reused as-is
+
+        Args:
+            name: Archive member name
+
+        Returns:
+            bool: True if the member is in the archive and its working file
+                  is either absent or identical to what was extracted
+        """
+        if name not in self._infos or self.is_deleted(name):
+            return False
+
+        path = self.local_path(name)
+        if not os.path.isfile(path):
+            return True
+
+        stat = os.stat(path)
+        return self._synced.get(name) == (stat.st_size, stat.st_mtime_ns)
+
+    def is_deleted(self, name: str) -> bool:
+        """Check if a member was extracted and its working file removed since"""
+        return name in self._extracted and not os.path.isfile(self.local_path(name))
+
+    def rebase(self, archive_path: str):
+        """
+        Point the store at a freshly written archive
+
+        All working files are assumed to be identical to the new archive
+        members they were written to.
+
+        Args:
+            archive_path: Path to the new backing archive
+        """
+        self.close()
+        self.archive_path = archive_path
+        self._load_directory()
+
+        self._synced = {}
+        self._extracted = {name for name in self._extracted if os.path.isfile(self.local_path(name))}
+        for name in self._infos:
+            self.mark_synced(name)
@@ -0,0 +1,231 @@
+"""
+Scene Revisions - Compact per-scene revision history (snapshots + deltas)
+"""
+import base64
+import json
+import zlib
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional
+from utils.logger import AppLogger
+
+
+class SceneRevisionHistory:
+    """
+    Revision history of one scene, stored as revisions/<scene id>.json
+
+    Every SNAPSHOT_INTERVAL revisions the full text is stored; the
+    revisions in between only hold a line-level delta against the one
+    before. Payloads are zlib-compressed, so a revision that changes a
+    paragraph costs a few hundred bytes however long the scene is.
+
+    At most MAX_REVISIONS revisions are kept: when the oldest ones are
+    dropped, the first remaining revision is rewritten as a snapshot.
+    Revision numbers keep increasing and are never reused.
+
+    Attributes:
+        scene_id: ID of the scene
+        revisions: Revision records, oldest first
+    """
+
+    FORMAT_VERSION = 1
+    SNAPSHOT_INTERVAL = 10
+    MAX_REVISIONS = 50
+
+    KIND_SNAPSHOT = "snapshot"
+    KIND_DELTA = "delta"
+
+    def __init__(self, scene_id: str, revisions: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize the history
+
+        Args:
+            scene_id: ID of the scene
+            revisions: Stored revision records (see to_json)
+        """
+        self.scene_id = scene_id
+        self.revisions: List[Dict[str, Any]] = revisions or []
+
+    @staticmethod
+    def get_member_name(scene_id: str) -> str:
+        """
+        Get the archive member name holding a scene's revisions
+
+        Args:
+            scene_id: Scene ID
+
+        Returns:
+            str: Member name (e.g. 'revisions/<id>.json')
+        """
+        return f"revisions/{scene_id}.json"
+
+    @classmethod
+    def from_json(cls, scene_id: str, data: Optional[bytes]) -> 'SceneRevisionHistory':
+        """
+        Load a history from its archive member
+
+        An unreadable member starts a new history rather than blocking
+        the save that appends to it.
+
+        Args:
+            scene_id: Scene ID
+            data: Member content (None if the scene has no history yet)
+
+        Returns:
+            SceneRevisionHistory: Loaded (or empty) history
+        """
+        if not data:
+            return cls(scene_id)
+
+        try:
+            stored = json.loads(data)
+            if stored.get('version') != cls.FORMAT_VERSION:
+                raise ValueError(f"unsupported version {stored.get('version')}")
+            return cls(scene_id, list(stored['revisions']))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            AppLogger.warning(f"Discarding unreadable revision history of scene {scene_id}: {e}")
+            return cls(scene_id)
+
+    def to_json(self) -> str:
+        """Serialize the history (compact JSON)"""
+        return json.dumps({
+            'version': self.FORMAT_VERSION,
+            'scene_id': self.scene_id,
+            'revisions': self.revisions,
+        }, ensure_ascii=False, separators=(',', ':'))
+
+    # ==================== Encoding ====================
+
+    @staticmethod
+    def _pack(data: Any) -> str:
+        """Internal: Compress JSON data to a base64 string"""
+        raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return base64.b64encode(zlib.compress(raw, 9)).decode('ascii')
+
+    @staticmethod
+    def _unpack(payload: str) -> Any:
+        """Internal: Inverse of _pack"""
+        return json.loads(zlib.decompress(base64.b64decode(payload)).decode('utf-8'))
+
+    @staticmethod
+    def _make_delta(old_text: str, new_text: str) -> List[list]:
+        """
+        Internal: Line-level delta turning old_text into new_text
+
+        Returns:
+            List[list]: [start, end, new lines] replacements on the old lines
+        """
+        old_lines = old_text.splitlines(keepends=True)
+        new_lines = new_text.splitlines(keepends=True)
+        matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        return [[i1, i2, new_lines[j1:j2]]
+                for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+
+    @staticmethod
+    def _apply_delta(text: str, delta: List[list]) -> str:
+        """Internal: Apply a delta made by _make_delta"""
+        lines = text.splitlines(keepends=True)
+        # Replace from the end so earlier offsets stay valid
+        for start, end, new_lines in reversed(delta):
+            lines[start:end] = new_lines
+        return ''.join(lines)
+
+    def _make_snapshot(self, number: int, date: str, word_count: int, text: str) -> Dict[str, Any]:
+        """Internal: Build a snapshot record"""
+        return {'number': number, 'date': date, 'word_count': word_count,
+                'kind': self.KIND_SNAPSHOT, 'data': self._pack(text)}
+
+    # ==================== Lookup ====================
+
+    def list_revisions(self) -> List[Dict[str, Any]]:
+        """
+        Get the stored revisions, oldest first
+
+        Returns:
+            List[Dict]: {'number', 'date', 'word_count', 'kind'} for each revision
+        """
+        return [{key: revision[key] for key in ('number', 'date', 'word_count', 'kind')}
+                for revision in self.revisions]
+
+    def get_latest_number(self) -> int:
+        """Get the number of the newest revision (0 if there is none)"""
+        return self.revisions[-1]['number'] if self.revisions else 0
+
+    def _find(self, number: int) -> int:
+        """Internal: Position of a revision number (-1 if not stored)"""
+        for position, revision in enumerate(self.revisions):
+            if revision['number'] == number:
+                return position
+        return -1
+
+    def _materialise_at(self, position: int) -> str:
+        """Internal: Text of the revision at a position"""
+        start = position
+        while self.revisions[start]['kind'] != self.KIND_SNAPSHOT:
+            start -= 1
+
+        text = self._unpack(self.revisions[start]['data'])
+        for revision in self.revisions[start + 1:position + 1]:
+            text = self._apply_delta(text, self._unpack(revision['data']))
+        return text
+
+    def materialise(self, number: int) -> Optional[str]:
+        """
+        Rebuild the text of a revision
+
+        Args:
+            number: Revision number (see list_revisions)
+
+        Returns:
+            Optional[str]: Scene content at that revision, or None if not stored
+        """
+        position = self._find(number)
+        if position < 0:
+            return None
+        return self._materialise_at(position)
+
+    # ==================== Recording ====================
+
+    def add_revision(self, text: str, word_count: int = 0, date: Optional[str] = None) -> Optional[int]:
+        """
+        Record a new revision of the scene
+
+        Args:
+            text: Scene content
+            word_count: Word count of the content
+            date: ISO date of the revision (default: now)
+
+        Returns:
+            Optional[int]: New revision number, or None if text equals the latest revision
+        """
+        date = date or datetime.now().isoformat()
+        number = self.get_latest_number() + 1
+
+        if not self.revisions or number % self.SNAPSHOT_INTERVAL == 1:
+            if self.revisions and self._materialise_at(len(self.revisions) - 1) == text:
+                return None
+            self.revisions.append(self._make_snapshot(number, date, word_count, text))
+        else:
+            latest = self._materialise_at(len(self.revisions) - 1)
+            if latest == text:
+                return None
+            self.revisions.append({'number': number, 'date': date, 'word_count': word_count,
+                                   'kind': self.KIND_DELTA,
+                                   'data': self._pack(self._make_delta(latest, text))})
+
+        self._prune()
+        return number
+
+    def _prune(self):
+        """Internal: Drop the oldest revisions beyond MAX_REVISIONS"""
+        excess = len(self.revisions) - self.MAX_REVISIONS
+        if excess <= 0:
+            return
+
+        first = self.revisions[excess]
+        if first['kind'] != self.KIND_SNAPSHOT:
+            # The new oldest revision must be readable on its own
+            self.revisions[excess] = self._make_snapshot(
+                first['number'], first['date'], first['word_count'], self._materialise_at(excess)
+            )
+        del self.revisions[:excess]
@@ -4,8 +4,9 @@ Statistics Manager - Manages writing statistics and sessions
 import json
 import os
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from models.writing_stats import WritingSession, ProjectStats
+from models.manuscript_structure import ManuscriptText
 
 
 class StatisticsManager:
@@ -22,6 +23,24 @@ class StatisticsManager:
         self.session_start_time: Optional[datetime] = None
         self.session_start_word_count: int = 0
         self.session_start_char_count: int = 0
+        self._dirty = False
+
+    def is_dirty(self) -> bool:
+        """
+        Check if statistics changed since they were loaded or last saved
+
+        Returns:
+            bool: True if statistics.json needs to be rewritten
+        """
+        return self._dirty
+
+    def mark_dirty(self):
+        """Flag statistics as modified"""
+        self._dirty = True
+
+    def mark_clean(self):
+        """Flag statistics as persisted"""
+        self._dirty = False
 
     def start_session(self, current_word_count: int, current_char_count: int):
         """
@@ -75,39 +94,62 @@ class StatisticsManager:
 
         # Add to stats
         self.stats.add_session(session)
+        self._dirty = True
 
         # Reset session
         self.current_session_active = False
         self.session_start_time = None
 
-    def update_manuscript_stats(self, text: str):
+    def update_manuscript_stats(self, text: Union[str, ManuscriptText],
+                                word_count: Optional[int] = None):
         """
         Update manuscript statistics (words, characters, paragraphs, sentences)
 
         Args:
-            text: Current manuscript text
+            text: Current manuscript text, or a ManuscriptText view (counted
+                  chunk by chunk without building the full string)
+            word_count: Known word count (e.g. word_count_summary()['total']);
+                        counted from text if None
         """
+        previous = (self.stats.total_words, self.stats.total_characters,
+                    self.stats.total_paragraphs, self.stats.total_sentences)
+
         if not text:
             self.stats.total_words = 0
             self.stats.total_characters = 0
             self.stats.total_paragraphs = 0
             self.stats.total_sentences = 0
+            self._mark_dirty_if_changed(previous)
             return
 
-        # Count words
-        words = text.split()
-        self.stats.total_words = len(words)
+        # Manuscript chunks meet at line breaks, so every count below adds up
+        chunks = [text] if isinstance(text, str) else text.iter_chunks()
+        words = characters = paragraphs = sentence_endings = 0
+        for chunk in chunks:
+            if word_count is None:
+                words += len(chunk.split())
+
+            # Characters (excluding whitespace)
+            characters += len(chunk) - chunk.count(' ') - chunk.count('\n')
 
-        # Count characters (excluding whitespace)
-        self.stats.total_characters = len(text.replace(' ', '').replace('\n', ''))
+            # Paragraphs (separated by double newlines or single newline)
+            paragraphs += sum(1 for line in chunk.split('\n') if line.strip())
 
-        # Count paragraphs (separated by double newlines or single newline)
-        paragraphs = [p.strip() for p in text.split('\n') if p.strip()]
-        self.stats.total_paragraphs = len(paragraphs)
+            # Sentences (rough estimate by counting . ! ?)
+            sentence_endings += chunk.count('.') + chunk.count('!') + chunk.count('?')
 
-        # Count sentences (rough estimate by counting . ! ?)
-        sentence_endings = text.count('.') + text.count('!') + text.count('?')
+        self.stats.total_words = word_count if word_count is not None else words
+        self.stats.total_characters = characters
+        self.stats.total_paragraphs = paragraphs
         self.stats.total_sentences = max(1, sentence_endings)
+        self._mark_dirty_if_changed(previous)
+
+    def _mark_dirty_if_changed(self, previous: tuple):
+        """Internal: Set dirty flag if manuscript totals differ from previous values"""
+        current = (self.stats.total_words, self.stats.total_characters,
+                   self.stats.total_paragraphs, self.stats.total_sentences)
+        if current != previous:
+            self._dirty = True
 
     def set_daily_goal(self, words: int):
         """
@@ -117,6 +159,7 @@ class StatisticsManager:
             words: Target words per day
         """
         self.stats.daily_goal = max(0, words)
+        self._dirty = True
 
     def set_weekly_goal(self, words: int):
         """
@@ -126,6 +169,7 @@ class StatisticsManager:
             words: Target words per week
         """
         self.stats.weekly_goal = max(0, words)
+        self._dirty = True
 
     def get_stats(self) -> ProjectStats:
         """
@@ -176,6 +220,8 @@ class StatisticsManager:
         with open(stats_file, 'w', encoding='utf-8') as f:
             json.dump(self.stats.to_dict(), f, indent=2, ensure_ascii=False)
 
+        self._dirty = False
+
     def load_statistics(self, project_dir: str):
         """
         Load statistics from statistics.json in project directory
@@ -184,6 +230,7 @@ class StatisticsManager:
             project_dir: Path to project directory (temp dir)
         """
         stats_file = os.path.join(project_dir, 'statistics.json')
+        self._dirty = False
 
         if not os.path.exists(stats_file):
             # No statistics file yet, use defaults
@@ -198,6 +245,25 @@ class StatisticsManager:
             # If file is corrupted, start fresh
             self.stats = ProjectStats()
 
+    def load_statistics_data(self, data: Optional[dict]):
+        """
+        Load statistics from already parsed statistics.json content
+
+        Args:
+            data: Parsed statistics dictionary, or None if the project has none yet
+        """
+        self._dirty = False
+
+        if not data:
+            self.stats = ProjectStats()
+            return
+
+        try:
+            self.stats = ProjectStats.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            # If data is corrupted, start fresh
+            self.stats = ProjectStats()
+
     def reset_session(self):
         """Reset current session without saving"""
         self.current_session_active = False
@@ -209,7 +209,8 @@ class TimelineManager:
 
         for i, event in enumerate(events):
             event.sort_order = i * 10
-            self.update_timeline_event(event)
+            event.update_modified_date()
+        self.container_manager.update_items(self.container_type, events)
 
         logger.info(f"Auto-sorted {len(events)} timeline events")
 
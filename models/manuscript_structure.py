@@ -1,9 +1,11 @@
 """
 Manuscript Structure Models - Hierarchical organization of manuscript content
 """
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Callable, Tuple, Iterator
 from datetime import datetime
+import hashlib
 import uuid
 import re
 
@@ -28,22 +30,53 @@ def _strip_html_tags(text: str) -> str:
     return clean.strip()
 
 
-@dataclass
 class Scene:
     """
     Represents a single scene in the manuscript
 
     A scene is the smallest unit of content, containing the actual text
+
+    With the per-scene archive layout the content is stored in its own
+    archive member and only read on first access (see set_content_loader)
+
+    Scenes are kept compact with __slots__. Plain text, word count and
+    content hash are derived from the content on first access and cached
+    until the content is written again, so updating a scene on every
+    keystroke does not rescan the whole text.
     """
-    id: str
-    title: str
-    content: str
-    order: int
-    word_count: int = 0
-    created_date: str = ""
-    modified_date: str = ""
-    synopsis: str = ""  # Scene synopsis/summary
-    notes: str = ""  # Scene notes
+
+    __slots__ = ('id', 'title', 'order', 'created_date', 'modified_date', 'synopsis', 'notes',
+                 '_content', '_content_loader', '_plain_text', '_word_count', '_content_hash')
+
+    def __init__(self, id: str, title: str, content: str, order: int,
+                 word_count: Optional[int] = None, created_date: str = "",
+                 modified_date: str = "", synopsis: str = "", notes: str = ""):
+        """
+        Initialize a scene
+
+        Args:
+            id: Scene ID
+            title: Scene title
+            content: Scene content (may contain HTML formatting)
+            order: Order within chapter
+            word_count: Known word count (None = computed from content)
+            created_date: Creation timestamp (ISO format)
+            modified_date: Last modification timestamp (ISO format)
+            synopsis: Scene synopsis/summary
+            notes: Scene notes
+        """
+        self.id = id
+        self.title = title
+        self.order = order
+        self.created_date = created_date
+        self.modified_date = modified_date
+        self.synopsis = synopsis
+        self.notes = notes
+        self._content = content
+        self._content_loader = None
+        self._plain_text = None
+        self._content_hash = None
+        self._word_count = word_count
 
     @staticmethod
     def create_new(title: str, order: int, content: str = "") -> 'Scene':
@@ -59,39 +92,116 @@ class Scene:
             Scene: New scene instance
         """
         now = datetime.now().isoformat()
-        # Calculate word count from plain text (strip HTML tags)
-        plain_text = _strip_html_tags(content)
-        word_count = len(plain_text.split()) if plain_text else 0
-
         return Scene(
             id=str(uuid.uuid4()),
             title=title,
             content=content,
             order=order,
-            word_count=word_count,
             created_date=now,
             modified_date=now
         )
 
+    @property
+    def content(self) -> str:
+        """Scene content, loaded on first access when deferred"""
+        if self._content_loader is not None:
+            loader = self._content_loader
+            self._content_loader = None
+            self._content = loader(self.id) or ""
+        return self._content
+
+    @content.setter
+    def content(self, content: str):
+        self._content = content
+        self._content_loader = None
+        self._plain_text = None
+        self._word_count = None
+        self._content_hash = None
+
+    @property
+    def plain_text(self) -> str:
+        """Content without HTML tags and with collapsed whitespace (cached)"""
+        if self._plain_text is None:
+            self._plain_text = _strip_html_tags(self.content)
+        return self._plain_text
+
+    @property
+    def word_count(self) -> int:
+        """Number of words in the plain text (cached)"""
+        if self._word_count is None:
+            plain_text = self.plain_text
+            self._word_count = len(plain_text.split()) if plain_text else 0
+        return self._word_count
+
+    @word_count.setter
+    def word_count(self, word_count: Optional[int]):
+        self._word_count = word_count
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-1 of the content (cached), e.g. to key analysis results"""
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha1(self.content.encode('utf-8')).hexdigest()
+        return self._content_hash
+
     def update_content(self, content: str):
         """
-        Update scene content and recalculate word count
+        Update scene content
+
+        Derived values (plain text, word count, hash) are recomputed on
+        their next access.
 
         Args:
             content: New content (may contain HTML formatting)
         """
         self.content = content
-        # Calculate word count from plain text (strip HTML tags)
-        plain_text = _strip_html_tags(content)
-        self.word_count = len(plain_text.split()) if plain_text else 0
         self.modified_date = datetime.now().isoformat()
 
+    def set_content_loader(self, loader: Callable[[str], Optional[str]]):
+        """
+        Defer loading the content until it is first accessed
+
+        The word count known from the index is kept meanwhile.
+
+        Args:
+            loader: Callable receiving the scene ID and returning its content
+        """
+        self._content = None
+        self._content_loader = loader
+        self._plain_text = None
+        self._content_hash = None
+
+    def is_content_loaded(self) -> bool:
+        """Check if the content is in memory (False while still deferred)"""
+        return self._content_loader is None
+
+    def _fields(self) -> tuple:
+        """Internal: Values compared by __eq__"""
+        return (self.id, self.title, self.content, self.order, self.word_count,
+                self.created_date, self.modified_date, self.synopsis, self.notes)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Scene(id={self.id!r}, title={self.title!r}, order={self.order!r}, "
+                f"word_count={self.word_count!r})")
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
+        data = self.to_index_dict()
+        data['content'] = self.content
+        return data
+
+    def to_index_dict(self) -> dict:
+        """Convert to dictionary without content (per-scene layout index)"""
         return {
             'id': self.id,
             'title': self.title,
-            'content': self.content,
             'order': self.order,
             'word_count': self.word_count,
             'created_date': self.created_date,
@@ -108,7 +218,7 @@ class Scene:
             title=data.get('title', 'Untitled Scene'),
             content=data.get('content', ''),
             order=data.get('order', 0),
-            word_count=data.get('word_count', 0),
+            word_count=data.get('word_count'),
             created_date=data.get('created_date', datetime.now().isoformat()),
             modified_date=data.get('modified_date', datetime.now().isoformat()),
             synopsis=data.get('synopsis', ''),
@@ -116,19 +226,233 @@ class Scene:
         )
 
 
-@dataclass
-class Chapter:
+def iter_text_chunks(ordered_tree: list) -> Iterator[str]:
+    """
+    Yield the manuscript text piece by piece in reading order
+
+    Headings and scene contents are yielded separately, so the pieces
+    always meet at line breaks; joining them (and stripping the result)
+    gives the full manuscript text.
+
+    Args:
+        ordered_tree: Result of ManuscriptStructure.get_ordered_tree()
+
+    Yields:
+        str: Part/chapter headings, scene contents and separators
+    """
+    for part, chapters in ordered_tree:
+        if part is not None:
+            # Add part title (markdown level 2)
+            yield f"\n\n## {part.title}\n\n"
+
+        for chapter, scenes in chapters:
+            if part is not None:
+                # Add chapter title (markdown level 3)
+                yield f"\n\n### {chapter.title}\n\n"
+            else:
+                # Legacy structure
+                yield f"\n\n# {chapter.title}\n\n"
+
+            for scene in scenes:
+                if scene.content:
+                    yield scene.content
+                    yield "\n\n"
+
+
+class ManuscriptText:
+    """
+    Lazy, read-only view of the whole manuscript text
+
+    Streams scenes in reading order instead of holding one big string, so
+    code that only needs to scan the text (statistics, saving) never
+    doubles the manuscript in memory. The full string is built only when
+    the text property (or str()) is used.
+    """
+
+    __slots__ = ('_tree_provider',)
+
+    def __init__(self, tree_provider: Callable[[], list]):
+        """
+        Initialize the view
+
+        Args:
+            tree_provider: Callable returning the current ordered tree
+                           (see ManuscriptStructure.get_ordered_tree)
+        """
+        self._tree_provider = tree_provider
+
+    def iter_scenes(self) -> Iterator[Scene]:
+        """Iterate over scenes in reading order"""
+        for _, chapters in self._tree_provider():
+            for _, scenes in chapters:
+                yield from scenes
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Iterate over the text pieces (see iter_text_chunks)"""
+        return iter_text_chunks(self._tree_provider())
+
+    @property
+    def text(self) -> str:
+        """The full manuscript text (built on each access)"""
+        return ''.join(self.iter_chunks()).strip()
+
+    def get_length(self) -> int:
+        """
+        Get len(self.text) without building the text
+
+        Returns:
+            int: Number of characters of the (stripped) manuscript text
+        """
+        total = 0
+        leading = None
+        trailing = 0
+        for chunk in self.iter_chunks():
+            content = chunk.rstrip()
+            if content:
+                if leading is None:
+                    leading = total + len(chunk) - len(chunk.lstrip())
+                trailing = len(chunk) - len(content)
+            else:
+                trailing += len(chunk)
+            total += len(chunk)
+
+        return total - leading - trailing if leading is not None else 0
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return self.get_length()
+
+    def __bool__(self) -> bool:
+        return any(chunk.strip() for chunk in self.iter_chunks())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ManuscriptText):
+            other = other.text
+        if isinstance(other, str):
+            return self.text == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ManuscriptText(scenes={sum(1 for _ in self.iter_scenes())})"
+
+
+class _WordCountRollup(ABC):
+    """
+    Running word count total over child items (scenes of a chapter or
+    chapters of a part)
+
+    The total is computed on first read and then kept current by deltas:
+    a child flagged with mark_word_count_changed() is recounted on the
+    next read and only the difference from its last known count is
+    applied, so reading a total after an edit costs one child, not all.
+    """
+
+    __slots__ = ('_word_total', '_child_counts', '_changed_children')
+
+    def _init_word_total(self):
+        """Internal: Start with an unknown total"""
+        self._word_total = None
+        self._child_counts = {}
+        self._changed_children = {}
+
+    @abstractmethod
+    def _get_children(self) -> list:
+        """Internal: Child items whose counts make up the total"""
+
+    @staticmethod
+    @abstractmethod
+    def _count_child(child) -> int:
+        """Internal: Current word count of a child"""
+
+    def get_total_word_count(self) -> int:
+        """Calculate total word count (running total, updated by deltas)"""
+        if self._word_total is None:
+            self._child_counts = {child.id: self._count_child(child) for child in self._get_children()}
+            self._word_total = sum(self._child_counts.values())
+            self._changed_children = {}
+        elif self._changed_children:
+            for child_id, child in self._changed_children.items():
+                if child_id in self._child_counts:
+                    count = self._count_child(child)
+                    self._word_total += count - self._child_counts[child_id]
+                    self._child_counts[child_id] = count
+            self._changed_children = {}
+        return self._word_total
+
+    def mark_word_count_changed(self, child):
+        """
+        Flag a child whose word count may have changed
+
+        Args:
+            child: Scene (of a chapter) or chapter (of a part)
+        """
+        if self._word_total is not None:
+            self._changed_children[child.id] = child
+
+    def invalidate_word_count(self):
+        """Drop the running total (recomputed on next read)"""
+        self._word_total = None
+
+    def _child_added(self, child):
+        """Internal: Add a new child's count to the total"""
+        if self._word_total is not None:
+            count = self._count_child(child)
+            self._child_counts[child.id] = count
+            self._word_total += count
+
+    def _child_removed(self, child):
+        """Internal: Subtract a removed child's count from the total"""
+        if self._word_total is not None and child.id in self._child_counts:
+            self._word_total -= self._child_counts.pop(child.id)
+            self._changed_children.pop(child.id, None)
+
+
+class Chapter(_WordCountRollup):
     """
     Represents a chapter containing multiple scenes
 
-    A chapter organizes scenes into logical groups
+    A chapter organizes scenes into logical groups. Its word count is a
+    running total kept current by ManuscriptStructureManager, which flags
+    edited scenes with mark_word_count_changed().
     """
-    id: str
-    title: str
-    scenes: List[Scene] = field(default_factory=list)
-    order: int = 0
-    synopsis: str = ""  # Chapter synopsis/summary
-    notes: str = ""  # Chapter notes
+
+    __slots__ = ('id', 'title', 'scenes', 'order', 'synopsis', 'notes')
+
+    def __init__(self, id: str, title: str, scenes: Optional[List[Scene]] = None,
+                 order: int = 0, synopsis: str = "", notes: str = ""):
+        """
+        Initialize a chapter
+
+        Args:
+            id: Chapter ID
+            title: Chapter title
+            scenes: Scenes of the chapter
+            order: Order within manuscript or part
+            synopsis: Chapter synopsis/summary
+            notes: Chapter notes
+        """
+        self.id = id
+        self.title = title
+        self.scenes = scenes if scenes is not None else []
+        self.order = order
+        self.synopsis = synopsis
+        self.notes = notes
+        self._init_word_total()
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.id, self.title, self.scenes, self.order, self.synopsis, self.notes) ==
+                (other.id, other.title, other.scenes, other.order, other.synopsis, other.notes))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Chapter(id={self.id!r}, title={self.title!r}, order={self.order!r}, scenes={len(self.scenes)})"
 
     @staticmethod
     def create_new(title: str, order: int) -> 'Chapter':
@@ -152,6 +476,7 @@ class Chapter:
     def add_scene(self, scene: Scene):
         """Add a scene to this chapter"""
         self.scenes.append(scene)
+        self._child_added(scene)
 
     def remove_scene(self, scene_id: str) -> bool:
         """
@@ -166,6 +491,7 @@ class Chapter:
         for i, scene in enumerate(self.scenes):
             if scene.id == scene_id:
                 self.scenes.pop(i)
+                self._child_removed(scene)
                 return True
         return False
 
@@ -184,9 +510,14 @@ class Chapter:
                 return scene
         return None
 
-    def get_total_word_count(self) -> int:
-        """Calculate total word count for all scenes in chapter"""
-        return sum(scene.word_count for scene in self.scenes)
+    def _get_children(self) -> list:
+        """Internal: Scenes make up the chapter total"""
+        return self.scenes
+
+    @staticmethod
+    def _count_child(child) -> int:
+        """Internal: Word count of a scene"""
+        return child.word_count
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
@@ -199,6 +530,17 @@ class Chapter:
             'notes': self.notes
         }
 
+    def to_index_dict(self) -> dict:
+        """Convert to dictionary without scene content (per-scene layout index)"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'order': self.order,
+            'scenes': [scene.to_index_dict() for scene in self.scenes],
+            'synopsis': self.synopsis,
+            'notes': self.notes
+        }
+
     @staticmethod
     def from_dict(data: dict) -> 'Chapter':
         """Create Chapter from dictionary"""
@@ -219,20 +561,48 @@ class Chapter:
         return chapter
 
 
-@dataclass
-class Part:
+class Part(_WordCountRollup):
     """
     Represents a part (section) of the manuscript containing multiple chapters
 
     A part is a higher-level organizational unit above chapters,
-    commonly used in novels (e.g., "Part I", "Part II", etc.)
+    commonly used in novels (e.g., "Part I", "Part II", etc.).
+    Its word count is a running total over its chapters' totals.
     """
-    id: str
-    title: str
-    chapters: List[Chapter] = field(default_factory=list)
-    order: int = 0
-    synopsis: str = ""  # Part synopsis/summary
-    notes: str = ""  # Part notes
+
+    __slots__ = ('id', 'title', 'chapters', 'order', 'synopsis', 'notes')
+
+    def __init__(self, id: str, title: str, chapters: Optional[List[Chapter]] = None,
+                 order: int = 0, synopsis: str = "", notes: str = ""):
+        """
+        Initialize a part
+
+        Args:
+            id: Part ID
+            title: Part title
+            chapters: Chapters of the part
+            order: Order within manuscript
+            synopsis: Part synopsis/summary
+            notes: Part notes
+        """
+        self.id = id
+        self.title = title
+        self.chapters = chapters if chapters is not None else []
+        self.order = order
+        self.synopsis = synopsis
+        self.notes = notes
+        self._init_word_total()
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.id, self.title, self.chapters, self.order, self.synopsis, self.notes) ==
+                (other.id, other.title, other.chapters, other.order, other.synopsis, other.notes))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Part(id={self.id!r}, title={self.title!r}, order={self.order!r}, chapters={len(self.chapters)})"
 
     @staticmethod
     def create_new(title: str, order: int) -> 'Part':
@@ -256,6 +626,7 @@ class Part:
     def add_chapter(self, chapter: Chapter):
         """Add a chapter to this part"""
         self.chapters.append(chapter)
+        self._child_added(chapter)
 
     def remove_chapter(self, chapter_id: str) -> bool:
         """
@@ -270,6 +641,7 @@ class Part:
         for i, chapter in enumerate(self.chapters):
             if chapter.id == chapter_id:
                 self.chapters.pop(i)
+                self._child_removed(chapter)
                 return True
         return False
 
@@ -288,9 +660,14 @@ class Part:
                 return chapter
         return None
 
-    def get_total_word_count(self) -> int:
-        """Calculate total word count for all chapters in part"""
-        return sum(chapter.get_total_word_count() for chapter in self.chapters)
+    def _get_children(self) -> list:
+        """Internal: Chapters make up the part total"""
+        return self.chapters
+
+    @staticmethod
+    def _count_child(child) -> int:
+        """Internal: Word count of a chapter"""
+        return child.get_total_word_count()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
@@ -303,6 +680,17 @@ class Part:
             'notes': self.notes
         }
 
+    def to_index_dict(self) -> dict:
+        """Convert to dictionary without scene content (per-scene layout index)"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'order': self.order,
+            'chapters': [chapter.to_index_dict() for chapter in self.chapters],
+            'synopsis': self.synopsis,
+            'notes': self.notes
+        }
+
     @staticmethod
     def from_dict(data: dict) -> 'Part':
         """Create Part from dictionary"""
@@ -333,7 +721,15 @@ class ManuscriptStructure:
     Supports two structures:
     1. Legacy (2-level): chapters directly in structure
     2. Modern (3-level): parts containing chapters containing scenes
+
+    Archive layouts:
+    1. Single file: manuscript_structure.json holds everything, content included
+    2. Per-scene: manuscript_structure.json is an index without content and
+       each scene is stored as scenes/<id>.html
     """
+
+    # Layout version written to the index by to_index_dict()
+    SCENE_LAYOUT_VERSION = 2
     parts: List[Part] = field(default_factory=list)
     chapters: List[Chapter] = field(default_factory=list)  # Legacy: direct chapters
     current_scene_id: Optional[str] = None
@@ -526,39 +922,35 @@ class ManuscriptStructure:
         else:
             return sum(chapter.get_total_word_count() for chapter in self.chapters)
 
-    def get_full_text(self) -> str:
+    def get_ordered_tree(self) -> List[Tuple[Optional[Part], List[Tuple[Chapter, List[Scene]]]]]:
         """
-        Get the complete manuscript text (all scenes concatenated)
+        Get the active structure sorted in reading order
 
         Returns:
-            str: Complete manuscript text with part/chapter/scene hierarchy
+            List: (part, [(chapter, [scenes])]) entries; in legacy mode a
+                  single entry with part None holds all chapters
         """
-        text_parts = []
+        def sorted_chapters(chapters: List[Chapter]) -> List[Tuple[Chapter, List[Scene]]]:
+            return [(chapter, sorted(chapter.scenes, key=lambda s: s.order))
+                    for chapter in sorted(chapters, key=lambda c: c.order)]
 
         if self.use_parts_structure:
-            for part in sorted(self.parts, key=lambda p: p.order):
-                # Add part title (markdown level 2)
-                text_parts.append(f"\n\n## {part.title}\n\n")
-
-                for chapter in sorted(part.chapters, key=lambda c: c.order):
-                    # Add chapter title (markdown level 3)
-                    text_parts.append(f"\n\n### {chapter.title}\n\n")
+            return [(part, sorted_chapters(part.chapters))
+                    for part in sorted(self.parts, key=lambda p: p.order)]
+        return [(None, sorted_chapters(self.chapters))]
 
-                    for scene in sorted(chapter.scenes, key=lambda s: s.order):
-                        if scene.content:
-                            text_parts.append(scene.content)
-                            text_parts.append("\n\n")
-        else:
-            # Legacy structure
-            for chapter in sorted(self.chapters, key=lambda c: c.order):
-                text_parts.append(f"\n\n# {chapter.title}\n\n")
+    def get_full_text(self, ordered_tree: Optional[list] = None) -> str:
+        """
+        Get the complete manuscript text (all scenes concatenated)
 
-                for scene in sorted(chapter.scenes, key=lambda s: s.order):
-                    if scene.content:
-                        text_parts.append(scene.content)
-                        text_parts.append("\n\n")
+        Args:
+            ordered_tree: Result of get_ordered_tree() if already available
 
-        return ''.join(text_parts).strip()
+        Returns:
+            str: Complete manuscript text with part/chapter/scene hierarchy
+        """
+        return ''.join(iter_text_chunks(ordered_tree if ordered_tree is not None
+                                        else self.get_ordered_tree())).strip()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
@@ -569,6 +961,46 @@ class ManuscriptStructure:
             'current_scene_id': self.current_scene_id
         }
 
+    def to_index_dict(self) -> dict:
+        """
+        Convert to the per-scene layout index (no scene content)
+
+        Scene content must be stored separately under get_scene_member_name()
+        """
+        return {
+            'layout_version': self.SCENE_LAYOUT_VERSION,
+            'use_parts_structure': self.use_parts_structure,
+            'parts': [part.to_index_dict() for part in self.parts],
+            'chapters': [chapter.to_index_dict() for chapter in self.chapters],  # Legacy
+            'current_scene_id': self.current_scene_id
+        }
+
+    @staticmethod
+    def is_scene_layout(data: dict) -> bool:
+        """
+        Check if serialized structure data uses the per-scene layout
+
+        Args:
+            data: Dictionary loaded from manuscript_structure.json
+
+        Returns:
+            bool: True if scene content lives in separate archive members
+        """
+        return data.get('layout_version', 1) >= ManuscriptStructure.SCENE_LAYOUT_VERSION
+
+    @staticmethod
+    def get_scene_member_name(scene_id: str) -> str:
+        """
+        Get the archive member name holding a scene's content
+
+        Args:
+            scene_id: Scene ID
+
+        Returns:
+            str: Member name (e.g. 'scenes/<id>.html')
+        """
+        return f"scenes/{scene_id}.html"
+
     @staticmethod
     def from_dict(data: dict) -> 'ManuscriptStructure':
         """Create ManuscriptStructure from dictionary"""
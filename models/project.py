@@ -3,8 +3,9 @@ Project data model
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import List, Union
 from models.project_type import ProjectType
+from models.manuscript_structure import ManuscriptText
 
 
 @dataclass
@@ -19,7 +20,8 @@ class Project:
         project_type: Type of project (novel, article, etc.)
         created_date: ISO format creation date
         modified_date: ISO format last modification date
-        manuscript_text: The main text content (legacy, kept for compatibility)
+        manuscript_text: The main text content (legacy, kept for compatibility);
+                         a lazy ManuscriptText view for opened projects
         genre: Genre/category (optional)
         target_word_count: Target word count goal (optional)
         tags: List of tags for organization (optional)
@@ -31,7 +33,7 @@ class Project:
     created_date: str = ""
     modified_date: str = ""
     last_opened_date: str = ""  # Last time project was opened
-    manuscript_text: str = ""
+    manuscript_text: Union[str, ManuscriptText] = ""
 
     # Optional metadata fields
     genre: str = ""
@@ -186,13 +188,13 @@ class Project:
         }
 
     @classmethod
-    def from_dict(cls, data: dict, manuscript_text: str = "") -> 'Project':
+    def from_dict(cls, data: dict, manuscript_text: Union[str, ManuscriptText] = "") -> 'Project':
         """
         Create Project instance from dictionary
 
         Args:
             data: Dictionary containing project metadata
-            manuscript_text: The manuscript text content
+            manuscript_text: The manuscript text content (string or lazy view)
 
         Returns:
             Project: New Project instance
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-scene analysis cache and mergeable analysis results
+"""
+import sys
+from collections import Counter
+from analysis.analysis_cache import AnalysisCache
+from analysis.grammar import GrammarAnalyzer
+from analysis.repetition import RepetitionAnalyzer
+from analysis.style import StyleAnalyzer
+from analysis.spelling_service import spelling_service
+from analysis.analysis_context import analysis_context
+from analysis.nlp_manager import nlp_manager
+from fake_nlp import FakeDoc, FakeModel
+
+
+def test_cache_reuses_unchanged_scenes():
+    """Test that only new or changed scenes are analysed"""
+    print("=" * 60)
+    print("TEST 1: Only Changed Scenes Analysed")
+    print("=" * 60)
+
+    cache = AnalysisCache()
+    analysed = []
+
+    def analyze(text):
+        analysed.append(text)
+        return len(text)
+
+    scenes = [("s1", "h1", "uno"), ("s2", "h2", "dueee"), ("s3", "h3", "tre")]
+    results, count = cache.analyze_scenes(scenes, "style", "it", 1, analyze)
+    assert results == [3, 5, 3] and count == 3
+    print("✓ First run analyses every scene")
+
+    scenes[1] = ("s2", "h2b", "due")
+    results, count = cache.analyze_scenes(scenes, "style", "it", 1, analyze)
+    assert results == [3, 3, 3] and count == 1 and analysed[-1] == "due"
+    assert len(cache) == 3
+    print("✓ Edited scene analysed again, its old result replaced")
+
+    assert cache.analyze_scenes(scenes, "style", "en", 1, analyze)[1] == 3
+    assert cache.analyze_scenes(scenes, "style", "it", 2, analyze)[1] == 3
+    assert cache.get("s1", "h1", "repetitions", "it", 1) is None
+    print("✓ Analyzer, language and version are part of the key")
+
+    results, count = cache.analyze_scenes([("s4", "h4", "")], "style", "it", 1, lambda text: None)
+    assert results == [] and count == 1 and cache.get("s4", "h4", "style", "it", 1) is None
+    cache.remove_scene("s1")
+    assert cache.get("s1", "h1", "style", "it", 1) is None
+    print("✓ Failed analyses not cached, removed scenes dropped")
+
+
+def test_repetitions_merge():
+    """Test that merged repetition counts equal the counts of the whole text"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Repetitions Merged Across Scenes")
+    print("=" * 60)
+
+    analyzer = RepetitionAnalyzer()
+    scenes = ["Il vento soffiava sulla collina.", "La collina era verde e il vento freddo."]
+    partials = [analyzer.partial_from_doc(FakeDoc(text)) for text in scenes]
+    merged = analyzer.merge_partials(partials, top_n=3)
+    whole = analyzer.merge_partials([analyzer.partial_from_doc(FakeDoc(" ".join(scenes)))], top_n=3)
+
+    assert merged == whole
+    assert ("collina", 2) in merged['repetitions'] and ("vento", 2) in merged['repetitions']
+    print("✓ Counters merged into the totals of the whole text")
+
+
+def test_style_merge():
+    """Test that style counts are summed and lemmas united"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Style Merged Across Scenes")
+    print("=" * 60)
+
+    analyzer = StyleAnalyzer()
+    partials = [
+        {'num_sentences': 2, 'num_words': 10, 'lemmas': frozenset({"vento", "collina"}),
+         'pos_counts': Counter({'NOUN': 4, 'VERB': 2}), 'readability': 60.0},
+        {'num_sentences': 3, 'num_words': 30, 'lemmas': frozenset({"vento", "mare"}),
+         'pos_counts': Counter({'NOUN': 10, 'ADJ': 5}), 'readability': 40.0},
+    ]
+    result = analyzer.merge_partials(partials)
+
+    assert result['num_sentences'] == 5 and result['num_words'] == 40
+    assert result['unique_words'] == 3 and result['avg_sentence_length'] == 8.0
+    assert result['pos_counts'] == {'NOUN': 14, 'ADJ': 5, 'VERB': 2}
+    assert result['readability'] == 45.0
+    print("✓ Counts summed, lemmas united, readability weighted by words")
+
+
+def test_grammar_custom_words():
+    """Test that cached grammar results expire when custom words change"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Grammar Results And Custom Words")
+    print("=" * 60)
+
+    text = "Aragorn soffiava sulla collina."
+    before = GrammarAnalyzer.get_cache_hash(text)
+    assert GrammarAnalyzer.get_cache_hash(text) == before
+    assert GrammarAnalyzer.get_cache_hash(text + " ") != before
+    print("✓ Same hash for the same text")
+
+    cache = AnalysisCache()
+    cache.put("s1", before, "grammar", "it", 1, {'errors': ['Aragorn']})
+    spelling_service.add_custom_words(["Zarathustrix"])
+    try:
+        after = GrammarAnalyzer.get_cache_hash(text)
+        assert after != before and cache.get("s1", after, "grammar", "it", 1) is None
+        print("✓ Adding a custom word invalidates cached spelling errors")
+    finally:
+        spelling_service.remove_custom_word("Zarathustrix")
+
+
+def test_one_parse_per_scene():
+    """Test that repetitions and style analysis of the scenes parse each scene once"""
+    print("\n" + "=" * 60)
+    print("TEST 5: One Parse Per Scene For Repetitions And Style")
+    print("=" * 60)
+
+    try:
+        from workers.thread_analysis import AnalysisThread
+    except ImportError as e:
+        print(f"⚠ Qt not installed: {e} (skipping)")
+        return
+
+    model = FakeModel()
+    original = nlp_manager.get_spacy_model
+    nlp_manager.get_spacy_model = lambda language=None: model
+    try:
+        cache = AnalysisCache()
+        texts = [f"Il vento soffiava sulla collina numero{i}." for i in range(10)]
+        scenes = [(f"s{i}", f"h{i}", text) for i, text in enumerate(texts)]
+        analyzers = {'repetitions_analyzer': RepetitionAnalyzer(), 'style_analyzer': StyleAnalyzer()}
+
+        analysis_context.clear()
+        thread = AnalysisThread("", AnalysisThread.TYPE_REPETITIONS, scenes=scenes,
+                                analysis_cache=cache, **analyzers)
+        repetitions = thread._execute_repetitions_analysis()
+        assert repetitions['success'] and repetitions['analysed_scenes'] == 10
+        assert model.parsed == texts
+        print("✓ Repetitions analysis parses every scene once")
+
+        analysis_context.clear()
+        thread = AnalysisThread("", AnalysisThread.TYPE_STYLE, scenes=scenes,
+                                analysis_cache=cache, **analyzers)
+        style = thread._execute_style_analysis()
+        assert style['success'] and style['analysed_scenes'] == 0 and style['num_words'] == 60
+        assert model.parsed == texts
+        print("✓ Style analysis next parses nothing (partials cached with the same Doc)")
+    finally:
+        nlp_manager.get_spacy_model = original
+        analysis_context.clear()
+
+
+def test_failed_grammar_analysis():
+    """Test that a failed grammar analysis is run once and not cached"""
+    print("\n" + "=" * 60)
+    print("TEST 6: Failed Grammar Analysis")
+    print("=" * 60)
+
+    try:
+        from workers.thread_analysis import AnalysisThread
+    except ImportError as e:
+        print(f"⚠ Qt not installed: {e} (skipping)")
+        return
+
+    calls = []
+    analyzer = GrammarAnalyzer()
+    analyzer.analyze = lambda text: calls.append(text) or {'error': 'Tool not available', 'success': False}
+    cache = AnalysisCache()
+    thread = AnalysisThread("Il vento.", AnalysisThread.TYPE_GRAMMAR, scene_id="s1",
+                            analysis_cache=cache, grammar_analyzer=analyzer)
+    result = thread._execute_grammar_analysis()
+    assert result['error'] == 'Tool not available' and calls == ["Il vento."] and len(cache) == 0
+    print("✓ Error returned after a single analysis, nothing cached")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_cache_reuses_unchanged_scenes()
+        test_repetitions_merge()
+        test_style_merge()
+        test_grammar_custom_words()
+        test_one_parse_per_scene()
+        test_failed_grammar_analysis()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
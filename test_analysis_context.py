@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared spaCy Doc cache
+"""
+import sys
+from analysis.analysis_context import AnalysisContext, analysis_context
+from analysis.nlp_manager import nlp_manager
+from fake_nlp import FakeModel
+
+
+def test_doc_cache():
+    """Test that a text is parsed once per language and content"""
+    print("=" * 60)
+    print("TEST 1: One Parse Per Text And Language")
+    print("=" * 60)
+
+    model = FakeModel()
+    original = nlp_manager.get_spacy_model
+    nlp_manager.get_spacy_model = lambda language=None: model
+    try:
+        assert AnalysisContext() is analysis_context
+        analysis_context.clear()
+
+        doc = analysis_context.get_doc("Il vento soffiava.", 'it')
+        assert analysis_context.get_doc("Il vento soffiava.", 'it') is doc
+        assert model.parsed == ["Il vento soffiava."]
+        print("✓ Same text parsed once")
+
+        analysis_context.get_doc("Il vento soffiava.", 'en')
+        analysis_context.get_doc("Il vento soffiava!", 'it')
+        assert len(model.parsed) == 3
+        print("✓ Language and content are part of the key")
+
+        for i in range(AnalysisContext.DOC_CACHE_SIZE + 1):
+            analysis_context.get_doc(f"Testo {i}", 'it')
+        analysis_context.get_doc("Il vento soffiava.", 'it')
+        assert model.parsed[-1] == "Il vento soffiava."
+        print("✓ Cache bounded, least recently used Doc dropped")
+    finally:
+        nlp_manager.get_spacy_model = original
+        analysis_context.clear()
+
+
+def test_missing_model():
+    """Test that a missing model is reported as None"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Missing Model")
+    print("=" * 60)
+
+    original = nlp_manager.get_spacy_model
+    nlp_manager.get_spacy_model = lambda language=None: None
+    try:
+        assert analysis_context.get_doc("Testo", 'xx') is None
+        print("✓ No Doc without a model")
+    finally:
+        nlp_manager.get_spacy_model = original
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_doc_cache()
+        test_missing_model()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for deduplicated project backups
+"""
+import sys
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from utils.backup_manager import BackupManager
+from utils.backup_store import BackupStore
+
+
+def _write_project(filepath, scene_text):
+    """Create a project-like archive with a large image and one scene"""
+    image_data = bytes(range(256)) * 4096  # 1 MB, identical in every version
+    with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_STORED) as zipf:
+        zipf.writestr('manifest.json', '{"title": "Dedup"}')
+        zipf.writestr('scenes/s1.html', scene_text)
+        zipf.writestr('images/', '')
+        zipf.writestr('images/portrait.png', image_data)
+
+
+def _make_manager(backup_dir):
+    """Backup manager writing to a temporary directory"""
+    manager = BackupManager()
+    manager.backup_dir = Path(backup_dir)
+    manager.store = BackupStore(manager.backup_dir)
+    return manager
+
+
+def test_backups_share_unchanged_members():
+    """Test that consecutive backups store unchanged members once"""
+    print("=" * 60)
+    print("TEST 1: Backups Share Unchanged Members")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "dedup.tnp")
+        manager = _make_manager(os.path.join(temp_dir, "backups"))
+
+        _write_project(project_file, "Prima versione")
+        first = manager.create_backup(project_file, "save")
+        _write_project(project_file, "Seconda versione")
+        second = manager.create_backup(project_file, "manual")
+        assert first and second and BackupStore.is_manifest(second)
+
+        # Two restore points cost about one copy of the image
+        project_size = os.path.getsize(project_file)
+        assert manager.store.get_disk_usage() < project_size * 1.2
+        print(f"✓ Two backups use {manager.store.get_disk_usage()} bytes for a {project_size} byte project")
+
+        backups = manager.list_backups("dedup")
+        assert len(backups) == 2
+        assert {b['operation'] for b in backups} == {'save', 'manual'}
+        assert all(b['size_mb'] > 0.9 for b in backups)
+        print("✓ list_backups reports both backups with archive size")
+
+
+def test_restore_and_garbage_collection():
+    """Test restoring a backup and reclaiming unreferenced data"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Restore And Garbage Collection")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "restore.tnp")
+        manager = _make_manager(os.path.join(temp_dir, "backups"))
+
+        _write_project(project_file, "Versione da ripristinare")
+        backup_path = manager.create_backup(project_file, "save")
+        _write_project(project_file, "Versione successiva")
+
+        assert manager.restore_backup(backup_path, project_file)
+        with zipfile.ZipFile(project_file, 'r') as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read('scenes/s1.html').decode('utf-8') == "Versione da ripristinare"
+            assert len(zipf.read('images/portrait.png')) == 1024 * 1024
+        print("✓ Restored archive is valid and holds the backed up scene")
+
+        # restore_backup backed up the replaced file first
+        assert len(manager.list_backups("restore")) == 2
+        for backup in manager.list_backups("restore"):
+            assert manager.delete_backup(backup['path'])
+        assert manager.store.get_disk_usage() == 0
+        print("✓ Deleting every backup reclaims all member data")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_backups_share_unchanged_members()
+        test_restore_and_garbage_collection()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
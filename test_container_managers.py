@@ -345,6 +345,101 @@ def test_note_manager():
     print("\n✅ TEST 6 PASSED\n")
 
 
+def test_container_id_index():
+    """Test ID lookups and bulk operations on a large container"""
+    print("=" * 60)
+    print("TEST 7: ContainerManager - ID Index And Bulk Operations")
+    print("=" * 60)
+
+    from models.worldbuilding_entry import WorldbuildingEntry
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        container_manager = ContainerManager(temp_dir)
+        ids = [
+            container_manager.add_item(ContainerType.WORLDBUILDING, WorldbuildingEntry(title=f"Voce {i}"))
+            for i in range(2000)
+        ]
+
+        found = container_manager.get_items(ContainerType.WORLDBUILDING, [ids[1500], "missing", ids[3]])
+        assert [entry.title for entry in found] == ["Voce 1500", "Voce 3"]
+        print("✓ get_items: OK (order kept, unknown IDs skipped)")
+
+        for entry in found:
+            entry.category = "Magia"
+        assert container_manager.update_items(ContainerType.WORLDBUILDING, found) == 2
+        assert container_manager.get_item(ContainerType.WORLDBUILDING, ids[1500]).category == "Magia"
+        print("✓ update_items: OK")
+
+        assert container_manager.delete_item(ContainerType.WORLDBUILDING, ids[10])
+        assert container_manager.get_item(ContainerType.WORLDBUILDING, ids[10]) is None
+        assert container_manager.get_item(ContainerType.WORLDBUILDING, ids[1999]).title == "Voce 1999"
+        assert container_manager.get_item(ContainerType.WORLDBUILDING, ids[11]).title == "Voce 11"
+        print("✓ Index stays consistent after delete")
+
+        for item_id in ids[100:1100:2]:
+            assert container_manager.delete_item(ContainerType.WORLDBUILDING, item_id)
+        assert container_manager.get_item_count(ContainerType.WORLDBUILDING) == 1499
+        assert container_manager.get_item(ContainerType.WORLDBUILDING, ids[101]).title == "Voce 101"
+        entries = container_manager.get_all_items(ContainerType.WORLDBUILDING)
+        assert len(entries) == 1499 and None not in entries
+        assert [entry.title for entry in entries[98:101]] == ["Voce 99", "Voce 101", "Voce 103"]
+        assert container_manager.get_item(ContainerType.WORLDBUILDING, ids[1999]) is entries[-1]
+        print("✓ Bulk delete: order kept, index consistent after compaction")
+
+        container_manager.save_container(ContainerType.WORLDBUILDING)
+        reloaded = ContainerManager(temp_dir)
+        assert reloaded.get_item(ContainerType.WORLDBUILDING, ids[1500]).category == "Magia"
+        print("✓ Index rebuilt on load")
+
+    print("\n✅ TEST 7 PASSED\n")
+
+
+def test_save_all_skips_unchanged():
+    """Test that save_all only rewrites changed containers"""
+    print("=" * 60)
+    print("TEST 8: ContainerManager - Dirty-Aware save_all")
+    print("=" * 60)
+
+    from models.location import Location
+    from models.note import Note
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        container_manager = ContainerManager(temp_dir)
+        container_manager.add_item(ContainerType.LOCATIONS, Location(name="Roma"))
+        container_manager.add_item(ContainerType.NOTES, Note(title="Idea"))
+
+        written = set()
+        assert container_manager.save_all(written)
+        assert written == {"locations.json", "notes.json"}
+        assert container_manager.get_dirty_containers() == []
+
+        written = set()
+        generation = container_manager.get_generation(ContainerType.NOTES)
+        container_manager.add_item(ContainerType.NOTES, Note(title="Altra idea"))
+        assert container_manager.get_generation(ContainerType.NOTES) > generation
+        assert container_manager.get_changed_members() == ["notes.json"]
+        assert container_manager.save_all(written)
+        assert written == {"notes.json"}
+        print("✓ Only the changed container was rewritten")
+
+        # Clean at an older generation: later changes stay pending
+        generation = container_manager.get_generation(ContainerType.NOTES)
+        container_manager.add_item(ContainerType.NOTES, Note(title="Terza idea"))
+        container_manager.mark_clean(ContainerType.NOTES, generation)
+        assert container_manager.is_dirty(ContainerType.NOTES)
+        print("✓ Changes after the saved generation stay dirty")
+
+        for i in range(ContainerManager.COMPACT_THRESHOLD):
+            container_manager.add_item(ContainerType.LOCATIONS, Location(name=f"Luogo {i}"))
+        assert container_manager.use_compact_format(ContainerType.LOCATIONS)
+        container_manager.save_container(ContainerType.LOCATIONS)
+        with open(Path(temp_dir) / "locations.json", encoding="utf-8") as f:
+            assert "\n" not in f.read()
+        print("✓ Large container written in compact form")
+
+    print("\n✅ TEST 8 PASSED\n")
+
+
 def run_all_tests():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -358,6 +453,8 @@ def run_all_tests():
         test_timeline_manager()
         test_source_manager()
         test_note_manager()
+        test_container_id_index()
+        test_save_all_skips_unchanged()
 
         print("=" * 60)
         print("🎉 ALL TESTS PASSED! 🎉")
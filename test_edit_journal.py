@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for the edit journal (crash recovery of unsaved changes)
+"""
+import sys
+import os
+import tempfile
+from managers.project_manager import ProjectManager
+from managers.edit_journal import EditJournal
+from models.project_type import ProjectType
+
+
+def test_journal_replayed_after_crash():
+    """Test that journaled changes are recovered when reopening"""
+    print("=" * 60)
+    print("TEST 1: Journal Replayed After Crash")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "crash.tnp")
+        pm = ProjectManager()
+        assert pm.create_new_project("Crash", "Author", project_file, project_type=ProjectType.NOVEL)
+
+        manager = pm.manuscript_structure_manager
+        chapter = manager.get_structure().get_all_chapters()[0]
+        new_scene = manager.add_scene(chapter.id, "Scena nuova")
+        manager.update_scene_content(new_scene.id, "Scritta dopo l'ultimo salvataggio")
+        location_id = pm.location_manager.add_location("Roma")
+
+        assert pm.journal_changes() > 0
+        assert pm.journal_changes() == 0
+        assert os.path.exists(EditJournal.get_journal_path(project_file))
+        print("✓ Changes journaled, repeated calls write nothing")
+
+        # Simulate a crash: the first manager is never closed
+        recovered = ProjectManager()
+        assert recovered.open_project(project_file)[0] is not None
+        assert recovered.has_recovered_changes()
+        scene = recovered.manuscript_structure_manager.get_scene(new_scene.id)
+        assert scene is not None
+        assert scene.content == "Scritta dopo l'ultimo salvataggio"
+        assert recovered.location_manager.get_location(location_id).name == "Roma"
+        print("✓ New scene, its content and the location were recovered")
+
+        assert recovered.save_project()
+        assert not os.path.exists(EditJournal.get_journal_path(project_file))
+        assert not recovered.has_recovered_changes()
+        recovered.close_project()
+        print("✓ Saving folds the journal into the archive")
+
+        reopened = ProjectManager()
+        assert reopened.open_project(project_file)[0] is not None
+        assert not reopened.has_recovered_changes()
+        assert reopened.manuscript_structure_manager.get_scene(new_scene.id).content == \
+            "Scritta dopo l'ultimo salvataggio"
+        reopened.close_project()
+
+
+def test_truncated_record_ignored():
+    """Test that a half-written record does not break recovery"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Truncated Journal Record")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "torn.tnp")
+        pm = ProjectManager()
+        assert pm.create_new_project("Torn", "Author", project_file, project_type=ProjectType.NOVEL)
+
+        scene = pm.manuscript_structure_manager.get_structure().get_all_scenes()[0]
+        pm.manuscript_structure_manager.update_scene_content(scene.id, "Salvata nel journal")
+        assert pm.journal_changes() > 0
+
+        with open(EditJournal.get_journal_path(project_file), 'a', encoding='utf-8') as f:
+            f.write('{"seq": 99, "type": "scene", "key": "')
+
+        recovered = ProjectManager()
+        assert recovered.open_project(project_file)[0] is not None
+        assert recovered.manuscript_structure_manager.get_scene(scene.id).content == "Salvata nel journal"
+        print("✓ Complete records replayed, torn tail ignored")
+
+        recovered.close_project()
+        assert not os.path.exists(EditJournal.get_journal_path(project_file))
+        print("✓ Closing the project removes the journal")
+
+
+def test_containers_saved_by_views_journaled():
+    """Test that containers written to the working directory are journaled"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Containers Saved By Views Are Journaled")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "views.tnp")
+        pm = ProjectManager()
+        assert pm.create_new_project("Views", "Author", project_file, project_type=ProjectType.NOVEL)
+
+        # Views save their container themselves: it is clean, but not in the archive
+        entry_id = pm.worldbuilding_manager.add_entry("Magia delle rune")
+        assert pm.worldbuilding_manager.save()
+        assert pm.journal_changes() > 0
+        assert pm.journal_changes() == 0
+        print("✓ Container written by save() journaled once")
+
+        # Simulate a crash: the first manager is never closed
+        recovered = ProjectManager()
+        assert recovered.open_project(project_file)[0] is not None
+        assert recovered.has_recovered_changes()
+        assert recovered.worldbuilding_manager.get_entry(entry_id).title == "Magia delle rune"
+        print("✓ Entry recovered from the journal")
+
+        assert recovered.save_project()
+        assert recovered.journal_changes() == 0
+        recovered.close_project()
+        print("✓ Nothing left to journal once saved to the archive")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_journal_replayed_after_crash()
+        test_truncated_record_ignored()
+        test_containers_saved_by_views_journaled()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled grammar rules
+"""
+import sys
+import re
+import random
+import time
+from analysis.grammar_rules import SimpleGrammarChecker, CompiledRuleSet, ExclusionZones
+
+
+_SENTENCES = [
+    "Il vento soffiava forte sulla collina e nessuno sapeva perche.",
+    "Lei era piu stanca del solito , ma continuava a camminare.",
+    "Era cosi buio che non vedevano nulla,cioe quasi nulla.",
+    "Aveva un idea precisa: trovare un amica per un ora.",
+    "Qual'è la strada? Di il vero, o fatto tutto quello che potevo.",
+    "Ce sono troppe ombre  in questa casa; la sera arriva presto.",
+    "Marco acelera il passo e acompagna la sorella fino a il ponte.",
+    "La mattina dopo partirono verso nord senza voltarsi indietro.",
+]
+
+
+def _manuscript(words):
+    """Italian-like text of about the given number of words"""
+    generator = random.Random(7)
+    paragraphs = []
+    count = 0
+    while count < words:
+        paragraph = " ".join(generator.choice(_SENTENCES) for _ in range(6))
+        paragraphs.append(paragraph)
+        count += len(paragraph.split())
+    return "\n".join(paragraphs)
+
+
+def _html_manuscript(words):
+    """Scene content as stored: HTML paragraphs with styles and links"""
+    paragraphs = []
+    for number, paragraph in enumerate(_manuscript(words).split("\n")):
+        paragraphs.append(
+            f'<p style="margin-top:0px; -qt-block-indent:0;"><span style="font-weight:600;">'
+            f'{paragraph[:40]}</span>{paragraph[40:]} <a href="https://esempio.it/{number}/perche">'
+            f'link</a> o scrivi a piu{number}@esempio.it.</p>')
+    return "\n".join(paragraphs)
+
+
+def _overlaps(start, end, exclusions):
+    """Original linear exclusion check"""
+    return any(start < zone_end and end > zone_start for zone_start, zone_end in exclusions)
+
+
+def _reference_check(checker, text):
+    """Errors found the original way: one re.finditer per rule"""
+    _, exclusions = checker._preprocess_text(text)
+    exclusions = list(exclusions)
+    errors = []
+    for rule in checker.rules:
+        for match in re.finditer(rule['pattern'], text, re.IGNORECASE):
+            if _overlaps(match.start(), match.end(), exclusions):
+                continue
+            errors.append({
+                'start': match.start(),
+                'end': match.end(),
+                'message': rule['message'],
+                'original': match.group(),
+                'suggestion': rule['replacement'],
+                'category': rule['category'],
+                'context': checker._get_context(text, match.start(), match.end())
+            })
+    return errors
+
+
+def test_rules_merged():
+    """Test which rules share the single literal pass"""
+    print("=" * 60)
+    print("TEST 1: Literal Rules Merged")
+    print("=" * 60)
+
+    checker = SimpleGrammarChecker()
+    rule_set = CompiledRuleSet(checker.rules)
+    patterns = {checker.rules[index]['pattern'] for index, _ in rule_set.separate_patterns}
+    assert r'\bla\b(?=\s+mattina|sera|notte)' in patterns
+    assert r'\s+([.,;:!?])' in patterns and r'\bperche\b' not in patterns
+    assert len(rule_set.merged_rules) + len(rule_set.separate_patterns) == len(checker.rules)
+    print(f"✓ {len(rule_set.merged_rules)} literal rules in one pass, "
+          f"{len(rule_set.separate_patterns)} separate passes")
+
+    overlapping = CompiledRuleSet([
+        {'pattern': r'\bdi il\b'}, {'pattern': r'\bil vento\b'}, {'pattern': r'\bacelera'},
+        {'pattern': r'\baceleratore\b'}, {'pattern': r'\bpiu\b'},
+    ])
+    assert overlapping.merged_rules == [4]
+    print("✓ Literal rules that could overlap keep their own pass")
+
+
+def test_same_errors():
+    """Test that the compiled rules report the same errors as per-rule scans"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Same Errors As Per-Rule Scans")
+    print("=" * 60)
+
+    checker = SimpleGrammarChecker()
+    text = _manuscript(3000) + (
+        "\nVedi <a href=\"https://esempio.it/perche\">questo link</a> o scrivi a piu@esempio.it.")
+    errors = checker.check(text)
+    assert errors and errors == _reference_check(checker, text)
+    assert checker.check("") == []
+    print(f"✓ {len(errors)} identical errors, in the same order")
+
+    checker.add_custom_rule(r'\bil vento\b', 'la brezza', "Prova")
+    checker.add_custom_rule(r'\bvento soffiava\b', 'brezza soffiava', "Prova")
+    assert checker.check(text) == _reference_check(checker, text)
+    print("✓ Custom rules (even overlapping ones) picked up")
+
+
+def test_throughput():
+    """Benchmark: check a 100k-word manuscript"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Throughput On 100k Words")
+    print("=" * 60)
+
+    checker = SimpleGrammarChecker()
+    text = _manuscript(100000)
+    checker.check("")  # Compile outside the measure
+
+    start = time.perf_counter()
+    reference = _reference_check(checker, text)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    errors = checker.check(text)
+    compiled_time = time.perf_counter() - start
+
+    assert errors == reference
+    print(f"  per-rule scans: {reference_time:.2f}s, compiled rules: {compiled_time:.2f}s "
+          f"({len(text.split()) / compiled_time:,.0f} words/s)")
+    assert compiled_time < reference_time
+    print("✓ Compiled rules faster than one scan per rule")
+
+
+def test_exclusion_zones():
+    """Test the bisect exclusion index and the zone-skipping tokenizer"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Exclusion Zones")
+    print("=" * 60)
+
+    zones = ExclusionZones([(10, 20), (5, 12), (30, 35), (35, 40)])
+    assert list(zones) == [(5, 20), (30, 40)] and len(zones) == 2
+    assert zones.contains(5) and not zones.contains(20) and not zones.contains(25)
+    assert zones.overlaps(19, 22) and zones.overlaps(0, 6) and not zones.overlaps(20, 30)
+    assert not ExclusionZones().overlaps(0, 10)
+    print("✓ Zones merged, lookups by bisect")
+
+    checker = SimpleGrammarChecker()
+    text = _html_manuscript(20000)
+    _, exclusions = checker._preprocess_text(text)
+    pattern = re.compile(r"\b[\w']+\b")
+    linear = list(exclusions)
+
+    start = time.perf_counter()
+    expected = [match.span() for match in pattern.finditer(text)
+                if not _overlaps(match.start(), match.end(), linear)]
+    linear_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    words = [match.span() for match in exclusions.iter_matches(pattern, text)]
+    zones_time = time.perf_counter() - start
+
+    assert words == expected
+    assert checker.check(text) == _reference_check(checker, text)
+    print(f"  {len(exclusions)} zones, {len(words)} words: linear filter {linear_time:.2f}s, "
+          f"zone skipping {zones_time:.3f}s")
+    assert zones_time < linear_time
+    print("✓ Same words and errors as filtering every match")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_rules_merged()
+        test_same_errors()
+        test_throughput()
+        test_exclusion_zones()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental .tnp saving (dirty tracking + member reuse)
+"""
+import sys
+import os
+import tempfile
+import zipfile
+import json
+from managers.project_manager import ProjectManager
+from models.project_type import ProjectType
+from models.manuscript_structure import ManuscriptStructure
+from managers.project_saver import write_snapshot
+from utils.backup_manager import BackupManager
+from models.container_type import ContainerType
+
+
+def _member_offsets(filepath):
+    """Map member name -> (CRC, compressed size) for an archive"""
+    with zipfile.ZipFile(filepath, 'r') as zipf:
+        return {info.filename: (info.CRC, info.compress_size) for info in zipf.infolist()}
+
+
+def test_clean_managers_after_open():
+    """Test that freshly opened projects have no pending changes"""
+    print("=" * 60)
+    print("TEST 1: Managers Are Clean After Open")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "clean.tnp")
+        pm = ProjectManager()
+        assert pm.create_new_project("Clean", "Author", project_file, project_type=ProjectType.NOVEL)
+
+        assert not pm.manuscript_structure_manager.is_dirty()
+        assert not pm.character_manager.is_dirty()
+        assert not pm.statistics_manager.is_dirty()
+        assert pm.container_manager.get_dirty_containers() == []
+        print("✓ No manager reports changes after open")
+
+        pm.character_manager.add_character("Mario")
+        assert pm.character_manager.is_dirty()
+        print("✓ Adding a character marks characters dirty")
+
+        pm.close_project()
+
+
+def test_unchanged_members_are_reused():
+    """Test that a scene edit does not rewrite images or characters"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Unchanged Members Are Copied Verbatim")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "images.tnp")
+        image_file = os.path.join(temp_dir, "portrait.png")
+        with open(image_file, 'wb') as f:
+            f.write(os.urandom(64 * 1024))
+
+        pm = ProjectManager()
+        assert pm.create_new_project("Images", "Author", project_file, project_type=ProjectType.NOVEL)
+        character = pm.character_manager.add_character("Mario")
+        image_name = pm.character_manager.add_image_to_character(character.id, image_file)
+        assert pm.save_project()
+        assert not pm.character_manager.is_dirty()
+
+        before = _member_offsets(project_file)
+        assert f"images/{image_name}" in before
+        print(f"✓ Saved project with image {image_name}")
+
+        scene = pm.manuscript_structure_manager.get_structure().get_all_scenes()[0]
+        pm.manuscript_structure_manager.update_scene_content(scene.id, "C'era una volta")
+        assert pm.manuscript_structure_manager.is_dirty()
+        assert pm.save_project()
+
+        after = _member_offsets(project_file)
+        assert after[f"images/{image_name}"] == before[f"images/{image_name}"]
+        assert after['characters.json'] == before['characters.json']
+        assert after['manuscript_structure.json'] != before['manuscript_structure.json']
+        print("✓ Only the manuscript changed between saves")
+
+        with zipfile.ZipFile(project_file, 'r') as zipf:
+            assert zipf.testzip() is None
+        print("✓ Archive passes integrity check")
+
+        pm.close_project()
+
+        reopened = ProjectManager()
+        project, _, characters = reopened.open_project(project_file)
+        assert project is not None
+        assert reopened.manuscript_structure_manager.get_scene(scene.id).content == "C'era una volta"
+        assert characters[-1].images == [image_name]
+        print("✓ Reopened project has the edited scene and the image")
+        reopened.close_project()
+
+
+def test_per_scene_layout_migration():
+    """Test that single-file manuscripts are split into per-scene members"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Per-Scene Layout Migration")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "old_layout.tnp")
+
+        structure = ManuscriptStructure.create_default(use_parts=True)
+        scene = structure.get_all_scenes()[0]
+        scene.update_content("<p>Contenuto della vecchia scena</p>")
+
+        with zipfile.ZipFile(project_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr('manifest.json', json.dumps({
+                'title': 'Old Layout', 'author': 'Author', 'created_date': '2024-01-01T00:00:00'
+            }))
+            zipf.writestr('characters.json', json.dumps({'characters': []}))
+            zipf.writestr('manuscript_structure.json', json.dumps(structure.to_dict()))
+
+        pm = ProjectManager()
+        project, _, _ = pm.open_project(project_file)
+        assert project is not None
+        assert pm.manuscript_structure_manager.get_dirty_scene_ids() == {scene.id}
+        assert pm.save_project()
+        pm.close_project()
+
+        member = ManuscriptStructure.get_scene_member_name(scene.id)
+        with zipfile.ZipFile(project_file, 'r') as zipf:
+            index = json.loads(zipf.read('manuscript_structure.json'))
+            assert ManuscriptStructure.is_scene_layout(index)
+            assert 'content' not in index['parts'][0]['chapters'][0]['scenes'][0]
+            assert zipf.read(member).decode('utf-8') == "<p>Contenuto della vecchia scena</p>"
+        print(f"✓ Scene content stored in {member}")
+
+        reopened = ProjectManager()
+        assert reopened.open_project(project_file)[0] is not None
+        loaded = reopened.manuscript_structure_manager.get_scene(scene.id)
+        assert loaded.content == "<p>Contenuto della vecchia scena</p>"
+        print("✓ Scene content read back from its own member")
+        reopened.close_project()
+
+
+def test_snapshot_isolated_from_later_edits():
+    """Test that edits made while a snapshot is written go to the next save"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Save Snapshot Is Consistent")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "snapshot.tnp")
+        pm = ProjectManager()
+        assert pm.create_new_project("Snapshot", "Author", project_file, project_type=ProjectType.NOVEL)
+
+        manager = pm.manuscript_structure_manager
+        scene = manager.get_structure().get_all_scenes()[0]
+        manager.update_scene_content(scene.id, "Prima versione")
+        character = pm.character_manager.add_character("Mario")
+
+        snapshot = pm.begin_save()
+        assert snapshot is not None and pm.is_saving()
+        assert not manager.is_dirty() and not pm.character_manager.is_dirty()
+
+        # The user keeps working while the archive is being written
+        manager.update_scene_content(scene.id, "Seconda versione")
+        character.name = "Luigi"
+
+        assert write_snapshot(snapshot)
+        assert pm.finish_save(snapshot)
+        assert not pm.is_saving()
+
+        member = ManuscriptStructure.get_scene_member_name(scene.id)
+        with zipfile.ZipFile(project_file, 'r') as zipf:
+            assert zipf.read(member).decode('utf-8') == "Prima versione"
+            characters = json.loads(zipf.read('characters.json'))['characters']
+            assert characters[-1]['name'] == "Mario"
+        assert manager.get_dirty_scene_ids() == {scene.id}
+        print("✓ Archive holds the snapshot, later edits are still pending")
+
+        # A failed write gives the changes back to the managers
+        pm.character_manager.mark_dirty()
+        missing_dir_file = os.path.join(temp_dir, "missing", "snapshot.tnp")
+        assert not pm.save_project(missing_dir_file)
+        assert pm.current_filepath == project_file
+        assert manager.get_dirty_scene_ids() == {scene.id}
+        assert pm.character_manager.is_dirty()
+        print("✓ Failed save restores the pending changes")
+
+        # The backup of the replaced file is labelled with the kind of save
+        operations = []
+        original = BackupManager.create_backup
+        BackupManager.create_backup = lambda manager, path, operation="manual": operations.append(operation)
+        try:
+            assert pm.save_project()
+            pm.character_manager.mark_dirty()
+            snapshot = pm.begin_save(backup_operation="auto_save")
+            assert write_snapshot(snapshot) and pm.finish_save(snapshot)
+        finally:
+            BackupManager.create_backup = original
+        assert operations == ["save", "auto_save"]
+        print("✓ Backups labelled save or auto_save")
+        pm.close_project()
+
+        reopened = ProjectManager()
+        assert reopened.open_project(project_file)[0] is not None
+        assert reopened.manuscript_structure_manager.get_scene(scene.id).content == "Seconda versione"
+        assert reopened.character_manager.get_all_characters()[-1].name == "Luigi"
+        print("✓ Next save writes the later edits")
+        reopened.close_project()
+
+
+def test_containers_loaded_on_demand():
+    """Test that opening a project leaves containers on disk until used"""
+    print("\n" + "=" * 60)
+    print("TEST 5: Containers Are Loaded On Demand")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "lazy.tnp")
+        pm = ProjectManager()
+        assert pm.create_new_project("Lazy", "Author", project_file, project_type=ProjectType.NOVEL)
+        location_id = pm.location_manager.add_location("Roma")
+        assert pm.save_project()
+        pm.close_project()
+
+        reopened = ProjectManager()
+        assert reopened.open_project(project_file)[0] is not None
+        containers = reopened.container_manager
+        assert not containers.is_loaded(ContainerType.LOCATIONS)
+        assert not containers.is_loaded(ContainerType.TIMELINE)
+        scenes = reopened.manuscript_structure_manager.get_all_scenes()
+        assert not any(scene.is_content_loaded() for scene in scenes)
+        print("✓ No container and no scene content loaded by open_project")
+
+        # Saving copies the untouched containers and scenes without loading them
+        reopened.manuscript_structure_manager.mark_dirty()
+        assert reopened.save_project()
+        assert not containers.is_loaded(ContainerType.LOCATIONS)
+        assert not any(scene.is_content_loaded() for scene in scenes)
+        print("✓ Saving leaves unused containers and scenes unloaded")
+
+        assert reopened.location_manager.get_location(location_id).name == "Roma"
+        assert containers.is_loaded(ContainerType.LOCATIONS)
+        print("✓ First manager call loads the container")
+
+        loaded = []
+        while True:
+            container_type = reopened.prefetch_next_container()
+            if container_type is None:
+                break
+            loaded.append(container_type)
+        assert ContainerType.LOCATIONS not in loaded and ContainerType.TIMELINE in loaded
+        assert all(containers.is_loaded(ct) for ct in loaded)
+        print(f"✓ Prefetch loaded the remaining {len(loaded)} containers one at a time")
+        reopened.close_project()
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n")
+    print("╔" + "=" * 58 + "╗")
+    print("║" + " " * 14 + "INCREMENTAL SAVE TEST SUITE" + " " * 17 + "║")
+    print("╚" + "=" * 58 + "╝")
+    print("\n")
+
+    try:
+        test_clean_managers_after_open()
+        test_unchanged_members_are_reused()
+        test_per_scene_layout_migration()
+        test_snapshot_isolated_from_later_edits()
+        test_containers_loaded_on_demand()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
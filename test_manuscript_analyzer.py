@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test script for the whole-manuscript analysis
+"""
+import multiprocessing
+import sys
+import time
+from analysis.analysis_cache import AnalysisCache
+from analysis.manuscript_analyzer import ManuscriptAnalyzer, ManuscriptScene
+from analysis.nlp_manager import nlp_manager
+from managers.manuscript_structure_manager import ManuscriptStructureManager
+from fake_nlp import FakeDoc, FakeModel
+
+
+def _manager():
+    """Manuscript of two chapters (and an empty scene, not analysed)"""
+    manager = ManuscriptStructureManager()
+    first = manager.get_all_chapters()[0]
+    scene = manager.get_scenes_in_chapter(first.id)[0]
+    manager.update_scene_content(scene.id, "<p>Il vento soffiava sulla collina.</p>")
+    scene = manager.add_scene(first.id, "Scene 2")
+    manager.update_scene_content(scene.id, "La collina era verde. Il vento freddo.")
+
+    second = manager.add_chapter("Chapter 2")
+    scene = manager.add_scene(second.id, "Scene 3")
+    manager.update_scene_content(scene.id, "Il mare e la collina.")
+    manager.add_scene(second.id, "Empty")
+    return manager
+
+
+def _long_scenes(count, words=1000):
+    """Scenes of realistic size, in two chapters"""
+    sentence = "Il vento soffiava forte sulla collina e nessuno sapeva dove andare."
+    text = " ".join([sentence] * (words // len(sentence.split())))
+    return [ManuscriptScene(f"s{i}", f"Scene {i}", f"c{i % 2}", f"Chapter {i % 2}", f"h{i}", f"{text} Scena{i}.")
+            for i in range(count)]
+
+
+def _analyze(analyzer, scenes, model, **kwargs):
+    """Run the analysis with the given model"""
+    original = nlp_manager.get_spacy_model
+    nlp_manager.get_spacy_model = lambda language=None: model
+    try:
+        return analyzer.analyze(scenes, **kwargs)
+    finally:
+        nlp_manager.get_spacy_model = original
+
+
+def test_aggregation():
+    """Test the statistics per scene, chapter and book"""
+    print("=" * 60)
+    print("TEST 1: Statistics Per Scene, Chapter And Book")
+    print("=" * 60)
+
+    scenes = ManuscriptAnalyzer.collect_scenes(_manager())
+    assert [scene.title for scene in scenes] == ["Scene 1", "Scene 2", "Scene 3"]
+    assert scenes[0].text == "Il vento soffiava sulla collina."
+    print("✓ Non-empty scenes collected in reading order, as plain text")
+
+    model = FakeModel()
+    analyzer = ManuscriptAnalyzer(batch_size=4, n_process=1)
+    result = _analyze(analyzer, scenes, model)
+    assert result['success'] and result['scene_count'] == 3 and result['analysed_scenes'] == 3
+    assert model.pipe_calls == [{'batch_size': 3, 'n_process': 1, 'disable': ['ner']}]
+    print("✓ One nlp.pipe stream, unused components disabled")
+
+    whole = analyzer.repetitions_analyzer.merge_partials(
+        [analyzer.repetitions_analyzer.partial_from_doc(FakeDoc(" ".join(scene.text for scene in scenes)))])
+    book = result['book']
+    assert book['repetitions'] == whole
+    assert book['style']['num_words'] == 17 and book['style']['num_sentences'] == 4
+    assert book['pos_counts'] == {'NOUN': 11, 'DET': 6}
+    print("✓ Book totals equal the analysis of the whole text")
+
+    chapters = result['chapters']
+    assert [chapter['title'] for chapter in chapters] == ["Chapter 1", "Chapter 2"]
+    assert [chapter['scene_count'] for chapter in chapters] == [2, 1]
+    assert ("collina", 2) in chapters[0]['repetitions']['repetitions']
+    assert [scene['chapter_id'] for scene in result['scenes']] == [chapters[0]['id']] * 2 + [chapters[1]['id']]
+    assert result['scenes'][2]['style']['num_words'] == 5
+    assert "Chapter 2" in analyzer.format_results(result)
+    print("✓ Chapter and scene statistics")
+
+
+def test_pipe_settings():
+    """Test the choice of batch size and number of processes"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Batch Size And Processes")
+    print("=" * 60)
+
+    analyzer = ManuscriptAnalyzer(batch_size=8, n_process=16)
+    assert analyzer.get_pipe_settings(400) == (8, 16)
+    assert analyzer.get_pipe_settings(40) == (3, 16)
+    print("✓ Every one of 16 processes gets batches")
+
+    assert analyzer.get_pipe_settings(3) == (3, 1)
+    assert analyzer.get_pipe_settings(0) == (1, 1)
+    print("✓ A few scenes parsed without starting processes")
+
+    assert ManuscriptAnalyzer().get_pipe_settings(10000)[1] >= 1
+    print("✓ One process per CPU core by default")
+
+
+def test_cache_progress_and_cancel():
+    """Test that unchanged scenes are not parsed again, progress and cancellation"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Cache, Progress And Cancellation")
+    print("=" * 60)
+
+    manager = _manager()
+    cache = AnalysisCache()
+    analyzer = ManuscriptAnalyzer(n_process=1)
+    model = FakeModel()
+    progress = []
+
+    first = _analyze(analyzer, ManuscriptAnalyzer.collect_scenes(manager), model,
+                     analysis_cache=cache, progress=lambda done, total: progress.append((done, total)))
+    assert progress == [(0, 3), (1, 3), (2, 3), (3, 3)]
+    print("✓ Progress reported after each scene")
+
+    scene = manager.get_all_scenes()[1]
+    manager.update_scene_content(scene.id, "La collina era verde. Il vento gelido.")
+    progress.clear()
+    second = _analyze(analyzer, ManuscriptAnalyzer.collect_scenes(manager), model,
+                      analysis_cache=cache, progress=lambda done, total: progress.append((done, total)))
+    assert model.parsed[3:] == ["La collina era verde. Il vento gelido."]
+    assert second['analysed_scenes'] == 1 and progress == [(2, 3), (3, 3)]
+    assert second['book']['style']['num_words'] == first['book']['style']['num_words']
+    print("✓ Only the edited scene parsed again")
+
+    cache.clear()
+    cancelled = _analyze(analyzer, ManuscriptAnalyzer.collect_scenes(manager), model,
+                         analysis_cache=cache, is_cancelled=lambda: True)
+    assert cancelled['cancelled'] and not cancelled['success'] and len(cache) == 2
+    print("✓ Cancelled after the scene being parsed")
+
+    assert not _analyze(analyzer, ManuscriptAnalyzer.collect_scenes(manager), None)['success']
+    print("✓ Error without a model")
+
+
+def test_worker_processes():
+    """Test the process pool with scenes of realistic size, and its cancellation"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Worker Processes")
+    print("=" * 60)
+
+    scenes = _long_scenes(16)
+    single = _analyze(ManuscriptAnalyzer(n_process=1), scenes, FakeModel())
+    result = _analyze(ManuscriptAnalyzer(batch_size=2, n_process=4), scenes, FakeModel())
+    assert result['n_process'] == 4 and result['analysed_scenes'] == 16
+    assert result['book'] == single['book'] and result['chapters'] == single['chapters']
+    assert result['scenes'] == single['scenes']
+    print("✓ Same statistics with four processes")
+
+    progress = []
+    start = time.perf_counter()
+    cancelled = _analyze(ManuscriptAnalyzer(batch_size=2, n_process=4), scenes, FakeModel(),
+                         progress=lambda done, total: progress.append(done), is_cancelled=lambda: True)
+    elapsed = time.perf_counter() - start
+    assert cancelled['cancelled'] and progress == [0, 1]
+    assert multiprocessing.active_children() == []
+    print(f"✓ Cancelled in {elapsed:.2f}s, no worker process left")
+
+    try:
+        import spacy
+    except ImportError:
+        print("⚠ spaCy not installed (skipping spaCy pipeline test)")
+        return
+
+    nlp = spacy.blank('it')
+    nlp.add_pipe('sentencizer')
+    single = _analyze(ManuscriptAnalyzer(n_process=1), scenes, nlp)
+    result = _analyze(ManuscriptAnalyzer(batch_size=2, n_process=4), scenes, nlp)
+    assert result['book'] == single['book'] and result['chapters'] == single['chapters']
+    cancelled = _analyze(ManuscriptAnalyzer(batch_size=2, n_process=4), scenes, nlp,
+                         is_cancelled=lambda: True)
+    assert cancelled['cancelled'] and multiprocessing.active_children() == []
+    print("✓ spaCy pipeline: same statistics, cancelled without leftover processes")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_aggregation()
+        test_pipe_settings()
+        test_cache_progress_and_cancel()
+        test_worker_processes()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Test script for the manuscript models and structure manager
+"""
+import sys
+import time
+from models.manuscript_structure import Scene, Chapter, ManuscriptStructure, ManuscriptText
+from managers.manuscript_structure_manager import ManuscriptStructureManager
+from managers.statistics_manager import StatisticsManager
+
+
+def test_scene_cached_values():
+    """Test that plain text, word count and hash follow content writes"""
+    print("=" * 60)
+    print("TEST 1: Scene Cached Values")
+    print("=" * 60)
+
+    scene = Scene.create_new("Scena", order=0, content="<p>Nel mezzo del <b>cammin</b></p>")
+    assert scene.plain_text == "Nel mezzo del cammin"
+    assert scene.word_count == 4
+    first_hash = scene.content_hash
+    print("✓ Derived values computed from HTML content")
+
+    scene.update_content("<p>Nel mezzo del cammin di nostra vita</p>")
+    assert scene.word_count == 7
+    assert scene.content_hash != first_hash
+    scene.content = ""
+    assert scene.word_count == 0 and scene.plain_text == ""
+    print("✓ Writing the content invalidates the cache")
+
+    # Deferred content keeps the word count stored in the index
+    restored = Scene.from_dict(scene.to_index_dict() | {'word_count': 12})
+    restored.set_content_loader(lambda scene_id: "uno due tre")
+    assert not restored.is_content_loaded()
+    assert restored.word_count == 12
+    assert restored.content == "uno due tre" and restored.is_content_loaded()
+    restored.update_content("uno due")
+    assert restored.word_count == 2
+    print("✓ Deferred content loads on access, index word count kept until then")
+
+    assert not hasattr(scene, '__dict__') and not hasattr(Chapter("c", "C"), '__dict__')
+    structure = ManuscriptStructure.create_default()
+    assert ManuscriptStructure.from_dict(structure.to_dict()) == structure
+    print("✓ Models use __slots__ and round-trip through to_dict")
+
+
+def test_keystroke_cost_is_flat():
+    """Microbenchmark: per-keystroke update cost must not grow with scene size"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Per-Keystroke Cost")
+    print("=" * 60)
+
+    paragraph = "<p>Era una notte buia e tempestosa, e il vento soffiava forte.</p>"
+    keystrokes = 200
+
+    def cost_per_keystroke(paragraphs: int) -> float:
+        base = paragraph * paragraphs
+        versions = [base + "x" * i for i in range(keystrokes)]
+        scene = Scene.create_new("Bench", order=0, content=base)
+        start = time.perf_counter()
+        for content in versions:
+            scene.update_content(content)
+        return (time.perf_counter() - start) / keystrokes
+
+    small = min(cost_per_keystroke(10) for _ in range(3))
+    large = min(cost_per_keystroke(5000) for _ in range(3))
+    print(f"  ~120 words:   {small * 1e6:.2f} µs/keystroke")
+    print(f"  ~60000 words: {large * 1e6:.2f} µs/keystroke")
+
+    # Rescanning the text would make the large scene hundreds of times slower
+    assert large < small * 10 + 20e-6
+    print("✓ Update cost independent of scene size")
+
+
+def test_structure_id_index():
+    """Test that the manager's ID index follows every mutation"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Structure ID Index")
+    print("=" * 60)
+
+    manager = ManuscriptStructureManager(ManuscriptStructure.create_default(use_parts=True))
+    first_part = manager.get_all_parts()[0]
+    part = manager.add_part("Parte II")
+    chapter = manager.add_chapter("Capitolo", part_id=part.id)
+    scene = manager.add_scene(chapter.id, "Scena")
+    assert manager.check_index() == []
+    assert manager.locate(scene.id) == (part, chapter, scene)
+    assert manager.locate(chapter.id) == (part, chapter, None)
+    assert manager.get_chapter_for_scene(scene.id) is chapter
+    assert manager.get_part_for_chapter(chapter.id) is part
+    print("✓ Added parts, chapters and scenes are indexed")
+
+    manager.reorder_scenes(chapter.id, [s.id for s in reversed(chapter.scenes)])
+    manager.reorder_parts([part.id, first_part.id])
+    assert manager.delete_scene(scene.id)
+    assert manager.locate(scene.id) is None
+    assert manager.delete_chapter(chapter.id)
+    assert manager.locate(chapter.id) is None and manager.get_part(part.id) is part
+    assert manager.delete_part(part.id)
+    assert manager.get_part(part.id) is None
+    assert manager.check_index() == []
+    print("✓ Reorders and deletions keep the index consistent")
+
+    manager.set_structure(ManuscriptStructure.create_default())
+    assert manager.check_index() == [] and manager.get_part(first_part.id) is None
+    print("✓ Replacing the structure rebuilds the index")
+
+    # 2,000 scenes: lookups must not walk the structure
+    big = ManuscriptStructureManager(ManuscriptStructure.create_default())
+    chapter_id = big.get_all_chapters()[0].id
+    for i in range(100):
+        chapter_id = big.add_chapter(f"Capitolo {i}").id
+        for j in range(20):
+            big.add_scene(chapter_id, f"Scena {j}")
+    assert big.check_index() == []
+    last_scene = big.get_scenes_in_chapter(chapter_id)[-1]
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        big.get_chapter_for_scene(last_scene.id)
+    indexed = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(100):
+        big.get_structure().get_chapter_for_scene(last_scene.id)
+    walked = (time.perf_counter() - start) * 100
+    print(f"  10000 lookups: {indexed * 1e3:.2f} ms indexed, ~{walked * 1e3:.0f} ms walking the structure")
+    assert indexed < walked / 10
+    print("✓ Lookups in a 2,000+ scene manuscript are constant time")
+
+
+def test_reading_order_navigation():
+    """Test that the cached reading order follows structure changes"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Reading Order Navigation")
+    print("=" * 60)
+
+    manager = ManuscriptStructureManager(ManuscriptStructure.create_default())
+    first_chapter = manager.get_all_chapters()[0]
+    second_chapter = manager.add_chapter("Capitolo 2")
+    a = manager.get_scenes_in_chapter(first_chapter.id)[0]
+    b = manager.add_scene(first_chapter.id, "B")
+    c = manager.get_scenes_in_chapter(second_chapter.id)[0]
+
+    assert [s.id for s in manager.get_all_scenes()] == [a.id, b.id, c.id]
+    assert manager.get_next_scene(b.id) is c and manager.get_previous_scene(c.id) is b
+    assert manager.get_previous_scene(a.id) is None and manager.get_next_scene(c.id) is None
+    print("✓ Next/previous follow chapters and scenes in order")
+
+    manager.reorder_scenes(first_chapter.id, [b.id, a.id])
+    assert manager.get_next_scene(b.id) is a and manager.get_next_scene(a.id) is c
+    manager.reorder_chapters([second_chapter.id, first_chapter.id])
+    assert [s.id for s in manager.get_all_scenes()] == [c.id, b.id, a.id]
+    assert manager.get_first_scene_in_chapter(first_chapter.id) is b
+    assert manager.check_index() == []
+    print("✓ Reordering rebuilds the reading order")
+
+    manager.delete_scene(b.id)
+    assert manager.get_next_scene(c.id) is a
+    text = manager.get_full_manuscript_text()
+    assert text == manager.get_structure().get_full_text()
+    assert text.index("# Capitolo 2") < text.index("# Chapter 1")
+    print("✓ Deleting a scene relinks its neighbours, full text follows the order")
+
+
+def test_word_count_rollups():
+    """Test that chapter/part totals follow edits through deltas"""
+    print("\n" + "=" * 60)
+    print("TEST 5: Word Count Rollups")
+    print("=" * 60)
+
+    manager = ManuscriptStructureManager(ManuscriptStructure.create_default(use_parts=True))
+    part = manager.get_all_parts()[0]
+    chapter = manager.get_chapters_in_part(part.id)[0]
+    other_chapter = manager.add_chapter("Capitolo 2", part_id=part.id)
+    first = manager.get_scenes_in_chapter(chapter.id)[0]
+    second = manager.add_scene(chapter.id, "Seconda")
+
+    manager.update_scene_content(first.id, "uno due tre")
+    manager.update_scene_content(second.id, "quattro cinque")
+    assert chapter.get_total_word_count() == 5 and part.get_total_word_count() == 5
+    print("✓ Totals computed on first read")
+
+    manager.update_scene_content(first.id, "<p>uno</p>")
+    manager.update_scene_content(manager.get_scenes_in_chapter(other_chapter.id)[0].id, "sei sette")
+    assert chapter.get_total_word_count() == 3
+    assert part.get_total_word_count() == 5
+    assert manager.get_total_word_count() == 5
+    print("✓ Edits update chapter and part totals by their delta")
+
+    manager.delete_scene(second.id)
+    assert chapter.get_total_word_count() == 1 and manager.get_total_word_count() == 3
+    manager.delete_chapter(other_chapter.id)
+    assert part.get_total_word_count() == 1
+
+    summary = manager.word_count_summary()
+    assert summary == {'total': 1, 'scenes': 1, 'chapters': {chapter.id: 1}, 'parts': {part.id: 1}}
+    fresh = ManuscriptStructure.from_dict(manager.to_dict())
+    assert fresh.get_total_word_count() == summary['total']
+    print("✓ Deletions subtract their words, summary matches a full recount")
+
+
+def test_lazy_manuscript_text():
+    """Test that the manuscript view streams scenes and matches the full text"""
+    print("\n" + "=" * 60)
+    print("TEST 6: Lazy Manuscript Text")
+    print("=" * 60)
+
+    manager = ManuscriptStructureManager(ManuscriptStructure.create_default(use_parts=True))
+    part = manager.get_all_parts()[0]
+    chapter = manager.get_chapters_in_part(part.id)[0]
+    first = manager.get_scenes_in_chapter(chapter.id)[0]
+    manager.update_scene_content(first.id, "Era una notte buia.\nPioveva!")
+    second = manager.add_scene(manager.add_chapter("Capitolo 2", part_id=part.id).id, "Seconda")
+
+    view = manager.get_manuscript_text()
+    assert isinstance(view, ManuscriptText)
+    assert view.text == manager.get_full_manuscript_text() == str(view)
+    assert len(view) == view.get_length() == len(view.text)
+    assert [s.id for s in view.iter_scenes()] == [s.id for s in manager.get_all_scenes()]
+    print("✓ View matches the materialised manuscript text")
+
+    # The view follows later edits instead of holding a copy
+    manager.update_scene_content(second.id, "Fine.")
+    assert view.text.endswith("Fine.") and view == manager.get_full_manuscript_text()
+    print("✓ View reflects edits made after it was created")
+
+    # Deferred scenes are loaded only when the text is actually read
+    loaded = []
+    scene = Scene.from_dict(first.to_index_dict() | {'word_count': 3})
+    scene.set_content_loader(lambda scene_id: loaded.append(scene_id) or "uno due tre")
+    lazy_chapter = Chapter("c", "Capitolo")
+    lazy_chapter.add_scene(scene)
+    lazy = ManuscriptText(lambda: [(None, [(lazy_chapter, [scene])])])
+    assert not scene.is_content_loaded() and loaded == []
+    assert lazy.text == "# Capitolo\n\nuno due tre" and loaded == [scene.id]
+    print("✓ Creating a view loads no scene content")
+
+    # Streaming statistics match counting the materialised string
+    streamed, joined = StatisticsManager(), StatisticsManager()
+    streamed.update_manuscript_stats(view)
+    joined.update_manuscript_stats(view.text)
+    assert streamed.get_stats().to_dict() == joined.get_stats().to_dict()
+    assert not ManuscriptText(lambda: []) and ManuscriptText(lambda: []).get_length() == 0
+    print("✓ Statistics computed chunk by chunk match the full text")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_scene_cached_values()
+        test_keystroke_cost_is_flat()
+        test_structure_id_index()
+        test_reading_order_navigation()
+        test_word_count_rollups()
+        test_lazy_manuscript_text()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the debounced sync of manuscript edits to the model
+"""
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# QApplication shared by the tests (created on first use)
+_app = None
+
+
+def _create_view():
+    """ManuscriptView recording the emitted scene contents, or None without Qt"""
+    global _app
+    try:
+        from PySide6.QtWidgets import QApplication
+        from ui.components.manuscript_view import ManuscriptView
+    except ImportError as e:
+        print(f"⚠ UI dependencies not installed: {e} (skipping)")
+        return None, None
+
+    _app = QApplication.instance() or QApplication(sys.argv)
+    view = ManuscriptView()
+    emitted = []
+    view.scene_content_changed.connect(lambda scene_id, content: emitted.append((scene_id, content)))
+    return view, emitted
+
+
+def _type(view, text):
+    """Type text at the end of the editor"""
+    from PySide6.QtGui import QTextCursor
+    view.editor.editor.moveCursor(QTextCursor.MoveOperation.End)
+    view.editor.editor.insertPlainText(text)
+
+
+def test_debounced_flush():
+    """Test that edits reach the model once typing pauses or on flush"""
+    print("=" * 60)
+    print("TEST 1: Debounced Flush")
+    print("=" * 60)
+
+    view, emitted = _create_view()
+    if view is None:
+        return
+
+    from PySide6.QtTest import QTest
+
+    view.load_scene("s1", "Chapter 1", "Scene 1", "<p>Il vento</p>")
+    _type(view, " soffiava")
+    assert emitted == []
+    print("✓ Keystrokes not sent to the model")
+
+    QTest.qWait(view.FLUSH_DELAY_MS + 300)
+    assert len(emitted) == 1 and emitted[0][0] == "s1" and "soffiava" in emitted[0][1]
+    print("✓ Edits sent once typing pauses")
+
+    _type(view, " forte")
+    assert view.flush_pending_changes() and "forte" in emitted[-1][1]
+    assert not view.flush_pending_changes() and len(emitted) == 2
+    print("✓ Explicit flush sends pending edits only once")
+
+
+def test_no_edits_lost():
+    """Test that loading a scene or renaming does not drop unflushed edits"""
+    print("\n" + "=" * 60)
+    print("TEST 2: No Unflushed Edits Lost")
+    print("=" * 60)
+
+    view, emitted = _create_view()
+    if view is None:
+        return
+
+    view.load_scene("s1", "Chapter 1", "Scene 1", "<p>Il vento</p>")
+    _type(view, " gelido")
+    view.set_breadcrumb("Chapter 1", "Renamed")
+    assert emitted == [] and "gelido" in view.editor.get_text()
+    assert "Renamed" in view.breadcrumb_label.text()
+    print("✓ Rename updates the breadcrumb, edits stay pending")
+
+    view.load_scene("s2", "Chapter 1", "Scene 2", "<p>Il mare</p>")
+    assert len(emitted) == 1 and emitted[0][0] == "s1" and "gelido" in emitted[0][1]
+    assert view.get_current_scene_id() == "s2" and not view.flush_pending_changes()
+    print("✓ Loading another scene flushes the previous one first")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_debounced_flush()
+        test_no_edits_lost()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for ProjectStore (read-through access to .tnp archives)
+"""
+import sys
+import os
+import json
+import tempfile
+import zipfile
+from managers.project_store import ProjectStore
+
+
+def _create_archive(filepath):
+    """Create a small project-like archive"""
+    with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        zipf.writestr('manifest.json', json.dumps({'title': 'Test'}))
+        zipf.writestr('locations.json', json.dumps([{'id': 'loc1', 'name': 'Roma'}]))
+        zipf.writestr('images/', '')
+        zipf.writestr('images/char_1_0.png', b'\x89PNG fake image data')
+
+
+def test_reads_members_without_extracting():
+    """Test that JSON members are read straight from the archive"""
+    print("=" * 60)
+    print("TEST 1: Read Members Without Extracting")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive = os.path.join(temp_dir, 'project.tnp')
+        work_dir = os.path.join(temp_dir, 'work')
+        os.makedirs(work_dir)
+        _create_archive(archive)
+
+        store = ProjectStore(archive, work_dir)
+        assert store.read_json('manifest.json') == {'title': 'Test'}
+        assert store.read_json('locations.json')[0]['name'] == 'Roma'
+        assert store.read_json('missing.json') is None
+        assert os.listdir(work_dir) == []
+        print("✓ Members read from archive, working directory untouched")
+
+        # A working file shadows the archive member
+        with open(os.path.join(work_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump({'title': 'Changed'}, f)
+        assert store.read_json('manifest.json') == {'title': 'Changed'}
+        assert not store.is_unchanged('manifest.json')
+        assert store.is_unchanged('locations.json')
+        print("✓ Working files take precedence and are reported as changed")
+
+        store.close()
+
+
+def test_images_extracted_on_demand():
+    """Test lazy image extraction and deletion tracking"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Images Extracted On Demand")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive = os.path.join(temp_dir, 'project.tnp')
+        work_dir = os.path.join(temp_dir, 'work')
+        os.makedirs(work_dir)
+        _create_archive(archive)
+
+        store = ProjectStore(archive, work_dir)
+        path = store.extract('images/char_1_0.png')
+        assert path and os.path.exists(path)
+        assert store.is_unchanged('images/char_1_0.png')
+        print(f"✓ Image extracted on first access: {os.path.basename(path)}")
+
+        os.remove(path)
+        assert store.is_deleted('images/char_1_0.png')
+        assert not store.has('images/char_1_0.png')
+        assert store.extract('images/char_1_0.png') is None
+        print("✓ Removed image is reported as deleted")
+
+        store.close()
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_reads_members_without_extracting()
+        test_images_extracted_on_demand()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-scene revision history
+"""
+import sys
+import os
+import tempfile
+import zipfile
+from managers.project_manager import ProjectManager
+from managers.scene_revisions import SceneRevisionHistory
+from models.project_type import ProjectType
+
+
+def _paragraphs(count, seed):
+    """Scene-like HTML, one paragraph per line"""
+    return "".join(
+        f"<p>Paragrafo {i} della scena {seed}: il vento soffiava forte sulla collina e "
+        f"nessuno sapeva ancora cosa sarebbe successo al villaggio.</p>\n"
+        for i in range(count)
+    )
+
+
+def test_history_deltas_and_retention():
+    """Test snapshots, deltas, deduplication and bounded retention"""
+    print("=" * 60)
+    print("TEST 1: Snapshots, Deltas And Retention")
+    print("=" * 60)
+
+    history = SceneRevisionHistory("s1")
+    versions = []
+    text = _paragraphs(40, 1)
+    for i in range(25):
+        lines = text.splitlines(keepends=True)
+        lines[i % 40] = f"<p>Riscritto alla revisione {i}</p>\n"
+        text = "".join(lines)
+        versions.append(text)
+        assert history.add_revision(text, word_count=i) == i + 1
+    assert history.add_revision(text) is None
+    print("✓ Revisions numbered in order, unchanged text not recorded")
+
+    kinds = [revision['kind'] for revision in history.list_revisions()]
+    assert kinds.count(SceneRevisionHistory.KIND_SNAPSHOT) == 3
+    assert all(history.materialise(n + 1) == version for n, version in enumerate(versions))
+    assert history.materialise(99) is None
+    print("✓ Every revision rebuilt from the nearest snapshot and its deltas")
+
+    restored = SceneRevisionHistory.from_json("s1", history.to_json().encode('utf-8'))
+    assert restored.materialise(17) == versions[16]
+    assert SceneRevisionHistory.from_json("s1", b"{broken").list_revisions() == []
+    print("✓ History round-trips through JSON, broken data starts over")
+
+    for i in range(60):
+        text += f"<p>Aggiunta {i}</p>\n"
+        versions.append(text)
+        history.add_revision(text)
+    revisions = history.list_revisions()
+    assert len(revisions) == SceneRevisionHistory.MAX_REVISIONS
+    assert revisions[0]['kind'] == SceneRevisionHistory.KIND_SNAPSHOT
+    assert revisions[-1]['number'] == len(versions)
+    assert history.materialise(revisions[0]['number']) == versions[revisions[0]['number'] - 1]
+    assert history.materialise(len(versions)) == text and history.materialise(1) is None
+    print("✓ Oldest revisions dropped, new oldest revision stored as a snapshot")
+
+
+def test_revisions_written_on_save():
+    """Test that saving records revisions of modified scenes only"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Revisions Written By The Save Pipeline")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_file = os.path.join(temp_dir, "history.tnp")
+        pm = ProjectManager()
+        assert pm.create_new_project("History", "Author", project_file, project_type=ProjectType.NOVEL)
+
+        manager = pm.manuscript_structure_manager
+        scene = manager.get_all_scenes()[0]
+        other = manager.add_scene(manager.get_chapter_for_scene(scene.id).id, "Altra")
+        for text in ("Prima stesura", "Seconda stesura", "Terza stesura"):
+            manager.update_scene_content(scene.id, text)
+            assert pm.save_project()
+        other_revisions = pm.get_scene_revisions(other.id)
+
+        revisions = pm.get_scene_revisions(scene.id)
+        assert [r['number'] for r in revisions][-3:] == [len(revisions) - 2, len(revisions) - 1, len(revisions)]
+        assert pm.get_scene_revision_text(scene.id, revisions[-3]['number']) == "Prima stesura"
+        assert pm.get_scene_revision_text(scene.id, revisions[-1]['number']) == "Terza stesura"
+        assert len(other_revisions) == 1
+        print("✓ Each save of a modified scene adds a revision")
+
+        with zipfile.ZipFile(project_file, 'r') as zipf:
+            assert SceneRevisionHistory.get_member_name(other.id) in zipf.namelist()
+        pm.close_project()
+
+        reopened = ProjectManager()
+        assert reopened.open_project(project_file)[0] is not None
+        assert reopened.get_scene_revision_text(scene.id, revisions[-2]['number']) == "Seconda stesura"
+        assert reopened.get_scene_revisions(other.id) == other_revisions
+        reopened.close_project()
+        print("✓ Histories of unchanged scenes copied, readable after reopening")
+
+
+def test_history_size_for_a_book():
+    """Benchmark: full history of a 100-scene book stays within a few MB"""
+    print("\n" + "=" * 60)
+    print("TEST 3: History Size For A 100-Scene Book")
+    print("=" * 60)
+
+    total = 0
+    scene_size = len(_paragraphs(60, 0))
+    for scene_number in range(100):
+        history = SceneRevisionHistory(f"s{scene_number}")
+        text = _paragraphs(60, scene_number)
+        for revision in range(SceneRevisionHistory.MAX_REVISIONS):
+            lines = text.splitlines(keepends=True)
+            lines[revision % 60] = f"<p>Scena {scene_number}, modifica {revision}</p>\n"
+            text = "".join(lines)
+            history.add_revision(text)
+        total += len(history.to_json())
+
+    full_copies = 100 * SceneRevisionHistory.MAX_REVISIONS * scene_size
+    print(f"  {total / 1e6:.2f} MB for 100 x {SceneRevisionHistory.MAX_REVISIONS} revisions "
+          f"({full_copies / 1e6:.0f} MB as full copies)")
+    assert total < 5e6
+    print("✓ History costs a few MB")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_history_deltas_and_retention()
+        test_revisions_written_on_save()
+        test_history_size_for_a_book()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared spelling service
+"""
+import sys
+import threading
+from analysis.spelling_service import (SpellingService, LRUCache, spelling_service,
+                                       find_misspelled_spans, SPELL_CHECKER_AVAILABLE)
+from workers.spell_check_worker import SpellCheckRequest, SpellCheckWorker
+
+
+def test_dictionaries_are_shared():
+    """Test that every user of a language gets the same dictionary"""
+    print("=" * 60)
+    print("TEST 1: One Dictionary Per Language")
+    print("=" * 60)
+
+    assert SpellingService() is spelling_service
+    italian = spelling_service.get_dictionary('it')
+    assert spelling_service.get_dictionary('it') is italian
+    assert spelling_service.get_dictionary('en') is not italian
+    print("✓ Dictionaries created once per language and shared")
+
+
+def test_custom_words_are_shared():
+    """Test the shared custom dictionary and its generation counter"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Shared Custom Words")
+    print("=" * 60)
+
+    spelling_service.clear_custom_words()
+    generation = spelling_service.custom_words_generation
+    assert spelling_service.add_custom_words(["Frodo", "Gondor"])
+    assert spelling_service.custom_words_generation == generation + 1
+    assert not spelling_service.add_custom_words(["frodo"])
+    assert spelling_service.custom_words_generation == generation + 1
+    print("✓ Only new words bump the generation")
+
+    assert spelling_service.is_custom_word("GONDOR")
+    assert spelling_service.get_dictionary('it').unknown(["frodo", "gondor"]) == set()
+    spelling_service.remove_custom_word("Gondor")
+    assert spelling_service.get_custom_words() == {"frodo"}
+    spelling_service.clear_custom_words()
+    print("✓ Custom words accepted by every dictionary")
+
+
+def test_verdict_cache():
+    """Test the LRU cache and cached dictionary verdicts"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Verdict Cache")
+    print("=" * 60)
+
+    cache = LRUCache(2)
+    cache.put("a", True)
+    cache.put("b", False)
+    assert cache.get("a") is True
+    cache.put("c", True)
+    assert "b" not in cache and "a" in cache and len(cache) == 2
+    print("✓ Least recently used entry evicted")
+
+    if not SPELL_CHECKER_AVAILABLE:
+        print("⚠ PySpellChecker not installed (skipping dictionary lookups)")
+        return
+
+    italian = spelling_service.get_dictionary('it')
+    italian.clear_cache()
+    assert italian.unknown(["casa", "cassaa"]) == {"cassaa"}
+    assert italian._verdicts.get("casa") is True and italian._verdicts.get("cassaa") is False
+    assert italian._suggestions.get("cassaa") is None
+    print("✓ Verdicts cached, suggestions not computed by lookups")
+
+    assert "cassa" in italian.candidates("cassaa") or "casa" in italian.candidates("cassaa")
+    assert italian._suggestions.get("cassaa") is not None
+    print("✓ Suggestions computed on request and cached")
+
+
+class _FakeDictionary:
+    """Dictionary knowing a fixed set of words"""
+
+    def __init__(self, words):
+        self.words = set(words)
+
+    def unknown(self, words):
+        return {word for word in words if word not in self.words}
+
+
+def test_background_spell_check():
+    """Test span lookup and the background spell check worker"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Background Spell Check")
+    print("=" * 60)
+
+    dictionary = _FakeDictionary(["il", "gatto", "dorme"])
+    text = "Il gatto dorme sul tapettto, NASA 42 x Frodo"
+    assert find_misspelled_spans(text, dictionary) == [(15, 3), (19, 8)]
+    assert find_misspelled_spans("", dictionary) == []
+    print("✓ Spans of unknown words (proper nouns, acronyms, numbers skipped)")
+
+    worker = SpellCheckWorker()
+    done = threading.Event()
+    received = []
+
+    def callback(request):
+        received.append(request)
+        done.set()
+
+    blocker = threading.Event()
+    slow = _FakeDictionary([])
+    slow.unknown = lambda words: (blocker.wait(5), set(words))[1]
+    worker.submit("other", SpellCheckRequest(1, 0, slow, [(0, "primo")]), lambda r: None)
+    worker.submit("editor", SpellCheckRequest(1, 0, dictionary, [(0, "vecchio testo")]), callback)
+    worker.submit("editor", SpellCheckRequest(2, 0, dictionary, [(0, "il gattto"), (3, "dorme")]), callback)
+    blocker.set()
+    assert done.wait(5)
+    assert len(received) == 1 and received[0].revision == 2
+    assert received[0].results == [(0, "il gattto", [(3, 6)]), (3, "dorme", [])]
+    print("✓ Newer request replaces the waiting one, results keyed by revision")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_dictionaries_are_shared()
+        test_custom_words_are_shared()
+        test_verdict_cache()
+        test_background_spell_check()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
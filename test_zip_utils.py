@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for copying archive members without recompressing them
+"""
+import io
+import sys
+import zipfile
+from utils import zip_utils
+
+
+def _source_archive():
+    """Archive with a deflated member, a stored member and a directory"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        zipf.writestr('scenes/s1.html', "<p>Il vento soffiava sulla collina.</p>" * 200)
+        zipf.writestr('images/', '')
+        zipf.writestr(zipfile.ZipInfo('images/portrait.png'), bytes(range(256)) * 64)
+    return zipfile.ZipFile(io.BytesIO(buffer.getvalue()), 'r')
+
+
+def _copy_all(source):
+    """Copy every member of source into a new archive, return it reopened"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            zip_utils.copy_raw_member(source, target, info)
+    return zipfile.ZipFile(io.BytesIO(buffer.getvalue()), 'r')
+
+
+def _assert_same_members(source, copy):
+    """Check that the copy holds the same, readable members"""
+    assert copy.testzip() is None
+    assert copy.namelist() == source.namelist()
+    for info in source.infolist():
+        assert copy.read(info.filename) == source.read(info.filename)
+        assert copy.getinfo(info.filename).compress_type == info.compress_type
+
+
+def test_zipfile_internals():
+    """Test that the zipfile internals used for raw writes are still there"""
+    print("=" * 60)
+    print("TEST 1: zipfile Internals")
+    print("=" * 60)
+
+    # The ZIP format fixes the local header; zipfile's copy must agree
+    assert zip_utils.LOCAL_HEADER.format == zipfile.structFileHeader
+    assert zip_utils.LOCAL_HEADER_SIGNATURE == zipfile.stringFileHeader
+    print("✓ Local file header layout matches zipfile's")
+
+    if sys.version_info[:2] > zip_utils.RAW_WRITE_MAX_VERSION:
+        print(f"⚠ Python {sys.version_info[0]}.{sys.version_info[1]} newer than "
+              f"RAW_WRITE_MAX_VERSION (skipping internals check, writes fall back to writestr)")
+        return
+
+    with zipfile.ZipFile(io.BytesIO(), 'w') as probe:
+        missing = [name for name in zip_utils.RAW_WRITE_INTERNALS if not hasattr(probe, name)]
+    assert not missing, f"ZipFile internals changed, missing: {missing} (update utils/zip_utils.py)"
+    assert zip_utils.RAW_WRITE_SUPPORTED
+    print("✓ Raw writes enabled on this Python")
+
+
+def test_raw_copy():
+    """Test that members are copied byte for byte"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Raw Member Copy")
+    print("=" * 60)
+
+    source = _source_archive()
+    copy = _copy_all(source)
+    _assert_same_members(source, copy)
+    for info in source.infolist():
+        assert zip_utils.read_raw_member(copy, copy.getinfo(info.filename)) == \
+            zip_utils.read_raw_member(source, info)
+    print("✓ Compressed bytes copied unchanged")
+
+
+def test_writestr_fallback():
+    """Test the fallback used where raw writes are not supported"""
+    print("\n" + "=" * 60)
+    print("TEST 3: writestr Fallback")
+    print("=" * 60)
+
+    supported = zip_utils.RAW_WRITE_SUPPORTED
+    zip_utils.RAW_WRITE_SUPPORTED = False
+    try:
+        source = _source_archive()
+        _assert_same_members(source, _copy_all(source))
+        print("✓ copy_raw_member: same members")
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as target:
+            for info in source.infolist():
+                zip_utils.write_raw_member(target, info, zip_utils.read_raw_member(source, info))
+        _assert_same_members(source, zipfile.ZipFile(io.BytesIO(buffer.getvalue()), 'r'))
+        print("✓ write_raw_member: compressed data decompressed and written again")
+    finally:
+        zip_utils.RAW_WRITE_SUPPORTED = supported
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_zipfile_internals()
+        test_raw_copy()
+        test_writestr_fallback()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! 🎉")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
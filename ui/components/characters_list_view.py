@@ -5,7 +5,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                QScrollArea, QFrame, QLabel, QGridLayout)
 from PySide6.QtCore import Signal, Qt
 from PySide6.QtGui import QPixmap, QFont
-from typing import List
+from typing import List, Callable, Optional
 from models.character import Character
 import os
 
@@ -23,6 +23,7 @@ class CharactersListView(QWidget):
         super().__init__(parent)
         self._characters = []
         self._images_dir = None
+        self._image_resolver = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -120,7 +121,7 @@ class CharactersListView(QWidget):
         max_cols = 3  # 3 cards per row
 
         for character in characters:
-            card = CharacterCard(character, images_dir)
+            card = CharacterCard(character, images_dir, self._image_resolver)
             card.clicked.connect(self.character_clicked.emit)
 
             self.cards_layout.addWidget(card, row, col)
@@ -146,6 +147,16 @@ class CharactersListView(QWidget):
         """
         self._images_dir = images_dir
 
+    def set_image_resolver(self, resolver: Optional[Callable[[str], Optional[str]]]):
+        """
+        Set the callable used to turn an image filename into a readable path
+
+        Args:
+            resolver: Callable (e.g. CharacterManager.get_image_path) that makes
+                      sure the image exists on disk and returns its path
+        """
+        self._image_resolver = resolver
+
 
 class CharacterCard(QFrame):
     """
@@ -155,10 +166,12 @@ class CharacterCard(QFrame):
 
     clicked = Signal(str)  # character_id
 
-    def __init__(self, character: Character, images_dir: str = None, parent=None):
+    def __init__(self, character: Character, images_dir: str = None,
+                 image_resolver: Callable[[str], Optional[str]] = None, parent=None):
         super().__init__(parent)
         self.character = character
         self.images_dir = images_dir
+        self.image_resolver = image_resolver
         self._setup_ui()
 
     def _setup_ui(self):
@@ -235,8 +248,11 @@ class CharacterCard(QFrame):
         """Load character image or show placeholder"""
         if self.character.images and self.images_dir:
             # Try to load first image
-            image_path = os.path.join(self.images_dir, self.character.images[0])
-            if os.path.exists(image_path):
+            if self.image_resolver:
+                image_path = self.image_resolver(self.character.images[0])
+            else:
+                image_path = os.path.join(self.images_dir, self.character.images[0])
+            if image_path and os.path.exists(image_path):
                 pixmap = QPixmap(image_path)
                 if not pixmap.isNull():
                     # Scale to fit
@@ -0,0 +1,171 @@
+"""
+Highlight Layer - Error marks of a text editor, drawn only where visible
+"""
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from PySide6.QtWidgets import QTextEdit
+from PySide6.QtCore import QPoint
+from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor
+
+
+# (first block number, last block number) -> (position, length) of each mark
+BlockSpansProvider = Callable[[int, int], Iterable[Tuple[int, int]]]
+
+
+class HighlightLayer:
+    """
+    Keeps error marks as offset spans and materialises ExtraSelections lazily
+
+    An ExtraSelection holds a QTextCursor, and Qt lays out and repaints every
+    selection handed to setExtraSelections. A scene with thousands of flagged
+    words would pay for all of them on each update. The layer stores plain
+    spans instead and builds selections only for the visible part of the
+    document plus a margin of MARGIN_PAGES viewports above and below. When
+    scrolling leaves the materialised range, the selections are rebuilt.
+
+    Two kinds of marks are supported:
+    - absolute spans (grammar errors): kept sorted and shifted on edits;
+      spans touched by an edit are dropped
+    - block spans (spelling errors): asked to a provider for the visible
+      blocks only, so the owner can keep them relative to their block
+    """
+
+    MARGIN_PAGES = 1.0
+
+    def __init__(self, editor: QTextEdit):
+        """
+        Initialize the layer
+
+        Args:
+            editor: Editor to draw on
+        """
+        self._editor = editor
+        self._spans: List[Tuple[int, int, QColor]] = []
+        self._starts: List[int] = []
+        self._block_provider: Optional[BlockSpansProvider] = None
+        self._block_color = QColor(255, 0, 0)
+        self._formats: Dict[int, QTextCharFormat] = {}
+        # Document range covered by the current selections (None = rebuild)
+        self._materialised: Optional[Tuple[int, int]] = None
+
+        editor.document().contentsChange.connect(self._on_contents_change)
+        scroll_bar = editor.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_scroll)
+        # Range changes follow resizes and layout changes
+        scroll_bar.rangeChanged.connect(self._on_scroll)
+
+    def set_block_spans_provider(self, provider: Optional[BlockSpansProvider], color: QColor):
+        """
+        Set the source of block-based marks (e.g. spell checking)
+
+        Args:
+            provider: Callable returning the marks of a block range
+            color: Color of these marks
+        """
+        self._block_provider = provider
+        self._block_color = color
+        self.refresh()
+
+    def set_spans(self, spans: Iterable[Tuple[int, int, QColor]]):
+        """
+        Replace the absolute marks
+
+        Args:
+            spans: (start, end, color) document ranges
+        """
+        self._spans = sorted(spans, key=lambda span: span[0])
+        self._starts = [span[0] for span in self._spans]
+        self.refresh()
+
+    def clear_spans(self):
+        """Remove the absolute marks"""
+        self._spans = []
+        self._starts = []
+        self.refresh()
+
+    def get_span_count(self) -> int:
+        """Get the number of absolute marks"""
+        return len(self._spans)
+
+    def refresh(self):
+        """Rebuild the selections for the visible range plus the margin"""
+        editor = self._editor
+        document = editor.document()
+        viewport = editor.viewport()
+        margin = int(viewport.height() * self.MARGIN_PAGES)
+
+        first_block = editor.cursorForPosition(QPoint(0, -margin)).block()
+        last_block = editor.cursorForPosition(QPoint(viewport.width(), viewport.height() + margin)).block()
+        low = first_block.position()
+        high = last_block.position() + last_block.length() - 1
+        self._materialised = (low, high)
+
+        selections = []
+        text_length = max(0, document.characterCount() - 1)
+        index = bisect_left(self._starts, low)
+        while index < len(self._spans) and self._starts[index] < high:
+            start, end, color = self._spans[index]
+            if end <= text_length:
+                selections.append(self._create_selection(start, end, color))
+            index += 1
+
+        if self._block_provider is not None:
+            for start, length in self._block_provider(first_block.blockNumber(), last_block.blockNumber()):
+                selections.append(self._create_selection(start, start + length, self._block_color))
+
+        editor.setExtraSelections(selections)
+
+    def _create_selection(self, start: int, end: int, color: QColor) -> QTextEdit.ExtraSelection:
+        """Internal: Underline selection of a mark (does NOT affect text formatting)"""
+        cursor = QTextCursor(self._editor.document())
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+
+        selection = QTextEdit.ExtraSelection()
+        selection.cursor = cursor
+        selection.format = self._get_format(color)
+        return selection
+
+    def _get_format(self, color: QColor) -> QTextCharFormat:
+        """Internal: Shared format of the marks of a color"""
+        text_format = self._formats.get(color.rgba())
+        if text_format is None:
+            text_format = QTextCharFormat()
+            text_format.setUnderlineColor(color)
+            # Use SingleUnderline for better visibility (thicker line)
+            text_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
+
+            # Add semi-transparent background for even better visibility
+            bg_color = QColor(color)
+            bg_color.setAlpha(30)  # Very light background (30/255 transparency)
+            text_format.setBackground(bg_color)
+            self._formats[color.rgba()] = text_format
+        return text_format
+
+    def _on_scroll(self, *args):
+        """Internal: Rebuild the selections when the view leaves the materialised range"""
+        if self._materialised is not None:
+            editor = self._editor
+            viewport = editor.viewport()
+            top = editor.cursorForPosition(QPoint(0, 0)).position()
+            bottom = editor.cursorForPosition(QPoint(viewport.width(), viewport.height())).position()
+            low, high = self._materialised
+            if low <= top and bottom <= high:
+                return
+        self.refresh()
+
+    def _on_contents_change(self, position: int, chars_removed: int, chars_added: int):
+        """Internal: Move the absolute marks after an edit, drop the ones it touched"""
+        # Positions of the materialised range are stale now
+        self._materialised = None
+        if not self._spans:
+            return
+
+        edit_end = position + chars_removed
+        delta = chars_added - chars_removed
+        index = bisect_left(self._starts, position)
+        spans = [span for span in self._spans[:index] if span[1] <= position]
+        spans.extend((start + delta, end + delta, color)
+                     for start, end, color in self._spans[index:] if start >= edit_end)
+        self._spans = spans
+        self._starts = [span[0] for span in spans]
@@ -3,7 +3,7 @@ Manuscript View - Text editor with analysis panels
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
                                QGroupBox, QLabel, QPushButton, QTextEdit)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QTextCursor
 from ui.components.rich_text_editor import RichTextEditor as TextEditor
 from ui.components.unified_text_editor import UnifiedTextEditor
@@ -21,8 +21,16 @@ class ManuscriptView(QWidget):
     View for editing the main manuscript text
     Layout: Editor (left) + Analysis Panels (right, optional)
     Supports single-scene editing with navigation
+
+    Edits are not copied to the model on every keystroke: the scene is
+    flagged dirty and its HTML is emitted (scene_content_changed) once
+    typing pauses, or when flush_pending_changes() is called before a
+    scene switch, save or export.
     """
 
+    # Idle time after the last keystroke before the scene is synced (ms)
+    FLUSH_DELAY_MS = 1000
+
     # Signals
     text_changed = Signal()
     scene_content_changed = Signal(str, str)  # scene_id, content
@@ -34,6 +42,7 @@ class ManuscriptView(QWidget):
         self._current_scene_id: Optional[str] = None
         self._current_chapter_title: str = ""
         self._current_scene_title: str = ""
+        self._content_dirty = False
         self.manuscript_manager = manuscript_manager
         self.project_manager = project_manager
         self.ai_manager = ai_manager
@@ -41,6 +50,12 @@ class ManuscriptView(QWidget):
         self._analysis_visible = True
         self.find_dialog = None  # Lazy initialization
 
+        # Syncs the edited scene to the model once typing pauses
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush_pending_changes)
+
     def _setup_ui(self):
         """Setup the user interface"""
         layout = QVBoxLayout(self)
@@ -163,20 +178,37 @@ class ManuscriptView(QWidget):
         return nav_widget
 
     def _on_editor_text_changed(self):
-        """Handle editor text changes"""
+        """Handle editor text changes (cost independent of scene size)"""
         self.text_changed.emit()
 
-        # Get HTML content for saving (preserves formatting)
-        html_content = self.editor.get_text()
+        # Word count from the editor's per-paragraph counters
+        self.word_count_label.setText(f"{self.editor.get_word_count()} words")
 
-        # Get plain text for word count (without HTML tags)
-        plain_text = self.editor.get_plain_text()
-        word_count = len(plain_text.split()) if plain_text else 0
-        self.word_count_label.setText(f"{word_count} words")
-
-        # Emit scene content changed with HTML content (preserves formatting)
+        # The HTML is serialized once typing pauses (see flush_pending_changes)
         if self._current_scene_id:
-            self.scene_content_changed.emit(self._current_scene_id, html_content)
+            self._content_dirty = True
+            self._flush_timer.start()
+
+    def flush_pending_changes(self) -> bool:
+        """
+        Send the current scene's edits to the model now
+
+        Emits scene_content_changed with the editor HTML if the scene was
+        edited since the last flush. Call before reading scene content from
+        the model (scene switch, save, export, journaling).
+
+        Returns:
+            bool: True if content was emitted
+        """
+        self._flush_timer.stop()
+        if not self._content_dirty or not self._current_scene_id:
+            self._content_dirty = False
+            return False
+
+        self._content_dirty = False
+        # HTML content preserves formatting
+        self.scene_content_changed.emit(self._current_scene_id, self.editor.get_text())
+        return True
 
     def _on_insert_ai_text(self, text: str):
         """
@@ -293,6 +325,8 @@ class ManuscriptView(QWidget):
 
     def clear_text(self):
         """Clear the manuscript text"""
+        self._flush_timer.stop()
+        self._content_dirty = False
         self.editor.clear()
         self._current_scene_id = None
         self._current_chapter_title = ""
@@ -316,6 +350,10 @@ class ManuscriptView(QWidget):
             synopsis: Scene synopsis (optional)
             notes: Scene notes (optional)
         """
+        # Unflushed edits of the previous scene reach the model first
+        # (callers reading content from the model flush before that)
+        self.flush_pending_changes()
+
         self._current_scene_id = scene_id
         self._current_chapter_title = chapter_title
         self._current_scene_title = scene_title
@@ -327,17 +365,10 @@ class ManuscriptView(QWidget):
         self.editor.set_text(content)
 
         # Update breadcrumb
-        self.breadcrumb_label.setText(f"📖 {chapter_title} > 📝 {scene_title}")
+        self.set_breadcrumb(chapter_title, scene_title)
 
-        # Update word count (use plain text to avoid counting HTML tags)
-        # toPlainText() will be called after setHtml/setPlainText in set_text
-        # For now, calculate from plain text version of content
-        from PySide6.QtGui import QTextDocument
-        doc = QTextDocument()
-        doc.setHtml(content) if ('<' in content) else doc.setPlainText(content)
-        plain_text = doc.toPlainText()
-        word_count = len(plain_text.split()) if plain_text else 0
-        self.word_count_label.setText(f"{word_count} words")
+        # Update word count (counted on the editor's plain text, not the HTML)
+        self.word_count_label.setText(f"{self.editor.get_word_count()} words")
 
         # Enable/disable navigation buttons
         self.prev_button.setEnabled(has_previous)
@@ -374,16 +405,19 @@ class ManuscriptView(QWidget):
         """
         return self._current_scene_id
 
-    def save_current_scene_content(self) -> Optional[tuple]:
+    def set_breadcrumb(self, chapter_title: str, scene_title: str):
         """
-        Get current scene ID and content for saving
+        Update the breadcrumb of the loaded scene (e.g. after a rename)
 
-        Returns:
-            Optional[tuple]: (scene_id, content) or None if no scene loaded
+        The editor content and pending edits are left untouched.
+
+        Args:
+            chapter_title: Chapter title
+            scene_title: Scene title
         """
-        if self._current_scene_id:
-            return (self._current_scene_id, self.editor.get_text())
-        return None
+        self._current_chapter_title = chapter_title
+        self._current_scene_title = scene_title
+        self.breadcrumb_label.setText(f"📖 {chapter_title} > 📝 {scene_title}")
 
     def toggle_analysis_panels(self):
         """Toggle visibility of analysis panels"""
@@ -498,6 +532,7 @@ class ManuscriptView(QWidget):
             scene = self.manuscript_manager.get_scene(self._current_scene_id)
             if scene:
                 scene.synopsis = synopsis
+                self.manuscript_manager.mark_dirty()
                 # Emit text_changed to trigger save
                 self.text_changed.emit()
 
@@ -508,6 +543,7 @@ class ManuscriptView(QWidget):
             scene = self.manuscript_manager.get_scene(self._current_scene_id)
             if scene:
                 scene.notes = notes
+                self.manuscript_manager.mark_dirty()
                 # Emit text_changed to trigger save
                 self.text_changed.emit()
 
@@ -550,8 +586,8 @@ class ManuscriptView(QWidget):
         custom_words = []
 
         # Add character names
-        if hasattr(self.project_manager, 'characters_manager') and self.project_manager.characters_manager:
-            characters = self.project_manager.characters_manager.get_all_characters()
+        if hasattr(self.project_manager, 'character_manager') and self.project_manager.character_manager:
+            characters = self.project_manager.character_manager.get_all_characters()
             for character in characters:
                 # Add full name and first/last names separately
                 if character.name:
@@ -580,7 +616,7 @@ class ManuscriptView(QWidget):
                     if entry.tags:
                         custom_words.extend(entry.tags)
 
-        # Update the spell checker dictionary
+        # Update the shared spell checker dictionary (every editor picks it up)
         if custom_words:
             self.editor.editor.add_words_to_dictionary(custom_words)
 
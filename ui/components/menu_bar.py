@@ -54,6 +54,7 @@ class MenuBar(QMenuBar):
     grammar_check_requested = Signal()
     repetitions_check_requested = Signal()
     style_check_requested = Signal()
+    manuscript_analysis_requested = Signal()
     ai_settings_requested = Signal()
 
     # Help menu signals
@@ -466,6 +467,14 @@ class MenuBar(QMenuBar):
         tools_menu.addAction(style_action)
         self.style_action = style_action
 
+        # Manuscript Analysis
+        manuscript_analysis_action = QAction("&Manuscript Analysis", self)
+        manuscript_analysis_action.setShortcut(QKeySequence("Shift+F9"))
+        manuscript_analysis_action.setStatusTip("Analyze repetitions and style of every chapter")
+        manuscript_analysis_action.triggered.connect(self.manuscript_analysis_requested.emit)
+        tools_menu.addAction(manuscript_analysis_action)
+        self.manuscript_analysis_action = manuscript_analysis_action
+
         tools_menu.addSeparator()
 
         # AI Settings
@@ -529,6 +538,7 @@ class MenuBar(QMenuBar):
         self.grammar_action.setEnabled(is_open)
         self.repetitions_action.setEnabled(is_open)
         self.style_action.setEnabled(is_open)
+        self.manuscript_analysis_action.setEnabled(is_open)
 
     def update_recent_projects(self, recent_projects: list):
         """
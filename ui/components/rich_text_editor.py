@@ -2,11 +2,13 @@
 Rich Text Editor - Reusable text editor with formatting toolbar and table support
 """
 from PySide6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel,
-                               QTextEdit, QWidget, QPushButton, QToolButton, QMenu, QApplication, QComboBox)
+                               QWidget, QPushButton, QToolButton, QMenu, QApplication, QComboBox)
 from PySide6.QtCore import Qt, Signal, QEvent
 from PySide6.QtGui import (QTextCharFormat, QColor, QTextCursor, QFont, QKeySequence, QAction,
                            QPixmap, QPainter, QPen, QIcon, QTextTableFormat, QKeyEvent, QPalette)
 from ui.components.unified_text_editor import UnifiedTextEditor
+from ui.components.block_word_counter import BlockWordCounter
+from ui.components.highlight_layer import HighlightLayer
 
 
 class RichTextEditor(QFrame):
@@ -59,7 +61,6 @@ class RichTextEditor(QFrame):
         self.style_manager = style_manager
 
         self.error_highlights = []
-        self.grammar_extra_selections = []
 
         # Toolbar groups - widgets for each formatting group
         self.toolbar_groups = {
@@ -127,6 +128,16 @@ class RichTextEditor(QFrame):
             "Use the toolbar to format your text."
         )
 
+        # Word count maintained per paragraph (connected before textChanged
+        # handlers run, so counts are current when they read them)
+        self.word_counter = BlockWordCounter(self.editor.document())
+
+        # Grammar and spelling marks, materialised only around the viewport
+        self.highlight_layer = HighlightLayer(self.editor)
+        if hasattr(self.editor, 'get_spell_check_spans'):
+            self.highlight_layer.set_block_spans_provider(self.editor.get_spell_check_spans,
+                                                          QColor(255, 0, 0))
+
         # Connect signals
         self.editor.textChanged.connect(self._on_text_changed)
         if self.show_toolbar:
@@ -965,83 +976,40 @@ class RichTextEditor(QFrame):
         if not self.show_counter:
             return
 
-        text = self.editor.toPlainText()
-        words = len(text.split()) if text.strip() else 0
-        characters = len(text)
+        words = self.word_counter.get_word_count()
+        characters = self.word_counter.get_character_count()
         self.counter_info.setText(f"Words: {words} | Characters: {characters}")
 
     # ERROR HIGHLIGHTING METHODS
 
     def highlight_errors(self, errors):
         """
-        Highlight errors in the editor using ExtraSelections
+        Highlight errors in the editor
+
+        Errors are kept as offset spans; ExtraSelections are created only
+        for the visible part of the document (see HighlightLayer).
 
         Args:
             errors: List of error dictionaries
         """
-        self.grammar_extra_selections = []
-
-        if not errors:
-            self._update_extra_selections()
-            return
-
         try:
-            document = self.editor.document()
-            if not document:
-                return
-
-            for error in errors:
-                try:
-                    selection = self._create_error_selection(error, document)
-                    if selection:
-                        self.grammar_extra_selections.append(selection)
-                except Exception as e:
-                    print(f"Warning: Could not highlight error: {e}")
+            text_length = self.word_counter.get_character_count()
+            spans = []
+            for error in errors or []:
+                start = error.get('start', 0)
+                end = error.get('end', 0)
+                if start < 0 or end > text_length or start >= end:
                     continue
+                spans.append((start, end, self._get_category_color(error.get('category', 'custom'))))
 
-            self._update_extra_selections()
+            self.highlight_layer.set_spans(spans)
 
         except Exception as e:
             print(f"Error in highlight_errors: {e}")
 
-    def _create_error_selection(self, error, document):
-        """Create an ExtraSelection for an error without affecting text formatting"""
-        start = error.get('start', 0)
-        end = error.get('end', 0)
-
-        text_length = len(self.editor.toPlainText())
-        if start < 0 or end > text_length or start >= end:
-            return None
-
-        cursor = QTextCursor(document)
-        cursor.setPosition(start)
-        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
-
-        selection = QTextEdit.ExtraSelection()
-        selection.cursor = cursor
-
-        color = self._get_category_color(error.get('category', 'custom'))
-        selection.format.setUnderlineColor(color)
-        # Use SingleUnderline for better visibility (thicker line)
-        selection.format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
-
-        # Add semi-transparent background for even better visibility
-        bg_color = QColor(color)
-        bg_color.setAlpha(30)  # Very light background (30/255 transparency)
-        selection.format.setBackground(bg_color)
-
-        return selection
-
     def _update_extra_selections(self):
-        """Update all ExtraSelections (grammar + spell check)"""
-        all_selections = self.grammar_extra_selections.copy()
-
-        if hasattr(self.editor, 'get_spell_check_selections'):
-            spell_selections = self.editor.get_spell_check_selections()
-            if spell_selections:
-                all_selections.extend(spell_selections)
-
-        self.editor.setExtraSelections(all_selections)
+        """Update all ExtraSelections (grammar + spell check) around the viewport"""
+        self.highlight_layer.refresh()
 
     def _get_category_color(self, category):
         """Get color for error category"""
@@ -1060,8 +1028,7 @@ class RichTextEditor(QFrame):
     def clear_highlights(self):
         """Clear all grammar highlights"""
         try:
-            self.grammar_extra_selections = []
-            self._update_extra_selections()
+            self.highlight_layer.clear_spans()
             self.error_highlights = []
         except Exception as e:
             print(f"Error clearing highlights: {e}")
@@ -1076,6 +1043,10 @@ class RichTextEditor(QFrame):
         """Get plain text from the editor (without formatting)"""
         return self.editor.toPlainText()
 
+    def get_word_count(self):
+        """Get the number of words in the editor (without reading the text)"""
+        return self.word_counter.get_word_count()
+
     def set_text(self, text):
         """
         Set text in the editor (supports both plain text and HTML)
@@ -1114,6 +1085,9 @@ class RichTextEditor(QFrame):
         # NOTE: Zoom is now preserved automatically by UnifiedTextEditor.setHtml/setPlainText override
         # No need to manually restore zoom here
 
+        # The whole document was replaced
+        self.word_counter.recount()
+
         if self.show_counter:
             self._update_counter()
 
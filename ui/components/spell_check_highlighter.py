@@ -3,24 +3,21 @@ Spell Check Highlighter - Real-time spell checking with red wavy underline
 """
 from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
 from PySide6.QtCore import Qt, QRegularExpression
-from spellchecker import SpellChecker
+from analysis.spelling_service import spelling_service
 import re
 
 
 class SpellCheckHighlighter(QSyntaxHighlighter):
     """
     Syntax highlighter that underlines misspelled words in real-time
-    Uses PySpellChecker for spell checking
+    Uses the shared spelling service (PySpellChecker dictionaries)
     """
 
     def __init__(self, document, language='it'):
         super().__init__(document)
 
-        # Initialize spell checker
-        self.spell_checker = SpellChecker(language=language)
-
-        # Custom dictionary for project-specific terms
-        self.custom_words = set()
+        # Shared dictionary (custom words are shared with every editor)
+        self.spelling = spelling_service.get_dictionary(language)
 
         # Format for misspelled words (red wavy underline)
         self.error_format = QTextCharFormat()
@@ -49,6 +46,7 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
 
         # Find all words in the text
         iterator = self.word_pattern.globalMatch(text)
+        candidates = []
 
         while iterator.hasNext():
             match = iterator.next()
@@ -69,15 +67,13 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
             if word[0].isupper():
                 continue
 
-            # Check spelling
-            word_lower = word.lower()
+            candidates.append((start, length, word.lower()))
 
-            # Skip if in custom dictionary
-            if word_lower in self.custom_words:
-                continue
+        # One lookup for the block (custom dictionary words are accepted)
+        unknown = self.spelling.unknown(word for _, _, word in candidates)
 
-            # Check if misspelled
-            if self.spell_checker.unknown([word_lower]):
+        for start, length, word_lower in candidates:
+            if word_lower in unknown:
                 # PRESERVE USER FORMATTING: Get existing format and merge
                 # Get the format that was already applied in this block
                 existing_format = self.format(start)
@@ -99,7 +95,7 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
         Args:
             language: Language code (e.g., 'it', 'en', 'es')
         """
-        self.spell_checker = SpellChecker(language=language)
+        self.spelling = spelling_service.get_dictionary(language)
         self.rehighlight()
 
     def add_word_to_dictionary(self, word: str):
@@ -109,7 +105,7 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
         Args:
             word: Word to add (case-insensitive)
         """
-        self.custom_words.add(word.lower())
+        spelling_service.add_custom_words([word])
         self.rehighlight()
 
     def remove_word_from_dictionary(self, word: str):
@@ -119,7 +115,7 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
         Args:
             word: Word to remove
         """
-        self.custom_words.discard(word.lower())
+        spelling_service.remove_custom_word(word)
         self.rehighlight()
 
     def add_words_to_dictionary(self, words: list):
@@ -129,13 +125,12 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
         Args:
             words: List of words to add
         """
-        for word in words:
-            self.custom_words.add(word.lower())
-        self.rehighlight()
+        if spelling_service.add_custom_words(words):
+            self.rehighlight()
 
     def clear_custom_dictionary(self):
         """Clear all custom words"""
-        self.custom_words.clear()
+        spelling_service.clear_custom_words()
         self.rehighlight()
 
     def get_suggestions(self, word: str) -> list:
@@ -148,8 +143,7 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
         Returns:
             List of suggested corrections
         """
-        candidates = self.spell_checker.candidates(word.lower())
-        return list(candidates) if candidates else []
+        return self.spelling.candidates(word.lower())
 
     def set_enabled(self, enabled: bool):
         """
@@ -175,11 +169,5 @@ class SpellCheckHighlighter(QSyntaxHighlighter):
         Returns:
             True if misspelled, False otherwise
         """
-        word_lower = word.lower()
-
-        # Check custom dictionary first
-        if word_lower in self.custom_words:
-            return False
-
-        # Check with spell checker
-        return bool(self.spell_checker.unknown([word_lower]))
+        # Custom dictionary words are never misspelled
+        return self.spelling.is_misspelled(word.lower())
@@ -1,31 +1,52 @@
 """
 Spell Check Text Edit - UnifiedTextEditor with spell checking context menu
 """
+from typing import Iterator, List, Optional, Tuple
 from PySide6.QtWidgets import QMenu
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QTextCursor, QAction, QContextMenuEvent, QMouseEvent, QTextCharFormat, QColor
-from spellchecker import SpellChecker
+from PySide6.QtGui import QTextCursor, QAction, QContextMenuEvent, QMouseEvent
+from analysis.spelling_service import spelling_service
 from ui.components.unified_text_editor import UnifiedTextEditor
-import re
+from ui.components.block_word_counter import get_changed_blocks
+from workers.spell_check_worker import SpellCheckRequest, spell_check_worker
 
 
 class SpellCheckTextEdit(UnifiedTextEditor):
     """
     QTextEdit with integrated spell checking and context menu for suggestions
     Uses ExtraSelections instead of QSyntaxHighlighter to preserve user formatting
+
+    Results are cached per block (paragraph) as (start, length) spans
+    relative to the block. Edits only invalidate the blocks they touch
+    (QTextDocument.contentsChange), so a check after a keystroke looks at
+    one paragraph, whatever the document size, and cached spans of
+    untouched blocks stay valid wherever the blocks move. The parent
+    editor turns the spans of the visible blocks into ExtraSelections
+    (get_spell_check_spans).
+
+    Tokenisation and dictionary lookups run on the shared spell check
+    worker, which returns (start, length) spans keyed by the document
+    revision they were computed for. Only spans still valid when they
+    arrive are cached; stale results are discarded and the blocks are
+    checked again.
     """
 
     # Signal emitted when a word is added to the custom dictionary
     word_added_to_dictionary = Signal(str)
 
+    # Internal: spell check worker results (delivered on the GUI thread)
+    _spans_ready = Signal(object)
+
     def __init__(self, parent=None, auto_register: bool = True):
         super().__init__(parent, auto_register=auto_register)
 
         # Initialize spell checker (no highlighter - we use ExtraSelections)
-        self.spell_checker = SpellChecker(language='it')
-        self.custom_words = set()
+        # Shared dictionary: loaded once per language for the whole application
+        self.spelling = spelling_service.get_dictionary('it')
+        self._custom_words_generation = spelling_service.custom_words_generation
         self._spell_check_enabled = True
-        self.spell_check_selections = []  # Store spell check selections
+        # Per-block misspelled spans (None = block must be checked)
+        self._block_spans: List[Optional[List[Tuple[int, int]]]] = [None] * self.document().blockCount()
 
         # UI language (default: Italian)
         self._ui_language = 'it'
@@ -38,9 +59,30 @@ class SpellCheckTextEdit(UnifiedTextEditor):
         self.spell_check_timer.setSingleShot(True)
         self.spell_check_timer.timeout.connect(self._perform_spell_check)
 
+        # Results come from the worker thread: queued to the GUI thread
+        self._spans_ready.connect(self._on_spans_ready)
+        owner = id(self)
+        self.destroyed.connect(lambda: spell_check_worker.cancel(owner))
+
         # Connect to text changes
+        self.document().contentsChange.connect(self._on_contents_change)
         self.textChanged.connect(self._on_text_changed)
 
+    def _on_contents_change(self, position: int, chars_removed: int, chars_added: int):
+        """Invalidate the cached results of the blocks touched by an edit"""
+        change = get_changed_blocks(self.document(), position, chars_added,
+                                    len(self._block_spans))
+        if change is None:
+            self._invalidate_all_blocks()
+            return
+
+        first, last, old_last = change
+        self._block_spans[first:old_last + 1] = [None] * (last - first + 1)
+
+    def _invalidate_all_blocks(self):
+        """Forget all cached results (language, dictionary or whole document changed)"""
+        self._block_spans = [None] * self.document().blockCount()
+
     def _on_text_changed(self):
         """Handle text changes - schedule spell check"""
         if self._spell_check_enabled:
@@ -49,66 +91,60 @@ class SpellCheckTextEdit(UnifiedTextEditor):
             self.spell_check_timer.start(500)
 
     def _perform_spell_check(self):
-        """Perform spell checking using ExtraSelections (preserves user formatting)"""
-        self.spell_check_selections = []
-
+        """Send the blocks changed since the last check to the spell check worker"""
         if not self._spell_check_enabled:
             self._notify_selections_updated()
             return
 
-        # Get document text
-        text = self.toPlainText()
+        document = self.document()
+        if (len(self._block_spans) != document.blockCount() or
+                self._custom_words_generation != spelling_service.custom_words_generation):
+            # Custom words changed (possibly through another editor)
+            self._custom_words_generation = spelling_service.custom_words_generation
+            self._invalidate_all_blocks()
+
+        blocks = [(number, document.findBlockByNumber(number).text())
+                  for number, spans in enumerate(self._block_spans)
+                  if spans is None]
+        if blocks:
+            request = SpellCheckRequest(document.revision(), self._custom_words_generation,
+                                        self.spelling, blocks)
+            # Marks shown now stay until the results arrive
+            spell_check_worker.submit(id(self), request, self._spans_ready.emit)
+        else:
+            self._notify_selections_updated()
 
-        # Find all words
-        word_pattern = re.compile(r"\b[\w']+\b")
-        for match in word_pattern.finditer(text):
-            word = match.group(0)
-            start = match.start()
-            length = len(word)
+    def _on_spans_ready(self, request: SpellCheckRequest):
+        """
+        Cache the worker results still valid and update the marks
 
-            # Skip if word is a number or too short
-            if word.isdigit() or len(word) < 2:
-                continue
+        Results computed with another dictionary or other custom words are
+        dropped. A block's spans are kept if the document has not changed
+        since the request, or if the block still holds the text that was
+        checked; otherwise the block stays pending for the next check.
 
-            # Skip if word is all uppercase (acronyms)
-            if word.isupper() and len(word) > 1:
-                continue
+        Args:
+            request: Completed request
+        """
+        if (not self._spell_check_enabled or request.dictionary is not self.spelling or
+                request.generation != spelling_service.custom_words_generation):
+            return
 
-            # Skip if word starts with uppercase (proper noun)
-            if word[0].isupper():
+        document = self.document()
+        unchanged = request.revision == document.revision()
+        block_count = len(self._block_spans)
+        stale = False
+        for number, text, spans in request.results:
+            if number >= block_count or self._block_spans[number] is not None:
                 continue
-
-            # Check spelling
-            word_lower = word.lower()
-
-            # Skip if in custom dictionary
-            if word_lower in self.custom_words:
+            if not unchanged and document.findBlockByNumber(number).text() != text:
+                stale = True
                 continue
+            self._block_spans[number] = spans
 
-            # Check if misspelled
-            if self.spell_checker.unknown([word_lower]):
-                # Create selection for this misspelled word
-                cursor = QTextCursor(self.document())
-                cursor.setPosition(start)
-                cursor.setPosition(start + length, QTextCursor.MoveMode.KeepAnchor)
-
-                # Create format for underline (does NOT affect text formatting)
-                selection = QTextEdit.ExtraSelection()
-                selection.cursor = cursor
-                underline_color = QColor(255, 0, 0)
-                selection.format.setUnderlineColor(underline_color)
-                # Use SingleUnderline for better visibility (thicker line)
-                selection.format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
-
-                # Add semi-transparent background for even better visibility
-                bg_color = QColor(underline_color)
-                bg_color.setAlpha(30)  # Very light background (30/255 transparency)
-                selection.format.setBackground(bg_color)
-
-                self.spell_check_selections.append(selection)
-
-        # Notify parent to update all selections
         self._notify_selections_updated()
+        if stale and not self.spell_check_timer.isActive():
+            self.spell_check_timer.start(500)
 
     def _notify_selections_updated(self):
         """Notify parent TextEditor to update all ExtraSelections"""
@@ -120,9 +156,29 @@ class SpellCheckTextEdit(UnifiedTextEditor):
                 break
             parent = parent.parent()
 
-    def get_spell_check_selections(self):
-        """Get current spell check ExtraSelections"""
-        return self.spell_check_selections
+    def get_spell_check_spans(self, first_block: int, last_block: int) -> Iterator[Tuple[int, int]]:
+        """
+        Get the misspelled words of a range of blocks
+
+        Args:
+            first_block: Number of the first block
+            last_block: Number of the last block (included)
+
+        Yields:
+            Tuple[int, int]: (document position, length) of each misspelled word
+        """
+        if not self._spell_check_enabled:
+            return
+
+        block = self.document().findBlockByNumber(first_block)
+        while block.isValid() and block.blockNumber() <= last_block:
+            number = block.blockNumber()
+            spans = self._block_spans[number] if number < len(self._block_spans) else None
+            if spans:
+                offset = block.position()
+                for start, length in spans:
+                    yield offset + start, length
+            block = block.next()
 
     def enable_spell_checking(self, language='it'):
         """
@@ -131,14 +187,15 @@ class SpellCheckTextEdit(UnifiedTextEditor):
         Args:
             language: Language code (e.g., 'it', 'en', 'es')
         """
-        self.spell_checker = SpellChecker(language=language)
+        self.spelling = spelling_service.get_dictionary(language)
         self._spell_check_enabled = True
+        self._invalidate_all_blocks()
         self._perform_spell_check()
 
     def disable_spell_checking(self):
         """Disable spell checking"""
         self._spell_check_enabled = False
-        self.spell_check_selections = []
+        self._notify_selections_updated()
 
     def is_spell_checking_enabled(self) -> bool:
         """Check if spell checking is enabled"""
@@ -151,8 +208,7 @@ class SpellCheckTextEdit(UnifiedTextEditor):
         Args:
             word: Word to add
         """
-        word_lower = word.lower()
-        self.custom_words.add(word_lower)
+        spelling_service.add_custom_words([word])
         self.word_added_to_dictionary.emit(word)
         # Refresh spell checking to remove underline
         self._perform_spell_check()
@@ -170,14 +226,8 @@ class SpellCheckTextEdit(UnifiedTextEditor):
         if not word or len(word) < 2:
             return False
 
-        word_lower = word.lower()
-
-        # Skip if in custom dictionary
-        if word_lower in self.custom_words:
-            return False
-
-        # Check with spell checker
-        return bool(self.spell_checker.unknown([word_lower]))
+        # Custom dictionary words are never misspelled
+        return self.spelling.is_misspelled(word.lower())
 
     def get_suggestions(self, word: str, max_suggestions: int = 5) -> list:
         """
@@ -190,11 +240,8 @@ class SpellCheckTextEdit(UnifiedTextEditor):
         Returns:
             list: List of suggestions
         """
-        word_lower = word.lower()
-        candidates = self.spell_checker.candidates(word_lower)
-        if candidates:
-            return list(candidates)[:max_suggestions]
-        return []
+        # Computed (and cached by the spelling service) only when asked for
+        return self.spelling.candidates(word.lower())[:max_suggestions]
 
     def _get_word_under_cursor(self, cursor: QTextCursor = None) -> tuple:
         """
@@ -379,7 +426,8 @@ class SpellCheckTextEdit(UnifiedTextEditor):
             language: Language code (e.g., 'it', 'en', 'es')
         """
         self._ui_language = language
-        self.spell_checker = SpellChecker(language=language)
+        self.spelling = spelling_service.get_dictionary(language)
+        self._invalidate_all_blocks()
         if self._spell_check_enabled:
             self._perform_spell_check()
 
@@ -390,11 +438,8 @@ class SpellCheckTextEdit(UnifiedTextEditor):
         Args:
             words: List of words to add
         """
-        for word in words:
-            word_lower = word.lower()
-            self.custom_words.add(word_lower)
-        # Refresh spell checking
-        if self._spell_check_enabled:
+        # Shared with every editor; only new words trigger a recheck
+        if spelling_service.add_custom_words(words) and self._spell_check_enabled:
             self._perform_spell_check()
 
     def set_ui_language(self, language: str):
@@ -479,6 +479,8 @@ class CharacterAIAssistantDialog(QDialog):
     def _save_conversation_to_character(self):
         """Save conversation history to character"""
         self.character.ai_conversation_history = [msg.to_dict() for msg in self.messages]
+        if self.character_manager:
+            self.character_manager.mark_dirty()
         AppLogger.info(f"Saved {len(self.messages)} messages to character history")
 
     def _on_clear_history(self):
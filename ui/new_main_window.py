@@ -20,11 +20,15 @@ from ui.styles import Stili
 from managers.project_manager import ProjectManager
 from managers.ai.ai_manager import AIManager
 from workers.thread_analysis import AnalysisThread
+from workers.manuscript_analysis_thread import ManuscriptAnalysisThread
+from workers.save_worker import SaveThread
 from models.project_type import ProjectType
 from analysis.grammar import GrammarAnalyzer
 from analysis.repetition import RepetitionAnalyzer
 from analysis.style import StyleAnalyzer
 from analysis.context_analyzer import ContextAnalyzer
+from analysis.analysis_cache import AnalysisCache
+from analysis.manuscript_analyzer import ManuscriptAnalyzer
 from utils.settings import SettingsManager
 import os
 
@@ -59,10 +63,13 @@ class TheNovelistMainWindow(QMainWindow):
 
         # Analysis
         self.analysis_thread = None
+        self.manuscript_analysis_thread = None
         self.grammar_analyzer = GrammarAnalyzer()
         self.repetitions_analyzer = RepetitionAnalyzer()
         self.style_analyzer = StyleAnalyzer()
         self.context_analyzer = ContextAnalyzer()
+        # Per-scene results: unchanged scenes are not analysed again
+        self.analysis_cache = AnalysisCache()
 
         # Auto-save
         self.auto_save_enabled = True
@@ -71,6 +78,26 @@ class TheNovelistMainWindow(QMainWindow):
         self.auto_save_timer.timeout.connect(self._auto_save)
         self.last_auto_save = None
 
+        # Edit journal: unsaved changes are appended beside the .tnp file
+        self.journal_interval = 5 * 1000  # 5 seconds in milliseconds
+        self.journal_timer = QTimer()
+        self.journal_timer.timeout.connect(self._journal_changes)
+
+        # Status bar word count, refreshed once typing pauses
+        self.word_count_timer = QTimer()
+        self.word_count_timer.setSingleShot(True)
+        self.word_count_timer.setInterval(1000)
+        self.word_count_timer.timeout.connect(self._update_word_count_label)
+
+        # Containers not opened yet are loaded one per idle turn after a project opens
+        self.prefetch_timer = QTimer()
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.timeout.connect(self._prefetch_containers)
+
+        # Background saving (one SaveThread at a time)
+        self.save_thread = None
+        self._resave_requested = False
+
         # Initialize UI
         self._initialize_ui()
         self._connect_signals()
@@ -79,6 +106,7 @@ class TheNovelistMainWindow(QMainWindow):
         # Start auto-save timer
         if self.auto_save_enabled:
             self.auto_save_timer.start(self.auto_save_interval)
+            self.journal_timer.start(self.journal_interval)
 
         # Load recent projects
         self._update_recent_projects_menu()
@@ -213,6 +241,12 @@ class TheNovelistMainWindow(QMainWindow):
         self.progress.setStyleSheet(Stili.progress_bar())
         self.statusBar().addPermanentWidget(self.progress)
 
+        # Manuscript word count (refreshed shortly after edits)
+        self.word_count_label = QLabel()
+        self.word_count_label.setStyleSheet("color: #666; font-size: 11px; margin-right: 10px;")
+        self.word_count_label.setVisible(False)
+        self.statusBar().addPermanentWidget(self.word_count_label)
+
         # Auto-save indicator
         self.auto_save_label = QLabel()
         self.auto_save_label.setStyleSheet("color: #666; font-size: 11px; margin-right: 10px;")
@@ -275,6 +309,7 @@ class TheNovelistMainWindow(QMainWindow):
         self.menu_bar.grammar_check_requested.connect(self.analyze_grammar)
         self.menu_bar.repetitions_check_requested.connect(self.analyze_repetitions)
         self.menu_bar.style_check_requested.connect(self.analyze_style)
+        self.menu_bar.manuscript_analysis_requested.connect(self.analyze_manuscript)
         self.menu_bar.ai_settings_requested.connect(self._open_ai_settings)
 
         # Help menu
@@ -452,8 +487,9 @@ class TheNovelistMainWindow(QMainWindow):
         else:
             self.project_tree.clear_project()
 
-        # Update language indicator
+        # Update language and word count indicators
         self._update_language_indicator()
+        self._update_word_count_label()
 
     def _update_language_indicator(self):
         """Update the language indicator in status bar"""
@@ -488,6 +524,7 @@ class TheNovelistMainWindow(QMainWindow):
         """Update all analyzers to use the specified language"""
         try:
             self.grammar_analyzer.set_language(language)
+            self.repetitions_analyzer.set_language(language)
             self.style_analyzer.set_language(language)
             self.context_analyzer.set_language(language)
             # Update text editor UI language for context menus
@@ -568,10 +605,12 @@ class TheNovelistMainWindow(QMainWindow):
 
             # Update characters list
             self.characters_list_view.set_images_directory(images_dir)
+            self.characters_list_view.set_image_resolver(self.project_manager.character_manager.get_image_path)
 
             self.is_modified = False
             self.manuscript_view.clear_text()
             self.manuscript_view.clear_analysis()
+            self.analysis_cache.clear()
             self._update_ui_state()
 
             # Update project tree with new manuscript structure
@@ -619,10 +658,11 @@ class TheNovelistMainWindow(QMainWindow):
         if project:
             # Clear previous analysis results when opening new project
             self.manuscript_view.clear_analysis()
+            self.analysis_cache.clear()
             self.manuscript_view.clear_highlights()
 
             # Load manuscript
-            self.manuscript_view.set_text(manuscript_text)
+            self.manuscript_view.set_text(str(manuscript_text))
 
             # Setup images directory for character manager
             images_dir = self.project_manager.get_temp_images_directory()
@@ -639,8 +679,9 @@ class TheNovelistMainWindow(QMainWindow):
 
             # Update characters list
             self.characters_list_view.set_images_directory(images_dir)
+            self.characters_list_view.set_image_resolver(self.project_manager.character_manager.get_image_path)
 
-            self.is_modified = False
+            self.is_modified = self.project_manager.has_recovered_changes()
             self._update_ui_state()
 
             # Update spell checker language for opened project
@@ -657,11 +698,17 @@ class TheNovelistMainWindow(QMainWindow):
 
             # Start writing session
             text = self.manuscript_view.get_text()
-            word_count = len(text.split())
+            word_count = self.project_manager.manuscript_structure_manager.get_total_word_count()
             char_count = len(text)
             self.project_manager.statistics_manager.start_session(word_count, char_count)
 
-            self.statusBar().showMessage(f"Opened: {project.title}", 3000)
+            # Warm up the other containers once the manuscript is on screen
+            self.prefetch_timer.start(0)
+
+            if self.project_manager.has_recovered_changes():
+                self.statusBar().showMessage(f"Opened: {project.title} (recovered unsaved changes)", 5000)
+            else:
+                self.statusBar().showMessage(f"Opened: {project.title}", 3000)
         else:
             # Project failed to open - check if backups are available
             from utils.backup_manager import BackupManager
@@ -692,8 +739,17 @@ class TheNovelistMainWindow(QMainWindow):
                     "The file may be corrupted and no backups are available."
                 )
 
-    def save_project(self):
-        """Save the current project"""
+    def save_project(self, blocking: bool = False):
+        """
+        Save the current project
+
+        Args:
+            blocking: Write the file before returning (e.g. before closing);
+                      otherwise it is written by a background SaveThread
+
+        Returns:
+            bool: True if saved (or if the background save was started)
+        """
         if not self.project_manager.has_project():
             QMessageBox.warning(
                 self,
@@ -705,31 +761,31 @@ class TheNovelistMainWindow(QMainWindow):
         # Save current scene content first
         self._save_current_scene()
 
-        # Get full manuscript text for statistics
-        manuscript_text = self.project_manager.manuscript_structure_manager.get_full_manuscript_text()
+        # Stream the manuscript for statistics (words from the running totals)
+        manuscript_text = self.project_manager.manuscript_structure_manager.get_manuscript_text()
+        word_count = self.project_manager.manuscript_structure_manager.get_total_word_count()
+        char_count = manuscript_text.get_length()
 
         # End current writing session before saving
         if self.project_manager.statistics_manager.is_session_active():
-            word_count = len(manuscript_text.split())
-            char_count = len(manuscript_text)
             self.project_manager.statistics_manager.end_session(word_count, char_count)
 
         # Update manuscript statistics
-        self.project_manager.statistics_manager.update_manuscript_stats(manuscript_text)
+        self.project_manager.statistics_manager.update_manuscript_stats(manuscript_text, word_count)
 
         # Save project
-        success = self.project_manager.save_project()
+        if blocking:
+            success = self.project_manager.save_project()
+            if success:
+                self.is_modified = False
+                self._update_ui_state()
+                self.statusBar().showMessage("Project saved successfully", 3000)
+        else:
+            success = self._start_background_save()
 
         if success:
-            self.is_modified = False
-            self._update_ui_state()
-
             # Start a new session after saving
-            word_count = len(manuscript_text.split())
-            char_count = len(manuscript_text)
             self.project_manager.statistics_manager.start_session(word_count, char_count)
-
-            self.statusBar().showMessage("Project saved successfully", 3000)
             return True
         else:
             QMessageBox.critical(
@@ -809,9 +865,11 @@ class TheNovelistMainWindow(QMainWindow):
         if not self._check_unsaved_changes():
             return
 
+        self.prefetch_timer.stop()
         self.project_manager.close_project()
         self.manuscript_view.clear_text()
         self.manuscript_view.clear_analysis()
+        self.analysis_cache.clear()
         self.is_modified = False
         self._update_ui_state()
         self.statusBar().showMessage("Project closed", 2000)
@@ -823,6 +881,9 @@ class TheNovelistMainWindow(QMainWindow):
         Returns:
             bool: True to continue, False to cancel
         """
+        # A failed background save makes the project modified again
+        self._wait_for_background_save()
+
         if self.is_modified and self.project_manager.has_project():
             reply = QMessageBox.question(
                 self,
@@ -834,7 +895,7 @@ class TheNovelistMainWindow(QMainWindow):
             )
 
             if reply == QMessageBox.StandardButton.Save:
-                return self.save_project()
+                return self.save_project(blocking=True)
             elif reply == QMessageBox.StandardButton.Cancel:
                 return False
 
@@ -910,7 +971,7 @@ class TheNovelistMainWindow(QMainWindow):
                     project, manuscript_text, characters = self.project_manager.open_project(corrupted_filepath)
                     if project:
                         # Load the restored project (same code as open_project success case)
-                        self.manuscript_view.set_text(manuscript_text)
+                        self.manuscript_view.set_text(str(manuscript_text))
                         images_dir = self.project_manager.get_temp_images_directory()
                         if images_dir:
                             self.project_manager.character_manager.set_images_directory(images_dir)
@@ -918,16 +979,18 @@ class TheNovelistMainWindow(QMainWindow):
                             self.project_manager.character_manager
                         )
                         self.characters_list_view.set_images_directory(images_dir)
-                        self.is_modified = False
+                        self.characters_list_view.set_image_resolver(self.project_manager.character_manager.get_image_path)
+                        self.is_modified = self.project_manager.has_recovered_changes()
                         self._update_ui_state()
                         # Add to recent projects with metadata
                         project_metadata = project.to_dict()
                         self.settings.add_recent_project(corrupted_filepath, project_metadata)
                         self._update_recent_projects_menu()
                         text = self.manuscript_view.get_text()
-                        word_count = len(text.split())
+                        word_count = self.project_manager.manuscript_structure_manager.get_total_word_count()
                         char_count = len(text)
                         self.project_manager.statistics_manager.start_session(word_count, char_count)
+                        self.prefetch_timer.start(0)
                         self.statusBar().showMessage(f"Restored and opened: {project.title}", 3000)
                     else:
                         QMessageBox.warning(
@@ -985,10 +1048,11 @@ class TheNovelistMainWindow(QMainWindow):
         if project:
             # Clear previous analysis results when opening recent project
             self.manuscript_view.clear_analysis()
+            self.analysis_cache.clear()
             self.manuscript_view.clear_highlights()
 
             # Load manuscript
-            self.manuscript_view.set_text(manuscript_text)
+            self.manuscript_view.set_text(str(manuscript_text))
 
             # Setup images directory for character manager
             images_dir = self.project_manager.get_temp_images_directory()
@@ -1005,8 +1069,9 @@ class TheNovelistMainWindow(QMainWindow):
 
             # Update characters list
             self.characters_list_view.set_images_directory(images_dir)
+            self.characters_list_view.set_image_resolver(self.project_manager.character_manager.get_image_path)
 
-            self.is_modified = False
+            self.is_modified = self.project_manager.has_recovered_changes()
             self._update_ui_state()
 
             # Update spell checker language for opened project
@@ -1021,7 +1086,13 @@ class TheNovelistMainWindow(QMainWindow):
             # ALWAYS show manuscript view when opening a project (never remember last position)
             self.workspace.show_manuscript()
 
-            self.statusBar().showMessage(f"Opened: {project.title}", 3000)
+            # Warm up the other containers once the manuscript is on screen
+            self.prefetch_timer.start(0)
+
+            if self.project_manager.has_recovered_changes():
+                self.statusBar().showMessage(f"Opened: {project.title} (recovered unsaved changes)", 5000)
+            else:
+                self.statusBar().showMessage(f"Opened: {project.title}", 3000)
         else:
             QMessageBox.critical(
                 self,
@@ -1294,8 +1365,12 @@ class TheNovelistMainWindow(QMainWindow):
             return
 
         # Update manuscript stats
-        text = self.manuscript_view.get_text()
-        self.project_manager.statistics_manager.update_manuscript_stats(text)
+        self._save_current_scene()
+        manager = self.project_manager.manuscript_structure_manager
+        summary = manager.word_count_summary()
+        self.project_manager.statistics_manager.update_manuscript_stats(
+            manager.get_manuscript_text(), summary['total']
+        )
 
         # Get stats and update dashboard
         stats = self.project_manager.statistics_manager.get_stats()
@@ -1446,7 +1521,7 @@ class TheNovelistMainWindow(QMainWindow):
         if not scene:
             return
 
-        chapter = manager.structure.get_chapter_for_scene(scene_id)
+        chapter = manager.get_chapter_for_scene(scene_id)
         if not chapter:
             return
 
@@ -1635,7 +1710,8 @@ class TheNovelistMainWindow(QMainWindow):
             return
 
         # Save current chapter data before going back
-        self.chapter_detail.save_current_data()
+        if self.chapter_detail.save_current_data():
+            self.project_manager.manuscript_structure_manager.mark_dirty()
 
         # Show chapters preview
         manager = self.project_manager.manuscript_structure_manager
@@ -1648,6 +1724,9 @@ class TheNovelistMainWindow(QMainWindow):
         if not self.project_manager.has_project():
             return
 
+        # Synopsis/notes are edited in place on the Chapter object
+        self.project_manager.manuscript_structure_manager.mark_dirty()
+
         # Mark as modified
         if not self.is_modified:
             self.is_modified = True
@@ -1661,6 +1740,7 @@ class TheNovelistMainWindow(QMainWindow):
         # Update scene content in manager
         manager = self.project_manager.manuscript_structure_manager
         manager.update_scene_content(scene_id, content)
+        self.word_count_timer.start()
 
         # Mark as modified
         if not self.is_modified:
@@ -1668,12 +1748,10 @@ class TheNovelistMainWindow(QMainWindow):
             self._update_ui_state()
 
     def _save_current_scene(self):
-        """Save current scene content before switching"""
-        scene_data = self.manuscript_view.save_current_scene_content()
-        if scene_data and self.project_manager.has_project():
-            scene_id, content = scene_data
-            manager = self.project_manager.manuscript_structure_manager
-            manager.update_scene_content(scene_id, content)
+        """Sync unflushed edits of the current scene (before switching, saving, exporting)"""
+        if self.project_manager.has_project():
+            # Emits scene_content_changed only if the scene was edited
+            self.manuscript_view.flush_pending_changes()
 
     def _go_to_previous_scene(self):
         """Navigate to previous scene"""
@@ -1804,7 +1882,7 @@ class TheNovelistMainWindow(QMainWindow):
                         self.manuscript_view.clear_text()
 
                         # Select first available scene
-                        all_scenes = manager.get_structure().get_all_scenes()
+                        all_scenes = manager.get_all_scenes()
                         if all_scenes:
                             self.project_tree.select_scene(all_scenes[0].id)
                             self._on_scene_selected(all_scenes[0].id)
@@ -1912,20 +1990,12 @@ class TheNovelistMainWindow(QMainWindow):
             # Update tree
             self.project_tree.update_manuscript_structure(manager.get_structure())
 
-            # Update breadcrumb if this is the current scene
+            # Update breadcrumb if this is the current scene (the editor is
+            # not reloaded: its unflushed edits stay where they are)
             if self.manuscript_view.get_current_scene_id() == scene_id:
-                chapter = manager.structure.get_chapter_for_scene(scene_id)
+                chapter = manager.get_chapter_for_scene(scene_id)
                 if chapter:
-                    self.manuscript_view.load_scene(
-                        scene_id=scene.id,
-                        chapter_title=chapter.title,
-                        scene_title=new_title,
-                        content=scene.content,
-                        has_previous=manager.get_previous_scene(scene_id) is not None,
-                        has_next=manager.get_next_scene(scene_id) is not None,
-                        synopsis=scene.synopsis,
-                        notes=scene.notes
-                    )
+                    self.manuscript_view.set_breadcrumb(chapter.title, new_title)
 
             self.is_modified = True
             self.statusBar().showMessage(f"Renamed scene to: {new_title}", 3000)
@@ -1959,7 +2029,7 @@ class TheNovelistMainWindow(QMainWindow):
                 self.manuscript_view.clear_text()
 
                 # Select first available scene
-                all_scenes = manager.get_structure().get_all_scenes()
+                all_scenes = manager.get_all_scenes()
                 if all_scenes:
                     self.project_tree.select_scene(all_scenes[0].id)
                     self._on_scene_selected(all_scenes[0].id)
@@ -1984,7 +2054,7 @@ class TheNovelistMainWindow(QMainWindow):
             return
 
         # Get the chapter before deletion (for finding next scene)
-        chapter = manager.structure.get_chapter_for_scene(scene_id)
+        chapter = manager.get_chapter_for_scene(scene_id)
         if not chapter:
             return
 
@@ -2005,7 +2075,7 @@ class TheNovelistMainWindow(QMainWindow):
                     self._on_scene_selected(first_in_chapter.id)
                 else:
                     # Chapter is empty (shouldn't happen), load first available scene
-                    all_scenes = manager.get_structure().get_all_scenes()
+                    all_scenes = manager.get_all_scenes()
                     if all_scenes:
                         self.project_tree.select_scene(all_scenes[0].id)
                         self._on_scene_selected(all_scenes[0].id)
@@ -2026,7 +2096,7 @@ class TheNovelistMainWindow(QMainWindow):
 
         if current_scene_id:
             # Get chapter for current scene
-            chapter = manager.structure.get_chapter_for_scene(current_scene_id)
+            chapter = manager.get_chapter_for_scene(current_scene_id)
             if chapter:
                 chapter_id = chapter.id
 
@@ -2181,10 +2251,95 @@ class TheNovelistMainWindow(QMainWindow):
             "Style analysis"
         )
 
+    def analyze_manuscript(self):
+        """
+        Start the analysis of the whole manuscript
+
+        Repetitions, style and parts of speech of every scene, merged per
+        chapter and for the book. Scenes are parsed by nlp.pipe in worker
+        processes (see the analysis_batch_size and analysis_processes
+        settings); scenes unchanged since the last run are not parsed.
+        """
+        if not self.project_manager.has_project():
+            return
+
+        if self.manuscript_analysis_thread is not None and self.manuscript_analysis_thread.isRunning():
+            self.statusBar().showMessage("Manuscript analysis already in progress", 3000)
+            return
+
+        # Pending edits of the current scene must reach the model first
+        self.manuscript_view.flush_pending_changes()
+        scenes = ManuscriptAnalyzer.collect_scenes(self.project_manager.manuscript_structure_manager)
+        if not scenes:
+            QMessageBox.warning(self, "No Text", "Please write some text first.")
+            return
+
+        project_type = None
+        if self.project_manager.current_project:
+            project_type = self.project_manager.current_project.project_type
+
+        analyzer = ManuscriptAnalyzer(
+            self.repetitions_analyzer, self.style_analyzer,
+            batch_size=self.settings.get_analysis_batch_size(),
+            n_process=self.settings.get_analysis_processes() or None
+        )
+
+        # Show progress (one step per scene)
+        self.progress.setVisible(True)
+        self.progress.setRange(0, len(scenes))
+        self.progress.setValue(0)
+        self.statusBar().showMessage("Manuscript analysis in progress...")
+
+        self.manuscript_analysis_thread = ManuscriptAnalysisThread(
+            scenes, analyzer, project_type, analysis_cache=self.analysis_cache
+        )
+        self.manuscript_analysis_thread.progress.connect(self._on_manuscript_analysis_progress)
+        self.manuscript_analysis_thread.finished.connect(
+            lambda result: self._handle_manuscript_analysis_result(result, analyzer)
+        )
+        self.manuscript_analysis_thread.start()
+
+    def _on_manuscript_analysis_progress(self, done: int, total: int):
+        """Update the progress bar during the manuscript analysis"""
+        self.progress.setValue(done)
+        self.statusBar().showMessage(f"Manuscript analysis in progress... ({done}/{total} scenes)")
+
+    def _handle_manuscript_analysis_result(self, result: dict, analyzer: ManuscriptAnalyzer):
+        """Handle manuscript analysis result"""
+        self.progress.setVisible(False)
+
+        if result.get('cancelled'):
+            self.statusBar().showMessage("Manuscript analysis cancelled", 3000)
+            return
+
+        self.manuscript_view.update_style_results(analyzer.format_results(result))
+        if result.get('success'):
+            self.manuscript_view.update_repetitions_results(
+                self.repetitions_analyzer.format_results(result['book']['repetitions']))
+            self.statusBar().showMessage(
+                f"Manuscript analysis completed ({result['analysed_scenes']} of "
+                f"{result['scene_count']} scenes analysed, {result['n_process']} processes)", 3000)
+        else:
+            self.statusBar().showMessage("Error in manuscript analysis", 3000)
+
     def _start_analysis(self, analysis_type: str, analysis_name: str):
-        """Start an analysis in background"""
+        """
+        Start an analysis in background
+
+        Grammar analysis covers the current scene. Repetitions and style
+        cover the whole manuscript, scene by scene: scenes unchanged since
+        the last run reuse their cached results.
+        """
+        # Pending edits of the current scene must reach the model first
+        self.manuscript_view.flush_pending_changes()
         text = self.manuscript_view.get_text()
 
+        scenes = None
+        if analysis_type in (AnalysisThread.TYPE_REPETITIONS, AnalysisThread.TYPE_STYLE):
+            manager = self.project_manager.manuscript_structure_manager
+            scenes = [(scene.id, scene.content_hash, scene.plain_text)
+                      for scene in manager.get_all_scenes() if scene.word_count > 0]
+
         # Get project type for context-aware analysis
         project_type = None
         if self.project_manager.current_project:
@@ -2196,7 +2351,15 @@ class TheNovelistMainWindow(QMainWindow):
         self.statusBar().showMessage(f"{analysis_name} in progress...")
 
         # Start thread
-        self.analysis_thread = AnalysisThread(text, analysis_type, project_type)
+        self.analysis_thread = AnalysisThread(
+            text, analysis_type, project_type,
+            grammar_analyzer=self.grammar_analyzer,
+            repetitions_analyzer=self.repetitions_analyzer,
+            style_analyzer=self.style_analyzer,
+            scenes=scenes,
+            scene_id=self.manuscript_view.get_current_scene_id(),
+            analysis_cache=self.analysis_cache
+        )
         self.analysis_thread.finished.connect(
             lambda result: self._handle_analysis_result(
                 result, analysis_type, analysis_name
@@ -2230,7 +2393,11 @@ class TheNovelistMainWindow(QMainWindow):
             self.manuscript_view.update_style_results(formatted_text)
 
         # Status message
-        if result.get('success'):
+        if result.get('success') and 'scene_count' in result:
+            self.statusBar().showMessage(
+                f"{analysis_name} completed ({result['analysed_scenes']} of "
+                f"{result['scene_count']} scenes analysed)", 3000)
+        elif result.get('success'):
             self.statusBar().showMessage(f"{analysis_name} completed", 3000)
         else:
             self.statusBar().showMessage(f"Error in {analysis_name}", 3000)
@@ -2946,26 +3113,167 @@ class TheNovelistMainWindow(QMainWindow):
         if not self.auto_save_enabled:
             return
 
-        # Save project (manuscript is saved automatically via manuscript_structure_manager)
-        success = self.project_manager.save_project()
+        # Changes are safe in the journal; the archive is only rewritten
+        # (compacted) once the journal gets large or old
+        self._save_current_scene()
+        written = self.project_manager.journal_changes()
+
+        if self.project_manager.journal_needs_compaction():
+            self._start_background_save(auto_save=True)
+        elif written:
+            # Only journaled: the .tnp itself is unchanged
+            self._show_auto_save_indicator(journaled=True)
+
+    def _journal_changes(self):
+        """Append unsaved changes to the project's edit journal"""
+        if self.project_manager.has_project() and self.is_modified:
+            self._save_current_scene()
+            self.project_manager.journal_changes()
+
+    def _update_word_count_label(self):
+        """Show the manuscript word count in the status bar"""
+        if not self.project_manager.has_project():
+            self.word_count_label.setVisible(False)
+            return
 
-        if success:
-            from datetime import datetime
-            self.last_auto_save = datetime.now()
-            self.is_modified = False
-            self._update_ui_state()
+        summary = self.project_manager.manuscript_structure_manager.word_count_summary()
+        self.word_count_label.setText(f"{summary['total']:,} words · {summary['scenes']} scenes")
+        self.word_count_label.setVisible(True)
 
-            # Update auto-save indicator
-            time_str = self.last_auto_save.strftime("%H:%M")
+    def _prefetch_containers(self):
+        """Load one unused container, then yield to the event loop"""
+        if self.project_manager.prefetch_next_container() is not None:
+            self.prefetch_timer.start(0)
+
+    def _show_auto_save_indicator(self, journaled: bool = False):
+        """
+        Show the auto-save label for a few seconds
+
+        Args:
+            journaled: True if the changes were only appended to the edit
+                       journal (recoverable after a crash, not yet in the .tnp)
+        """
+        from datetime import datetime
+        now = datetime.now()
+        time_str = now.strftime("%H:%M")
+
+        # Update auto-save indicator
+        if journaled:
+            self.auto_save_label.setText(f"Changes journaled at {time_str}")
+        else:
+            self.last_auto_save = now
             self.auto_save_label.setText(f"Auto-saved at {time_str}")
-            self.auto_save_label.setVisible(True)
+        self.auto_save_label.setVisible(True)
+
+        # Hide the indicator after 5 seconds
+        QTimer.singleShot(5000, lambda: self.auto_save_label.setVisible(False))
+
+    def _start_background_save(self, auto_save: bool = False) -> bool:
+        """
+        Snapshot the project and write it on a background thread
+
+        The snapshot is taken here, on the UI thread, so the file matches
+        the project at this instant even if the user keeps typing.
+
+        Args:
+            auto_save: True if triggered by the auto-save timer
+
+        Returns:
+            bool: True if the save was started (or queued)
+        """
+        if self.save_thread is not None:
+            # One save at a time: save again once the running one is done
+            self._resave_requested = True
+            return True
+
+        snapshot = self.project_manager.begin_save(backup_operation="auto_save" if auto_save else "save")
+        if snapshot is None:
+            return False
+
+        # Changes made from now on belong to the next save
+        self.is_modified = False
+        self._update_window_title()
+
+        self.save_thread = SaveThread(snapshot, auto_save)
+        self.save_thread.progress.connect(self._on_save_progress)
+        self.save_thread.save_finished.connect(self._on_save_finished)
+        self.save_thread.start()
+        return True
+
+    def _on_save_progress(self, percent: int, message: str):
+        """Show background save progress in the status bar"""
+        self.statusBar().showMessage(f"{message} ({percent}%)")
+
+    def _on_save_finished(self, success: bool, error: str):
+        """
+        Complete a background save
+
+        Args:
+            success: True if the archive was written
+            error: Error message if it was not
+        """
+        thread = self.save_thread
+        self.save_thread = None
+        if thread is None:
+            return
+
+        thread.wait()
+        saved = self.project_manager.finish_save(thread.snapshot)
+        thread.deleteLater()
+
+        if not self.project_manager.has_project():
+            return
+
+        if saved:
+            self._update_ui_state()
+
+            if thread.auto_save:
+                self._show_auto_save_indicator()
+                self.statusBar().clearMessage()
+            else:
+                self.statusBar().showMessage("Project saved successfully", 3000)
+        else:
+            self.is_modified = True
+            self._update_ui_state()
+
+            if thread.auto_save:
+                self.statusBar().showMessage(f"Auto-save failed: {error}", 5000)
+            else:
+                QMessageBox.critical(
+                    self,
+                    "Error",
+                    f"Failed to save project.\n\n{error}"
+                )
+
+        if self._resave_requested:
+            self._resave_requested = False
+            if self.is_modified:
+                self._start_background_save(auto_save=thread.auto_save)
+
+    def _wait_for_background_save(self):
+        """
+        Wait for the running background save and apply its outcome now
+
+        save_finished is delivered through the event loop, too late for a
+        caller about to close or replace the project: the result is
+        handled here instead (the queued signal then finds no save thread).
+        A save requested meanwhile is left to _check_unsaved_changes.
+        """
+        thread = self.save_thread
+        if thread is None:
+            return
 
-            # Hide the indicator after 5 seconds
-            QTimer.singleShot(5000, lambda: self.auto_save_label.setVisible(False))
+        thread.wait()
+        self._resave_requested = False
+        self._on_save_finished(thread.snapshot.succeeded, thread.snapshot.error or "")
 
     def closeEvent(self, event: QCloseEvent):
         """Handle window close"""
         if self._check_unsaved_changes():
+            if self.manuscript_analysis_thread is not None and self.manuscript_analysis_thread.isRunning():
+                # Stop feeding the parsing processes before the project goes away
+                self.manuscript_analysis_thread.requestInterruption()
+                self.manuscript_analysis_thread.wait()
             self.project_manager.close_project()
             event.accept()
         else:
@@ -3,10 +3,12 @@ Backup Manager - Automatic backup system for projects
 """
 import os
 import shutil
+import zipfile
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict
 from utils.logger import AppLogger
+from utils.backup_store import BackupStore
 
 
 class BackupManager:
@@ -18,9 +20,17 @@ class BackupManager:
     - Maintains max N backups per project
     - Provides restore functionality
     - Automatic cleanup of old backups
+
+    Backups are stored in a content-addressed BackupStore: each backup is a
+    small manifest and archive members shared between backups are stored
+    once, so many restore points cost little more than one. Full-copy
+    backups (*.tnp.bak) from older versions, or of files that are not valid
+    archives, are still listed, restored and cleaned up.
     """
 
-    def __init__(self, max_backups: int = 5):
+    LEGACY_SUFFIX = '.tnp.bak'
+
+    def __init__(self, max_backups: int = 100):
         """
         Initialize backup manager
 
@@ -30,6 +40,7 @@ class BackupManager:
         self.backup_dir = Path.home() / '.thenovelist' / 'backups'
         self.max_backups = max_backups
         self._ensure_backup_directory()
+        self.store = BackupStore(self.backup_dir)
 
     def _ensure_backup_directory(self):
         """Ensure backup directory exists"""
@@ -68,16 +79,20 @@ class BackupManager:
             project_filename = os.path.basename(project_path)
             project_name = project_filename.rsplit('.', 1)[0]
 
-            # Create backup filename
-            # Format: projectname_YYYYMMDD_HHMMSS_operation.tnp.bak
+            # Create backup name
+            # Format: projectname_YYYYMMDD_HHMMSS_operation
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_filename = f"{project_name}_{timestamp}_{operation}.tnp.bak"
-            backup_path = self.backup_dir / backup_filename
+            backup_name = f"{project_name}_{timestamp}_{operation}"
 
-            # Copy file
-            shutil.copy2(project_path, backup_path)
+            try:
+                # Store members by content (only new data takes space)
+                backup_path = self.store.create(project_path, backup_name, operation)
+            except zipfile.BadZipFile:
+                # Not a valid archive (e.g. corrupted): keep a full copy
+                backup_path = str(self.backup_dir / (backup_name + self.LEGACY_SUFFIX))
+                shutil.copy2(project_path, backup_path)
 
-            AppLogger.info(f"Created backup: {backup_filename} (operation: {operation})")
+            AppLogger.info(f"Created backup: {os.path.basename(backup_path)} (operation: {operation})")
 
             # Cleanup old backups
             self.cleanup_old_backups(project_name)
@@ -105,7 +120,7 @@ class BackupManager:
                 AppLogger.error(f"Backup file not found: {backup_path}")
                 return False
 
-            if not backup_path.endswith('.tnp.bak'):
+            if not backup_path.endswith(self.LEGACY_SUFFIX) and not BackupStore.is_manifest(backup_path):
                 AppLogger.warning(f"Invalid backup file extension: {backup_path}")
 
             # Before restoring, backup the current file (if exists)
@@ -114,8 +129,11 @@ class BackupManager:
                 if current_backup:
                     AppLogger.info(f"Backed up current file before restore: {current_backup}")
 
-            # Copy backup to restore location
-            shutil.copy2(backup_path, restore_path)
+            # Rebuild (or copy) backup to restore location
+            if BackupStore.is_manifest(backup_path):
+                self.store.restore(backup_path, restore_path)
+            else:
+                shutil.copy2(backup_path, restore_path)
 
             AppLogger.info(f"Restored from backup: {backup_path} -> {restore_path}")
             return True
@@ -141,40 +159,23 @@ class BackupManager:
                 return backups
 
             # Find all backup files for this project
-            pattern = f"{project_name}_*.tnp.bak"
-
-            for backup_file in self.backup_dir.glob(pattern):
-                try:
-                    # Parse filename to extract info
-                    # Format: projectname_YYYYMMDD_HHMMSS_operation.tnp.bak
-                    filename = backup_file.name
-                    parts = filename.rsplit('_', 1)
+            # Format: projectname_YYYYMMDD_HHMMSS_operation.tnp.bak[.json]
+            patterns = [
+                f"{project_name}_*{self.LEGACY_SUFFIX}",
+                f"{project_name}_*{BackupStore.MANIFEST_SUFFIX}"
+            ]
+
+            for pattern in patterns:
+                for backup_file in self.backup_dir.glob(pattern):
+                    try:
+                        backup_info = self.get_backup_info(str(backup_file), raise_errors=True)
+                        if backup_info:
+                            backups.append(backup_info)
 
-                    if len(parts) < 2:
+                    except Exception as e:
+                        AppLogger.warning(f"Error reading backup file {backup_file}: {e}")
                         continue
 
-                    operation_part = parts[1].replace('.tnp.bak', '')
-
-                    # Get file stats
-                    stat = backup_file.stat()
-                    size_mb = stat.st_size / (1024 * 1024)
-                    modified_time = datetime.fromtimestamp(stat.st_mtime)
-
-                    backup_info = {
-                        'path': str(backup_file),
-                        'filename': filename,
-                        'operation': operation_part,
-                        'size_mb': round(size_mb, 2),
-                        'date': modified_time,
-                        'date_str': modified_time.strftime('%Y-%m-%d %H:%M:%S')
-                    }
-
-                    backups.append(backup_info)
-
-                except Exception as e:
-                    AppLogger.warning(f"Error reading backup file {backup_file}: {e}")
-                    continue
-
             # Sort by date (newest first)
             backups.sort(key=lambda x: x['date'], reverse=True)
 
@@ -204,15 +205,19 @@ class BackupManager:
                     except Exception as e:
                         AppLogger.warning(f"Failed to delete backup {backup['filename']}: {e}")
 
+                # Reclaim member data no other backup refers to
+                self.store.collect_garbage()
+
         except Exception as e:
             AppLogger.error(f"Failed to cleanup old backups: {e}")
 
-    def get_backup_info(self, backup_path: str) -> Optional[Dict[str, any]]:
+    def get_backup_info(self, backup_path: str, raise_errors: bool = False) -> Optional[Dict[str, any]]:
         """
         Get information about a specific backup file
 
         Args:
-            backup_path: Path to backup file
+            backup_path: Path to backup file (full copy or manifest)
+            raise_errors: Propagate read errors instead of logging them
 
         Returns:
             Optional[Dict]: Backup info dictionary or None
@@ -223,19 +228,36 @@ class BackupManager:
             if not backup_file.exists():
                 return None
 
+            # Parse filename to extract info
+            # Format: projectname_YYYYMMDD_HHMMSS_operation.tnp.bak[.json]
+            filename = backup_file.name
+            parts = filename.rsplit('_', 1)
+            if len(parts) < 2:
+                return None
+
             stat = backup_file.stat()
-            size_mb = stat.st_size / (1024 * 1024)
             modified_time = datetime.fromtimestamp(stat.st_mtime)
 
+            if BackupStore.is_manifest(backup_path):
+                operation_part = parts[1][:-len(BackupStore.MANIFEST_SUFFIX)]
+                # Size of the archive the backup restores, not of the manifest
+                size = self.store.read_manifest(backup_path).get('size', 0)
+            else:
+                operation_part = parts[1].replace(self.LEGACY_SUFFIX, '')
+                size = stat.st_size
+
             return {
                 'path': str(backup_file),
-                'filename': backup_file.name,
-                'size_mb': round(size_mb, 2),
+                'filename': filename,
+                'operation': operation_part,
+                'size_mb': round(size / (1024 * 1024), 2),
                 'date': modified_time,
                 'date_str': modified_time.strftime('%Y-%m-%d %H:%M:%S')
             }
 
         except Exception as e:
+            if raise_errors:
+                raise
             AppLogger.error(f"Failed to get backup info: {e}")
             return None
 
@@ -252,6 +274,8 @@ class BackupManager:
         try:
             if os.path.exists(backup_path):
                 os.remove(backup_path)
+                if BackupStore.is_manifest(backup_path):
+                    self.store.collect_garbage()
                 AppLogger.info(f"Deleted backup: {backup_path}")
                 return True
             else:
@@ -273,12 +297,15 @@ class BackupManager:
 
         try:
             if self.backup_dir.exists():
-                for backup_file in self.backup_dir.glob('*.tnp.bak'):
+                for backup_file in self.backup_dir.glob(f'*{self.LEGACY_SUFFIX}'):
                     try:
                         total_size += backup_file.stat().st_size
                     except:
                         continue
 
+                # Manifests plus deduplicated member data
+                total_size += self.store.get_disk_usage()
+
         except Exception as e:
             AppLogger.error(f"Failed to calculate backup size: {e}")
 
@@ -295,13 +322,18 @@ class BackupManager:
 
         try:
             if self.backup_dir.exists():
-                for backup_file in self.backup_dir.glob('*.tnp.bak'):
+                backup_files = list(self.backup_dir.glob(f'*{self.LEGACY_SUFFIX}'))
+                backup_files.extend(self.store.list_manifests())
+
+                for backup_file in backup_files:
                     try:
                         os.remove(backup_file)
                         deleted_count += 1
                     except Exception as e:
                         AppLogger.warning(f"Failed to delete {backup_file}: {e}")
 
+                self.store.collect_garbage()
+
             AppLogger.info(f"Deleted {deleted_count} backup files")
 
         except Exception as e:
@@ -0,0 +1,270 @@
+"""
+Backup Store - Content-addressed, deduplicating storage for project backups
+"""
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Set
+from utils.logger import AppLogger
+from utils.zip_utils import read_raw_member, write_raw_member
+
+
+class BackupStore:
+    """
+    Stores .tnp archives as per-member objects addressed by content hash
+
+    A backup is a small JSON manifest listing the archive members and the
+    hash of each member's compressed bytes. Member data lives once in
+    objects/<2 hex>/<hash>, shared by every backup (of any project) that
+    contains the same bytes. Since saves copy unchanged members verbatim,
+    consecutive backups of a project mostly share their objects: only
+    the edited scenes and JSON files take new space.
+
+    Layout:
+        <root>/<name>_<YYYYMMDD_HHMMSS>_<operation>.tnp.bak.json - manifests
+        <root>/objects/ab/abcdef... - compressed member data
+
+    Attributes:
+        root: Backup directory
+        objects_dir: Directory holding the member objects
+    """
+
+    MANIFEST_SUFFIX = '.tnp.bak.json'
+    FORMAT_VERSION = 1
+
+    # Object writes and garbage collection must not interleave
+    _lock = threading.RLock()
+
+    def __init__(self, root: Path):
+        """
+        Initialize the store
+
+        Args:
+            root: Backup directory
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+
+    @classmethod
+    def is_manifest(cls, path: str) -> bool:
+        """Check if a backup path refers to a deduplicated backup manifest"""
+        return str(path).endswith(cls.MANIFEST_SUFFIX)
+
+    def _object_path(self, digest: str) -> Path:
+        """Internal: Path of the object with the given hash"""
+        return self.objects_dir / digest[:2] / digest
+
+    def _put_object(self, data: bytes) -> str:
+        """
+        Internal: Store data unless an identical object exists
+
+        Returns:
+            str: Hash of the data
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return digest
+
+    def _get_object(self, digest: str) -> bytes:
+        """
+        Internal: Read an object and verify its hash
+
+        Raises:
+            ValueError: If the object is missing or corrupted
+        """
+        path = self._object_path(digest)
+        if not path.exists():
+            raise ValueError(f"Backup object missing: {digest}")
+
+        data = path.read_bytes()
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Backup object corrupted: {digest}")
+        return data
+
+    # ==================== Backups ====================
+
+    def create(self, project_path: str, backup_name: str, operation: str) -> str:
+        """
+        Back up a .tnp archive
+
+        Args:
+            project_path: Path to the .tnp file
+            backup_name: Manifest file name (without suffix)
+            operation: Operation that triggered the backup
+
+        Returns:
+            str: Path of the backup manifest
+
+        Raises:
+            zipfile.BadZipFile: If the project file is not a valid archive
+        """
+        members = []
+        with self._lock:
+            with zipfile.ZipFile(project_path, 'r') as zipf:
+                for info in zipf.infolist():
+                    digest = self._put_object(read_raw_member(zipf, info))
+                    members.append({
+                        'name': info.filename,
+                        'hash': digest,
+                        'date_time': list(info.date_time),
+                        'compress_type': info.compress_type,
+                        'crc': info.CRC,
+                        'compress_size': info.compress_size,
+                        'file_size': info.file_size,
+                        'flag_bits': info.flag_bits,
+                        'create_system': info.create_system,
+                        'external_attr': info.external_attr,
+                        'extra': info.extra.hex(),
+                    })
+
+            manifest = {
+                'version': self.FORMAT_VERSION,
+                'operation': operation,
+                'created': datetime.now().isoformat(),
+                'source': os.path.abspath(project_path),
+                'size': os.path.getsize(project_path),
+                'members': members,
+            }
+
+            manifest_path = self.root / (backup_name + self.MANIFEST_SUFFIX)
+            temp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.replace(temp_path, manifest_path)
+
+        return str(manifest_path)
+
+    def read_manifest(self, manifest_path: str) -> Dict[str, any]:
+        """
+        Read a backup manifest
+
+        Args:
+            manifest_path: Path of the manifest
+
+        Returns:
+            Dict: Manifest data
+
+        Raises:
+            ValueError: If the manifest is not a valid backup manifest
+        """
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        if not isinstance(manifest, dict) or 'members' not in manifest:
+            raise ValueError(f"Invalid backup manifest: {manifest_path}")
+        return manifest
+
+    def restore(self, manifest_path: str, restore_path: str):
+        """
+        Rebuild the archive described by a manifest
+
+        Member data is written back exactly as it was stored (no
+        recompression); the file is replaced atomically once complete.
+
+        Args:
+            manifest_path: Path of the manifest
+            restore_path: Path of the .tnp file to write
+
+        Raises:
+            ValueError: If the manifest or one of its objects is invalid
+        """
+        manifest = self.read_manifest(manifest_path)
+        temp_path = restore_path + '.tmp'
+
+        try:
+            with open(temp_path, 'wb') as raw:
+                with zipfile.ZipFile(raw, 'w') as zipf:
+                    for member in manifest['members']:
+                        info = zipfile.ZipInfo(member['name'], tuple(member['date_time']))
+                        info.compress_type = member['compress_type']
+                        info.CRC = member['crc']
+                        info.compress_size = member['compress_size']
+                        info.file_size = member['file_size']
+                        info.flag_bits = member['flag_bits']
+                        info.create_system = member['create_system']
+                        info.external_attr = member['external_attr']
+                        info.extra = bytes.fromhex(member['extra'])
+                        write_raw_member(zipf, info, self._get_object(member['hash']))
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(temp_path, restore_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def delete(self, manifest_path: str):
+        """
+        Delete a backup manifest (objects are reclaimed by collect_garbage)
+
+        Args:
+            manifest_path: Path of the manifest
+        """
+        os.remove(manifest_path)
+
+    def list_manifests(self) -> List[Path]:
+        """Get the paths of all backup manifests in the store"""
+        if not self.root.exists():
+            return []
+        return list(self.root.glob('*' + self.MANIFEST_SUFFIX))
+
+    def collect_garbage(self) -> int:
+        """
+        Delete objects no longer referenced by any manifest
+
+        Returns:
+            int: Number of objects deleted
+        """
+        with self._lock:
+            referenced: Set[str] = set()
+            for manifest_path in self.list_manifests():
+                try:
+                    manifest = self.read_manifest(str(manifest_path))
+                except (OSError, ValueError) as e:
+                    # Unreadable manifests keep nothing alive, but never
+                    # abort the collection over one of them
+                    AppLogger.warning(f"Skipping unreadable backup manifest {manifest_path}: {e}")
+                    continue
+                referenced.update(member['hash'] for member in manifest['members'])
+
+            deleted = 0
+            if not self.objects_dir.exists():
+                return deleted
+
+            for object_path in self.objects_dir.glob('*/*'):
+                if object_path.name not in referenced:
+                    try:
+                        object_path.unlink()
+                        deleted += 1
+                    except OSError as e:
+                        AppLogger.warning(f"Failed to delete backup object {object_path.name}: {e}")
+
+            if deleted:
+                AppLogger.debug(f"Reclaimed {deleted} unreferenced backup objects")
+            return deleted
+
+    def get_disk_usage(self) -> int:
+        """
+        Get the bytes used by manifests and objects
+
+        Returns:
+            int: Size in bytes
+        """
+        total = 0
+        for path in self.list_manifests():
+            total += path.stat().st_size
+        if self.objects_dir.exists():
+            for object_path in self.objects_dir.glob('*/*'):
+                total += object_path.stat().st_size
+        return total
@@ -55,13 +55,24 @@ class BaseExporter(ABC):
 
     def _get_chapters(self):
         """
-        Ottiene lista di tutti i capitoli con le loro scene
+        Ottiene lista di tutti i capitoli in ordine di lettura
 
         Returns:
-            List[Chapter]: Lista di capitoli dal manuscript structure
+            List[Chapter]: Lista di capitoli (di tutte le parti)
         """
-        manuscript_structure = self.project_manager.manuscript_structure_manager.structure
-        return manuscript_structure.chapters
+        return self.project_manager.manuscript_structure_manager.get_all_chapters()
+
+    def _get_scenes(self, chapter):
+        """
+        Ottiene le scene di un capitolo in ordine di lettura
+
+        Args:
+            chapter: Capitolo
+
+        Returns:
+            List[Scene]: Scene del capitolo
+        """
+        return self.project_manager.manuscript_structure_manager.get_scenes_in_chapter(chapter.id)
 
     def _get_chapter_count(self) -> int:
         """
@@ -79,8 +90,7 @@ class BaseExporter(ABC):
         Returns:
             int: Numero totale di parole
         """
-        manuscript_structure = self.project_manager.manuscript_structure_manager.structure
-        return manuscript_structure.get_total_word_count()
+        return self.project_manager.manuscript_structure_manager.get_total_word_count()
 
     def _get_option(self, key: str, default=None):
         """
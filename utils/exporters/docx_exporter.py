@@ -285,7 +285,7 @@ class DOCXExporter(BaseExporter):
             )
 
             # Scene del capitolo
-            for j, scene in enumerate(chapter.scenes, 1):
+            for j, scene in enumerate(self._get_scenes(chapter), 1):
                 # Titolo scena
                 scene_title = scene.title or f"Scene {j}"
                 scene_heading = doc.add_heading(scene_title, level=2)
@@ -307,7 +307,7 @@ class MarkdownExporter(BaseExporter):
             parts.append("")
 
             # Scene del capitolo
-            for j, scene in enumerate(chapter.scenes, 1):
+            for j, scene in enumerate(self._get_scenes(chapter), 1):
                 # Titolo scena (Heading 3)
                 scene_title = scene.title or f"Scene {j}"
                 parts.append(f"### {scene_title}")
@@ -387,7 +387,7 @@ class PDFExporter(BaseExporter):
             story.append(chapter_para)
 
             # Scene del capitolo
-            for j, scene in enumerate(chapter.scenes, 1):
+            for j, scene in enumerate(self._get_scenes(chapter), 1):
                 # Titolo scena
                 scene_title = scene.title or f"Scene {j}"
                 scene_para = Paragraph(scene_title, styles['SceneTitle'])
@@ -60,6 +60,8 @@ class SettingsManager:
             "preferred_ui_language": "it",  # UI language (separate from project language)
             "editor_zoom_level": 100,  # Editor zoom level (50-200%)
             "editor_font_size": 14,  # Font size for text editors (8-72pt)
+            "analysis_batch_size": 8,  # Scenes per nlp.pipe batch (manuscript analysis)
+            "analysis_processes": 0,  # Parsing processes (0 = one per CPU core)
             "toolbar_groups": {
                 "script": True,  # Superscript/Subscript
                 "smallcaps": True,  # Small Caps
@@ -459,3 +461,41 @@ class SettingsManager:
         # Clamp value between 8 and 72
         clamped_size = max(8, min(72, size))
         self.set("editor_font_size", clamped_size)
+
+    # ==================== Manuscript Analysis ====================
+
+    def get_analysis_batch_size(self) -> int:
+        """
+        Get the number of scenes per nlp.pipe batch
+
+        Returns:
+            int: Batch size (default 8)
+        """
+        return self.settings.get("analysis_batch_size", 8)
+
+    def set_analysis_batch_size(self, size: int):
+        """
+        Set the number of scenes per nlp.pipe batch
+
+        Args:
+            size: Batch size (at least 1)
+        """
+        self.set("analysis_batch_size", max(1, size))
+
+    def get_analysis_processes(self) -> int:
+        """
+        Get the number of parsing processes
+
+        Returns:
+            int: Number of processes (0 = one per CPU core)
+        """
+        return self.settings.get("analysis_processes", 0)
+
+    def set_analysis_processes(self, processes: int):
+        """
+        Set the number of parsing processes
+
+        Args:
+            processes: Number of processes (0 = one per CPU core)
+        """
+        self.set("analysis_processes", max(0, processes))
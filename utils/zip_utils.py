@@ -0,0 +1,139 @@
+"""
+ZIP utilities - Low level helpers for incremental .tnp archive writes
+
+Reading a member's compressed bytes only relies on the local file header
+layout, which is fixed by the ZIP format. Writing them back without
+recompressing has no public zipfile API: it updates ZipFile's bookkeeping
+(NameToInfo, start_dir, _didModify) directly. That is only done on the
+Python versions it was checked against, and only if those attributes
+exist; otherwise members are decompressed and written with writestr(),
+which is slower but produces the same archive content.
+"""
+import copy
+import io
+import struct
+import sys
+import zipfile
+import zlib
+
+# Local file header (PKWARE APPNOTE 4.3.7): signature, versions, flags,
+# method, time, date, CRC, sizes, filename and extra field lengths
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+_NAME_LENGTH_FIELD = 10
+_EXTRA_LENGTH_FIELD = 11
+
+# Newest Python whose ZipFile internals raw writes were checked against
+RAW_WRITE_MAX_VERSION = (3, 14)
+
+# ZipFile attributes updated by raw writes, besides the public filelist and fp
+RAW_WRITE_INTERNALS = ('NameToInfo', 'start_dir', '_didModify')
+
+
+def _check_raw_write_support() -> bool:
+    """Internal: Check that ZipFile has the internals raw writes update"""
+    if sys.version_info[:2] > RAW_WRITE_MAX_VERSION:
+        return False
+
+    with zipfile.ZipFile(io.BytesIO(), 'w') as probe:
+        return (all(hasattr(probe, name) for name in RAW_WRITE_INTERNALS)
+                and hasattr(zipfile.ZipInfo, 'FileHeader'))
+
+
+# False: write_raw_member falls back to decompressing and writestr()
+RAW_WRITE_SUPPORTED = _check_raw_write_support()
+
+
+def read_raw_member(source: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """
+    Read the compressed bytes of an archive member without decompressing them
+
+    Args:
+        source: Open ZipFile to read from
+        info: ZipInfo of the member (from source.infolist())
+
+    Returns:
+        bytes: The member data exactly as stored in the archive
+    """
+    fp = source.fp
+    fp.seek(info.header_offset)
+    header = fp.read(LOCAL_HEADER.size)
+    if len(header) != LOCAL_HEADER.size:
+        raise zipfile.BadZipFile(f"Truncated local header for {info.filename}")
+
+    fields = LOCAL_HEADER.unpack(header)
+    if fields[0] != LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local header magic for {info.filename}")
+
+    # Skip variable-length filename and extra field
+    fp.seek(fields[_NAME_LENGTH_FIELD] + fields[_EXTRA_LENGTH_FIELD], 1)
+    return fp.read(info.compress_size)
+
+
+def copy_raw_member(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """
+    Copy a member from one archive to another without recompressing it
+
+    The compressed payload is streamed as-is and a fresh local header is
+    written, so the cost is a plain byte copy regardless of how expensive
+    the original compression was (where RAW_WRITE_SUPPORTED; otherwise the
+    member is decompressed and compressed again).
+
+    Args:
+        source: Open ZipFile to copy from (mode 'r')
+        target: Open ZipFile to copy into (mode 'w' or 'a')
+        info: ZipInfo of the member in the source archive
+    """
+    if not RAW_WRITE_SUPPORTED:
+        target.writestr(_fresh_info(info), source.read(info))
+        return
+
+    write_raw_member(target, info, read_raw_member(source, info))
+
+
+def write_raw_member(target: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes):
+    """
+    Write already-compressed member data to an archive
+
+    Without RAW_WRITE_SUPPORTED the data is decompressed and written with
+    writestr(); only stored and deflated members can be written that way.
+
+    Args:
+        target: Open ZipFile to write into (mode 'w' or 'a')
+        info: ZipInfo describing the data (compression, CRC and sizes must match)
+        data: Compressed payload, as returned by read_raw_member
+
+    Raises:
+        NotImplementedError: If the fallback meets another compression method
+    """
+    new_info = _fresh_info(info)
+    if not RAW_WRITE_SUPPORTED:
+        target.writestr(new_info, _decompress(info, data))
+        return
+
+    new_info.header_offset = target.fp.tell()
+
+    target.fp.write(new_info.FileHeader())
+    target.fp.write(data)
+
+    target.filelist.append(new_info)
+    target.NameToInfo[new_info.filename] = new_info
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def _fresh_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Internal: Copy of a source ZipInfo to describe the member in another archive"""
+    new_info = copy.copy(info)
+    # Sizes and CRC are known up front, so no trailing data descriptor is needed
+    new_info.flag_bits &= ~0x08
+    return new_info
+
+
+def _decompress(info: zipfile.ZipInfo, data: bytes) -> bytes:
+    """Internal: Decompress the raw payload of a stored or deflated member"""
+    if info.compress_type == zipfile.ZIP_STORED:
+        return data
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        return zlib.decompress(data, -zlib.MAX_WBITS)
+    raise NotImplementedError(f"Cannot decompress {info.filename} (method {info.compress_type})")
@@ -2,5 +2,8 @@
 Worker threads module
 """
 from .thread_analysis import AnalysisThread
+from .manuscript_analysis_thread import ManuscriptAnalysisThread
+from .save_worker import SaveThread
+from .spell_check_worker import SpellCheckWorker, spell_check_worker
 
-__all__ = ['AnalysisThread']
\ No newline at end of file
+__all__ = ['AnalysisThread', 'ManuscriptAnalysisThread', 'SaveThread', 'SpellCheckWorker', 'spell_check_worker']
\ No newline at end of file
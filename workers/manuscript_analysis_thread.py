@@ -0,0 +1,59 @@
+"""
+Worker thread to analyse the whole manuscript in background
+"""
+from PySide6.QtCore import QThread, Signal
+
+from analysis.manuscript_analyzer import ManuscriptAnalyzer
+
+
+class ManuscriptAnalysisThread(QThread):
+    """
+    Thread running a ManuscriptAnalyzer without blocking the UI
+
+    Parsing itself is spread over the analyzer's worker processes; this
+    thread feeds them and merges the results. Call requestInterruption()
+    to stop it: the workers are terminated after the scene being merged
+    and the finished result has 'cancelled' set.
+    """
+
+    # Signal emitted after each scene: (scenes done, total scenes)
+    progress = Signal(int, int)
+
+    # Signal emitted when analysis is completed
+    finished = Signal(dict)
+
+    def __init__(self, scenes, analyzer: ManuscriptAnalyzer, project_type=None, analysis_cache=None):
+        """
+        Initialize the manuscript analysis thread
+
+        Args:
+            scenes: Scenes to analyse (ManuscriptAnalyzer.collect_scenes)
+            analyzer: ManuscriptAnalyzer to run
+            project_type: Optional ProjectType for context-aware analysis
+            analysis_cache: Optional AnalysisCache reused across runs
+        """
+        super().__init__()
+        self.scenes = scenes
+        self.analyzer = analyzer
+        self.project_type = project_type
+        self.analysis_cache = analysis_cache
+
+    def run(self):
+        """
+        Execute the analysis
+        This method is executed in a separate thread
+        """
+        try:
+            result = self.analyzer.analyze(
+                self.scenes, self.project_type, self.analysis_cache,
+                progress=self.progress.emit,
+                is_cancelled=self.isInterruptionRequested
+            )
+        except Exception as e:
+            result = {
+                'error': f"Error during analysis: {str(e)}",
+                'success': False
+            }
+
+        # Emit signal with results
+        self.finished.emit(result)
@@ -0,0 +1,43 @@
+"""
+Worker thread to write project archives in background
+"""
+from PySide6.QtCore import QThread, Signal
+
+from managers.project_saver import SaveSnapshot, write_snapshot
+
+
+class SaveThread(QThread):
+    """
+    Thread to write a project snapshot without blocking the UI
+
+    The snapshot is taken on the UI thread (ProjectManager.begin_save);
+    this thread only does the slow part: backup, serialization,
+    compression and the atomic file replacement. The receiver must call
+    ProjectManager.finish_save(snapshot) when save_finished is emitted.
+    """
+
+    # Signal emitted while writing (percent, message)
+    progress = Signal(int, str)
+
+    # Signal emitted when writing is over (success, error message)
+    save_finished = Signal(bool, str)
+
+    def __init__(self, snapshot: SaveSnapshot, auto_save: bool = False):
+        """
+        Initialize the save thread
+
+        Args:
+            snapshot: Snapshot returned by ProjectManager.begin_save()
+            auto_save: True if the save was triggered by the auto-save timer
+        """
+        super().__init__()
+        self.snapshot = snapshot
+        self.auto_save = auto_save
+
+    def run(self):
+        """
+        Write the snapshot
+        This method is executed in a separate thread
+        """
+        success = write_snapshot(self.snapshot, self.progress.emit)
+        self.save_finished.emit(success, self.snapshot.error or "")
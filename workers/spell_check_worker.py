@@ -0,0 +1,103 @@
+"""
+Worker thread to find misspelled words in background
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+from analysis.spelling_service import SpellingDictionary, find_misspelled_spans
+from utils.logger import AppLogger
+
+
+class SpellCheckRequest:
+    """
+    Blocks of one document to check, and the results once checked
+
+    The editor fills in the block texts on the GUI thread; the worker
+    adds the spans. revision and generation identify the state the texts
+    were taken from, so the editor can discard results that arrive after
+    the document, the language or the custom words changed.
+
+    Attributes:
+        revision: QTextDocument.revision() when the texts were taken
+        generation: Custom words generation when the texts were taken
+        dictionary: Dictionary to check against
+        blocks: (block number, block text) pairs
+        results: (block number, block text, [(start, length), ...]) triples
+    """
+
+    __slots__ = ('revision', 'generation', 'dictionary', 'blocks', 'results')
+
+    def __init__(self, revision: int, generation: int, dictionary: SpellingDictionary,
+                 blocks: List[Tuple[int, str]]):
+        self.revision = revision
+        self.generation = generation
+        self.dictionary = dictionary
+        self.blocks = blocks
+        self.results: List[Tuple[int, str, List[Tuple[int, int]]]] = []
+
+
+class SpellCheckWorker:
+    """
+    Process-wide background thread shared by all spell checking editors
+
+    Each editor submits at most one request at a time: a newer request
+    from the same editor replaces the one still waiting. When a request
+    is done the worker calls its callback (from the worker thread), which
+    is normally a Qt signal emit, so the editor receives the results on
+    the GUI thread through a queued connection.
+
+    The thread is a daemon and starts on the first submit.
+    """
+
+    def __init__(self):
+        """Initialize the worker (no thread yet)"""
+        self._condition = threading.Condition()
+        self._pending: 'OrderedDict[Any, Tuple[SpellCheckRequest, Callable]]' = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, owner: Any, request: SpellCheckRequest,
+               callback: Callable[[SpellCheckRequest], None]):
+        """
+        Queue a request, replacing the owner's request still waiting
+
+        Args:
+            owner: Key identifying the submitting editor
+            request: Blocks to check
+            callback: Called with the completed request (on the worker thread)
+        """
+        with self._condition:
+            self._pending.pop(owner, None)
+            self._pending[owner] = (request, callback)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="SpellCheckWorker", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self, owner: Any):
+        """Drop the owner's waiting request (e.g. the editor is going away)"""
+        with self._condition:
+            self._pending.pop(owner, None)
+
+    def _run(self):
+        """Internal: Process requests in submission order"""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                _, (request, callback) = self._pending.popitem(last=False)
+
+            try:
+                request.results = [
+                    (number, text, find_misspelled_spans(text, request.dictionary))
+                    for number, text in request.blocks
+                ]
+                callback(request)
+            except RuntimeError:
+                # The receiving editor was deleted meanwhile
+                pass
+            except Exception as e:
+                AppLogger.error(f"Spell check worker error: {e}", exc_info=True)
+
+
+# Global worker instance
+spell_check_worker = SpellCheckWorker()
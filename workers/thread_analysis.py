@@ -6,6 +6,7 @@ from PySide6.QtCore import QThread, Signal
 from analysis.grammar import GrammarAnalyzer
 from analysis.repetition import RepetitionAnalyzer
 from analysis.style import StyleAnalyzer
+from analysis.analysis_context import analysis_context
 
 
 class AnalysisThread(QThread):
@@ -21,24 +22,39 @@ class AnalysisThread(QThread):
     TYPE_REPETITIONS = "repetitions"
     TYPE_STYLE = "style"
 
-    def __init__(self, text, analysis_type, project_type=None):
+    def __init__(self, text, analysis_type, project_type=None,
+                 grammar_analyzer=None, repetitions_analyzer=None, style_analyzer=None,
+                 scenes=None, scene_id=None, analysis_cache=None):
         """
         Initialize the analysis thread
 
+        Repetitions and style analysis run on scenes when given: each scene
+        is analysed on its own (or taken from analysis_cache if unchanged)
+        and the results are merged into manuscript totals.
+
         Args:
             text: Text to analyze
             analysis_type: Type of analysis (grammar, repetitions, style)
             project_type: Optional ProjectType for context-aware analysis
+            grammar_analyzer: Optional long-lived GrammarAnalyzer to reuse
+            repetitions_analyzer: Optional long-lived RepetitionAnalyzer to reuse
+            style_analyzer: Optional long-lived StyleAnalyzer to reuse
+            scenes: Optional (scene id, content hash, plain text) of each scene
+            scene_id: Optional ID of the scene text belongs to (grammar cache key)
+            analysis_cache: Optional AnalysisCache reused across runs
         """
         super().__init__()
         self.text = text
         self.analysis_type = analysis_type
         self.project_type = project_type
+        self.scenes = scenes
+        self.scene_id = scene_id
+        self.analysis_cache = analysis_cache
 
-        # Initialize analyzers (lazy loading)
-        self._grammar_analyzer = None
-        self._repetitions_analyzer = None
-        self._style_analyzer = None
+        # Analyzers passed in are reused across runs; missing ones are created lazily
+        self._grammar_analyzer = grammar_analyzer
+        self._repetitions_analyzer = repetitions_analyzer
+        self._style_analyzer = style_analyzer
 
     def run(self):
         """
@@ -72,19 +88,137 @@ class AnalysisThread(QThread):
         """Execute grammar analysis"""
         if self._grammar_analyzer is None:
             self._grammar_analyzer = GrammarAnalyzer()
+        analyzer = self._grammar_analyzer
+
+        if self.analysis_cache is None or self.scene_id is None:
+            return analyzer.analyze(self.text)
+
+        # Unchanged scene: previous result (only successful results are cached)
+        content_hash = analyzer.get_cache_hash(self.text)
+        analysed = []
+
+        def analyze(text):
+            # Keeps a failed result too, returned instead of analysing again
+            analysed.append(analyzer.analyze(text))
+            return self._successful(analysed[-1])
 
-        return self._grammar_analyzer.analyze(self.text)
+        results, _ = self.analysis_cache.analyze_scenes(
+            [(self.scene_id, content_hash, self.text)], self.TYPE_GRAMMAR,
+            analyzer.language, analyzer.ANALYZER_VERSION, analyze
+        )
+        return results[0] if results else analysed[0]
 
     def _execute_repetitions_analysis(self):
         """Execute repetitions analysis"""
-        if self._repetitions_analyzer is None:
-            self._repetitions_analyzer = RepetitionAnalyzer()
+        self._create_scene_analyzers()
+        analyzer = self._repetitions_analyzer
 
-        return self._repetitions_analyzer.analyze(self.text)
+        if self.scenes is None:
+            return analyzer.analyze(self.text)
+
+        return self._merge_scene_results(self.TYPE_REPETITIONS, analyzer.merge_partials)
 
     def _execute_style_analysis(self):
         """Execute style analysis"""
+        self._create_scene_analyzers()
+        analyzer = self._style_analyzer
+
+        if self.scenes is None:
+            return analyzer.analyze(self.text, self.project_type)
+
+        return self._merge_scene_results(
+            self.TYPE_STYLE,
+            lambda partials: analyzer.merge_partials(partials, self.project_type)
+        )
+
+    def _create_scene_analyzers(self):
+        """Internal: Create the repetitions and style analyzers not passed in"""
+        if self._repetitions_analyzer is None:
+            self._repetitions_analyzer = RepetitionAnalyzer()
         if self._style_analyzer is None:
             self._style_analyzer = StyleAnalyzer()
 
-        return self._style_analyzer.analyze(self.text, self.project_type)
\ No newline at end of file
+    def _merge_scene_results(self, analysis_type, merge):
+        """
+        Analyse the scenes not cached and merge all partial results
+
+        Args:
+            analysis_type: Analysis type (TYPE_REPETITIONS or TYPE_STYLE)
+            merge: Callable merging the partial results
+
+        Returns:
+            dict: Merged result, with 'scene_count' and 'analysed_scenes'
+        """
+        partials, analysed = self._scene_partials(analysis_type)
+        language = self._scene_analyzers()[analysis_type].language
+
+        if self.scenes and not partials:
+            return {
+                'error': f'spaCy model not available for language: {language}',
+                'success': False
+            }
+
+        result = merge(partials)
+        result['scene_count'] = len(self.scenes)
+        result['analysed_scenes'] = analysed
+        return result
+
+    def _scene_analyzers(self):
+        """Internal: Analyzer of each scene analysis type"""
+        return {self.TYPE_REPETITIONS: self._repetitions_analyzer, self.TYPE_STYLE: self._style_analyzer}
+
+    def _scene_partials(self, analysis_type):
+        """
+        Get the partial result of every scene, parsing only the scenes not cached
+
+        A parsed scene gives the partials of both repetitions and style
+        analysis, and both are cached: running the other analysis next
+        parses nothing (the Doc cache of analysis_context only holds a
+        few scenes, so it cannot be relied on for that).
+
+        Args:
+            analysis_type: Analysis type (TYPE_REPETITIONS or TYPE_STYLE)
+
+        Returns:
+            Tuple[List[dict], int]: (partials in scene order, scenes parsed)
+        """
+        language = self._scene_analyzers()[analysis_type].language
+        # One Doc serves both analyzers only when they share the language
+        analyzers = {name: analyzer for name, analyzer in self._scene_analyzers().items()
+                     if analyzer.language == language}
+        from_doc = {
+            self.TYPE_REPETITIONS: lambda doc, text: self._repetitions_analyzer.partial_from_doc(doc),
+            self.TYPE_STYLE: self._style_analyzer.partial_from_doc,
+        }
+
+        partials = []
+        analysed = 0
+        for scene_id, content_hash, text in self.scenes:
+            cached = {}
+            if self.analysis_cache is not None:
+                cached = {name: self.analysis_cache.get(scene_id, content_hash, name, language,
+                                                        analyzer.ANALYZER_VERSION)
+                          for name, analyzer in analyzers.items()}
+
+            partial = cached.get(analysis_type)
+            if partial is None:
+                analysed += 1
+                doc = analysis_context.get_doc(text, language)
+                if doc is None:
+                    continue
+                for name, analyzer in analyzers.items():
+                    if cached.get(name) is not None:
+                        continue
+                    result = from_doc[name](doc, text)
+                    if name == analysis_type:
+                        partial = result
+                    if self.analysis_cache is not None:
+                        self.analysis_cache.put(scene_id, content_hash, name, language,
+                                                analyzer.ANALYZER_VERSION, result)
+            partials.append(partial)
+        return partials, analysed
+
+    @staticmethod
+    def _successful(result):
+        """Internal: Result if the analysis succeeded, None otherwise"""
+        return result if result.get('success') else None
\ No newline at end of file